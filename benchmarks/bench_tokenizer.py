@@ -0,0 +1,70 @@
+"""Compare the single-pass scanner with per-entry tokenizing.
+
+Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_tokenizer.py [fields]
+
+Both paths tokenize a generated copybook of alternating COMP-3 and
+alphanumeric fields; the best of several runs is reported.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Callable
+
+from cobol_data_structure import CobolParser
+
+
+def generate_copybook(fields: int) -> str:
+    """A single record with ``fields`` elementary items."""
+    lines = ["       01 LARGE-RECORD."]
+    for i in range(fields):
+        if i % 2:
+            lines.append(f"           03 AMOUNT-{i:05d} PIC S9(7)V99 COMP-3.")
+        else:
+            lines.append(f"           03 NAME-{i:05d} PIC X(10) VALUE 'ABC'.")
+    return "\n".join(lines)
+
+
+def best_of(function: Callable[[], object], runs: int = 7) -> float:
+    """Shortest wall time of ``runs`` calls, in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(fields: int = 10000) -> None:
+    source = generate_copybook(fields)
+    parser = CobolParser()
+    lines = parser.data_lines(source)
+
+    def per_entry() -> None:
+        for line_number, text in parser._join_entries(lines):
+            parser.tokenizer.tokenize(text, line_number=line_number)
+
+    def single_pass() -> None:
+        parser.tokenizer.scan(lines)
+
+    def parse_entries() -> None:
+        entries_parser = CobolParser()
+        tokens = []
+        for line_number, text in entries_parser.entries(entries_parser.data_lines(source)):
+            token = entries_parser.tokenizer.tokenize(text, line_number=line_number)
+            if token:
+                tokens.append((line_number, token))
+        entries_parser._build_records(tokens)
+
+    print(f"{fields} fields")
+    print(f"  tokenize, per entry:   {best_of(per_entry):8.1f} ms")
+    print(f"  tokenize, single pass: {best_of(single_pass):8.1f} ms")
+    print(f"  parse (entries path):  {best_of(parse_entries):8.1f} ms")
+    print(f"  parse:                 {best_of(lambda: CobolParser().parse(source)):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -3,6 +3,52 @@
 A Python library for handling COBOL data structures.
 """
 
+from cobol_data_structure.accessors import FieldAccessor
+from cobol_data_structure.binary_parser import BinaryDataParser, ParsedValue
+from cobol_data_structure.codegen import GeneratedDecoder, compile_decoder
+from cobol_data_structure.layout import LayoutPlan, compile_layout
+from cobol_data_structure.models import (
+    CobolField,
+    CobolRecord,
+    ParserWarning,
+    PictureCategory,
+    UsageType,
+    WarningSeverity,
+)
+from cobol_data_structure.names import AmbiguousReferenceError, FieldIndex
+from cobol_data_structure.offsets import OffsetCalculator
+from cobol_data_structure.parser import CobolParser
+from cobol_data_structure.picture import PictureClauseParser, PictureInfo
+from cobol_data_structure.readers import FixedRecordReader, VariableRecordReader
+from cobol_data_structure.tokenizer import LineTokenizer, TokenInfo
+from cobol_data_structure.view import RecordView
+
 __version__ = "0.1.0"
 
-__all__ = ["__version__"]
+__all__ = [
+    "__version__",
+    "AmbiguousReferenceError",
+    "BinaryDataParser",
+    "CobolField",
+    "CobolParser",
+    "CobolRecord",
+    "FieldAccessor",
+    "FieldIndex",
+    "FixedRecordReader",
+    "GeneratedDecoder",
+    "LayoutPlan",
+    "LineTokenizer",
+    "OffsetCalculator",
+    "ParsedValue",
+    "ParserWarning",
+    "PictureCategory",
+    "PictureClauseParser",
+    "PictureInfo",
+    "RecordView",
+    "TokenInfo",
+    "UsageType",
+    "VariableRecordReader",
+    "WarningSeverity",
+    "compile_decoder",
+    "compile_layout",
+]
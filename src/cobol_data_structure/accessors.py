@@ -0,0 +1,286 @@
+"""Precompiled accessors for single fields of a record layout.
+
+A :class:`FieldAccessor` is a field reference resolved once: its offset,
+length, codec and the strides of the tables it sits in are fixed when it is
+built, so reading the field from a record buffer is one slice and one
+decoder call:
+
+    >>> code = record.accessor("TYPE.CODE")
+    >>> sales = record.accessor("MONTH-DATA(3).SALES")
+    >>> code(data), sales(data)
+    (12345, 45.67)
+
+References are resolved through the record's
+:class:`~cobol_data_structure.names.FieldIndex`, so they may be dotted paths
+or ``OF``/``IN`` chains. Subscripts are given outermost table first, either
+on the names they belong to (``MONTH-DATA(3).SALES``) or trailing, as in
+COBOL (``SALES OF MONTH-DATA (3)``). Subscripts left out are passed on each
+call instead:
+
+    >>> sales = record.accessor("MONTH-DATA.SALES")
+    >>> [sales(data, i) for i in range(1, 4)]
+
+In records with OCCURS DEPENDING ON tables, accessors of fields whose
+position depends on the counts read the counters on each call and apply the
+compiled shifts of the layout (see :mod:`cobol_data_structure.odo`).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from cobol_data_structure.binary_parser import ParsedValue
+from cobol_data_structure.layout import (
+    CODEC_ALPHANUMERIC,
+    DECODERS,
+    CodecParams,
+    LayoutPlan,
+    compile_layout,
+    field_codec,
+)
+from cobol_data_structure.models import CobolField, CobolRecord
+
+_SUBSCRIPT_PATTERN = re.compile(r"\(([^)]*)\)")
+
+# Variable plan, variable tables stored before the field, and (stride,
+# count, variable table or -1) of every enclosing table
+_Variable = tuple[LayoutPlan, tuple[int, ...], tuple[tuple[int, int, int], ...]]
+
+
+class FieldAccessor:
+    """Callable that decodes one field from record bytes.
+
+    Group items are decoded as alphanumeric text, as COBOL treats them.
+
+    Attributes:
+        reference: The reference the accessor was built from
+        field: The field it decodes
+        offset: Byte offset of the field, with the fixed subscripts applied
+        length: Byte length of one occurrence
+        codec: Codec id (see :data:`~cobol_data_structure.layout.DECODERS`)
+        params: Decoder parameters
+        strides: Bytes between occurrences of each table still to be
+            subscripted on call, outermost first
+        counts: Occurrences of each of those tables, at most
+    """
+
+    __slots__ = (
+        "reference",
+        "field",
+        "offset",
+        "length",
+        "codec",
+        "params",
+        "strides",
+        "counts",
+        "_decode",
+        "_plan",
+        "_anchor",
+        "_dimensions",
+        "_fixed",
+    )
+
+    def __init__(
+        self,
+        reference: str,
+        field: CobolField,
+        offset: int,
+        codec: int,
+        params: CodecParams,
+        strides: tuple[int, ...] = (),
+        counts: tuple[int, ...] = (),
+        variable: _Variable | None = None,
+        fixed: tuple[int, ...] = (),
+    ) -> None:
+        self.reference = reference
+        self.field = field
+        self.offset = offset
+        self.length = field.item_length()
+        self.codec = codec
+        self.params = params
+        self.strides = strides
+        self.counts = counts
+        self._decode = DECODERS[codec]
+        # Only for fields moved by OCCURS DEPENDING ON counts
+        self._plan: LayoutPlan | None = None
+        self._anchor: tuple[int, ...] = ()
+        self._dimensions: tuple[tuple[int, int, int], ...] = ()
+        if variable is not None:
+            self._plan, self._anchor, self._dimensions = variable
+        self._fixed = fixed
+
+    def __call__(self, data: Any, *subscripts: int) -> ParsedValue:
+        """Decode the field from a record buffer.
+
+        Args:
+            data: Record bytes (``bytes``, ``bytearray`` or ``memoryview``);
+                not length-checked
+            *subscripts: 1-based subscripts of the tables left open, one
+                per entry of :attr:`strides`
+
+        Returns:
+            The value, or None if its bytes are invalid for the format
+
+        Raises:
+            IndexError: If the subscripts do not match the open tables, or
+                name an occurrence beyond an OCCURS DEPENDING ON count
+            ValueError: If an OCCURS DEPENDING ON counter is invalid
+        """
+        if self._plan is not None:
+            start = self._variable_offset(self._plan, data, subscripts)
+        else:
+            start = self.offset
+            if subscripts or self.strides:
+                start += self.displacement(subscripts)
+        try:
+            return self._decode(data[start : start + self.length], *self.params)
+        except ValueError:
+            return None
+
+    def displacement(self, subscripts: tuple[int, ...]) -> int:
+        """Bytes from :attr:`offset` to the occurrence named by ``subscripts``.
+
+        Raises:
+            IndexError: If there are too many or too few subscripts, or one
+                is out of range
+        """
+        if len(subscripts) != len(self.strides):
+            raise IndexError(
+                f"{self.reference} needs {len(self.strides)} subscripts, got {len(subscripts)}"
+            )
+        displacement = 0
+        for subscript, stride, count in zip(subscripts, self.strides, self.counts):
+            if not 1 <= subscript <= count:
+                raise IndexError(f"Subscript {subscript} out of range 1-{count}")
+            displacement += (subscript - 1) * stride
+        return displacement
+
+    def _variable_offset(self, plan: LayoutPlan, data: Any, subscripts: tuple[int, ...]) -> int:
+        """Offset of the field in a record, given that record's counts."""
+        if len(subscripts) != len(self.strides):
+            raise IndexError(
+                f"{self.reference} needs {len(self.strides)} subscripts, got {len(subscripts)}"
+            )
+        layout = plan.variable
+        assert layout is not None
+        counts = plan.counts(data)
+        terms = layout.terms(counts)
+        offset = self.field.byte_offset
+        for table in self._anchor:
+            offset -= terms[2 * table]
+        for subscript, (stride, count, table) in zip(self._fixed + subscripts, self._dimensions):
+            if table >= 0:
+                stride = layout.item_length(table, terms)
+                dependency = layout.tables[table].dependency
+                if dependency >= 0:
+                    count = counts[dependency]
+            if not 1 <= subscript <= count:
+                raise IndexError(f"Subscript {subscript} out of range 1-{count}")
+            offset += (subscript - 1) * stride
+        return offset
+
+    def __repr__(self) -> str:
+        return f"FieldAccessor({self.reference!r}, offset={self.offset}, length={self.length})"
+
+
+def split_subscripts(reference: str) -> tuple[str, tuple[int, ...]]:
+    """Separate the subscripts from a field reference.
+
+    Examples:
+        >>> split_subscripts("MONTH-DATA(3).SALES")
+        ('MONTH-DATA.SALES', (3,))
+        >>> split_subscripts("RATE OF DAY OF MONTH (2, 7)")
+        ('RATE OF DAY OF MONTH ', (2, 7))
+
+    Raises:
+        ValueError: If a subscript is not an integer
+    """
+    subscripts: list[int] = []
+    for group in _SUBSCRIPT_PATTERN.findall(reference):
+        try:
+            subscripts.extend(int(part) for part in group.replace(",", " ").split())
+        except ValueError:
+            raise ValueError(f"Subscripts must be integers: {reference}") from None
+    return _SUBSCRIPT_PATTERN.sub("", reference), tuple(subscripts)
+
+
+def compile_accessor(
+    record: CobolRecord, reference: str, plan: LayoutPlan | None = None
+) -> FieldAccessor:
+    """Resolve a field reference of a record into a :class:`FieldAccessor`.
+
+    Prefer :meth:`CobolRecord.accessor`, which caches the result.
+
+    Args:
+        record: Parsed record layout
+        reference: Dotted path or ``OF``/``IN`` chain, with any subscripts
+        plan: Compiled layout of the record; compiled here if the record
+            has OCCURS DEPENDING ON tables and none is given
+
+    Returns:
+        The accessor
+
+    Raises:
+        KeyError: If no field matches
+        AmbiguousReferenceError: If several fields match
+        IndexError: If there are more subscripts than enclosing tables, or
+            one is out of range
+        ValueError: If the field is a group holding OCCURS DEPENDING ON
+            tables, whose length varies
+    """
+    name, subscripts = split_subscripts(reference)
+    target = record.field_index.resolve(name)
+
+    tables: list[CobolField] = []
+    ancestor: CobolField | None = target
+    while ancestor is not None:
+        if ancestor.occurs or ancestor.occurs_max:
+            tables.append(ancestor)
+        ancestor = ancestor.parent
+    tables.reverse()
+    if len(subscripts) > len(tables):
+        raise IndexError(f"{reference} has {len(subscripts)} subscripts for {len(tables)} tables")
+
+    offset = target.byte_offset
+    for subscript, table in zip(subscripts, tables):
+        count = table.occurrence_count()
+        if not 1 <= subscript <= count:
+            raise IndexError(f"Subscript {subscript} of {table.name} out of range 1-{count}")
+        offset += (subscript - 1) * table.item_length()
+    open_tables = tables[len(subscripts) :]
+
+    if target.is_group():
+        codec, params = CODEC_ALPHANUMERIC, (target.encoding,)
+    else:
+        codec, params = field_codec(target)
+
+    variable: _Variable | None = None
+    if plan is None and any(item.occurs_depending_on for item in record.iter_fields()):
+        plan = compile_layout(record)
+    if plan is not None and plan.variable is not None:
+        layout = plan.variable
+        anchor = layout.anchors.get(target.get_field_path(), ())
+        dimensions = tuple(
+            (
+                table.item_length(),
+                table.occurrence_count(),
+                layout.table_ids.get(table.get_field_path(), -1),
+            )
+            for table in tables
+        )
+        if anchor or any(dimension[2] >= 0 for dimension in dimensions):
+            if any(item.occurs_depending_on for item in target.walk() if item is not target):
+                raise ValueError(f"{reference} holds OCCURS DEPENDING ON tables")
+            variable = (plan, anchor, dimensions)
+    return FieldAccessor(
+        reference,
+        target,
+        offset,
+        codec,
+        params,
+        strides=tuple(table.item_length() for table in open_tables),
+        counts=tuple(table.occurrence_count() for table in open_tables),
+        variable=variable,
+        fixed=subscripts,
+    )
@@ -0,0 +1,233 @@
+"""Parse record bytes into Python values by walking a :class:`CobolRecord`."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Union
+
+from cobol_data_structure import decoders, zoned
+from cobol_data_structure.models import (
+    BINARY_USAGES,
+    PACKED_USAGES,
+    CobolField,
+    CobolRecord,
+    ParserWarning,
+    PictureCategory,
+    UsageType,
+    WarningSeverity,
+)
+
+if TYPE_CHECKING:
+    from cobol_data_structure.layout import LayoutPlan
+
+# Type alias for parsed values
+ParsedValue = Union[None, str, int, float, dict[str, "ParsedValue"], list["ParsedValue"]]
+
+_SUBSCRIPTS = re.compile(r"\([^)]*\)")
+
+
+class BinaryDataParser:
+    """Parse binary data into Python objects based on COBOL structure."""
+
+    def __init__(self) -> None:
+        self.warnings: list[ParserWarning] = []
+        # Per (record id, fields): the record, its selected plan and field paths
+        self._selections: dict[
+            tuple[int, tuple[str, ...]], tuple[CobolRecord, LayoutPlan, tuple[str, ...]]
+        ] = {}
+
+    def parse(
+        self, record: CobolRecord, data: bytes, fields: Sequence[str] | None = None
+    ) -> dict[str, ParsedValue]:
+        """Parse binary data according to record structure.
+
+        Args:
+            record: CobolRecord structure definition
+            data: Binary data to parse
+            fields: Only parse these fields, given as data names, qualified
+                names or dotted paths without subscripts; the groups
+                holding them keep just the selected children. Every field
+                when None.
+
+        Returns:
+            Dictionary with parsed field values; fields that cannot be
+            decoded are set to None and reported in :attr:`warnings`
+
+        Raises:
+            ValueError: If data is shorter than the record length, or an
+                OCCURS DEPENDING ON counter of a selection is invalid
+            KeyError: If one of ``fields`` names no field
+            AmbiguousReferenceError: If one of ``fields`` names several
+        """
+        if fields is not None:
+            return self._parse_selected(record, data, tuple(fields))
+        if len(data) < record.total_length:
+            raise ValueError(f"Data length {len(data)} is less than expected {record.total_length}")
+
+        result: dict[str, ParsedValue] = {}
+        for field in record.fields:
+            result[field.name] = self.parse_field(field, data)
+        return result
+
+    def _parse_selected(
+        self, record: CobolRecord, data: bytes, fields: tuple[str, ...]
+    ) -> dict[str, ParsedValue]:
+        """Parse some fields through a compiled plan pruned to them.
+
+        The plan places the fields at the offsets the record's OCCURS
+        DEPENDING ON counts give; counters that were not asked for are left
+        out of the result.
+        """
+        key = (id(record), fields)
+        selection = self._selections.get(key)
+        if selection is None or selection[0] is not record:
+            from cobol_data_structure.layout import compile_layout
+
+            paths = tuple(record.field_index.resolve(field).get_field_path() for field in fields)
+            selection = self._selections[key] = (record, compile_layout(record, paths), paths)
+        _, plan, paths = selection
+
+        plan = plan.resolve(data)
+        result: dict[str, ParsedValue] = {}
+        for path, offset, value in zip(plan.paths, plan.offsets, plan.decode_values(data)):
+            name = _SUBSCRIPTS.sub("", path)
+            if not any(name == selected or name.startswith(f"{selected}.") for selected in paths):
+                continue
+            if value is None:
+                self.warnings.append(
+                    ParserWarning(
+                        severity=WarningSeverity.ERROR,
+                        message=f"Failed to parse field {path} at offset {offset}",
+                        field_name=name.rpartition(".")[2],
+                    )
+                )
+            _nest(result, path, value)
+        return result
+
+    def parse_field(self, field: CobolField, data: bytes, offset: int = 0) -> ParsedValue:
+        """Parse a single field from binary data.
+
+        Args:
+            field: Field definition
+            data: Complete record data
+            offset: Extra displacement of the enclosing occurrence, if the
+                field sits inside an OCCURS table
+
+        Returns:
+            Parsed value (type depends on field type)
+        """
+        if field.occurs_depending_on:
+            self.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.WARNING,
+                    message=f"OCCURS DEPENDING ON not resolved for {field.name}; "
+                    f"decoding maximum {field.occurrence_count()} occurrences",
+                    field_name=field.name,
+                )
+            )
+        if field.occurs or field.occurs_max:
+            item_length = field.item_length()
+            return [
+                self._parse_occurrence(field, data, offset + i * item_length)
+                for i in range(field.occurrence_count())
+            ]
+        return self._parse_occurrence(field, data, offset)
+
+    def _parse_occurrence(self, field: CobolField, data: bytes, offset: int) -> ParsedValue:
+        """Parse one occurrence of a field displaced by ``offset`` bytes."""
+        if field.is_group():
+            return {child.name: self.parse_field(child, data, offset) for child in field.children}
+
+        start = field.byte_offset + offset
+        field_data = data[start : start + field.item_length()]
+        try:
+            return self._parse_elementary(field, field_data)
+        except ValueError as e:
+            self.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.ERROR,
+                    message=f"Failed to parse field {field.name} at offset {start}: {e}",
+                    field_name=field.name,
+                )
+            )
+            return None
+
+    def _parse_elementary(self, field: CobolField, field_data: bytes) -> ParsedValue:
+        """Parse the bytes of an elementary (non-group) field.
+
+        Args:
+            field: Elementary field definition
+            field_data: Bytes of one occurrence of the field
+
+        Returns:
+            Parsed value
+
+        Raises:
+            ValueError: If field cannot be parsed
+        """
+        if field.picture_category in (
+            PictureCategory.ALPHANUMERIC,
+            PictureCategory.ALPHABETIC,
+            PictureCategory.NUMERIC_EDITED,
+        ):
+            return decoders.decode_alphanumeric(field_data, field.encoding)
+
+        elif field.picture_category == PictureCategory.NATIONAL:
+            return decoders.decode_national(field_data)
+
+        elif field.picture_category == PictureCategory.NUMERIC:
+            if field.usage == UsageType.DISPLAY:
+                convention = zoned.overpunch_convention(field)
+                if convention is not None:
+                    return zoned.decode_overpunch(
+                        field_data,
+                        convention,
+                        field.is_signed,
+                        field.decimal_places,
+                        field.sign_leading,
+                    )
+                return decoders.decode_zoned(field_data, field.is_signed, field.decimal_places)
+            elif field.usage in PACKED_USAGES:
+                return decoders.decode_packed(field_data, field.decimal_places)
+            elif field.usage in BINARY_USAGES:
+                return decoders.decode_binary(field_data, field.is_signed, field.decimal_places)
+            elif field.usage in (UsageType.COMP1, UsageType.COMP2):
+                return decoders.decode_float(field_data)
+            else:
+                raise ValueError(f"Unsupported numeric usage: {field.usage}")
+
+        self.warnings.append(
+            ParserWarning(
+                severity=WarningSeverity.WARNING,
+                message=f"Unsupported picture category: {field.picture_category}",
+                field_name=field.name,
+            )
+        )
+        return decoders.decode_raw(field_data)
+
+
+def _nest(result: dict[str, ParsedValue], path: str, value: ParsedValue) -> None:
+    """Store a value under its plan path in nested groups and occurrence lists."""
+    node = result
+    *groups, leaf = path.split(".")
+    for part in groups:
+        name, _, subscript = part.partition("(")
+        if subscript:
+            items = node.setdefault(name, [])
+            assert isinstance(items, list)
+            index = int(subscript[:-1])
+            while len(items) < index:
+                items.append({})
+            child = items[index - 1]
+        else:
+            child = node.setdefault(name, {})
+        assert isinstance(child, dict)
+        node = child
+    name, _, subscript = leaf.partition("(")
+    if subscript:
+        items = node.setdefault(name, [])
+        assert isinstance(items, list)
+        items.append(value)
+    else:
+        node[name] = value
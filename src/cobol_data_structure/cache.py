@@ -0,0 +1,282 @@
+"""On-disk cache of parsed records and their compiled layouts.
+
+Parsing the same copybooks at every process start dominates short jobs.
+:class:`ParseCache` stores the result of :meth:`CobolParser.parse` (records,
+compiled :class:`~cobol_data_structure.layout.LayoutPlan` objects and parser
+warnings) in a cache directory, one file per source:
+
+    >>> cache = ParseCache(".cobol-cache")
+    >>> records = cache.parse_file("copybooks/LASTDATA.cpy")
+    >>> plan = cache.plans_for_file("copybooks/LASTDATA.cpy")[0]
+
+Entries are keyed by a SHA-256 digest of the source text, the parser
+options that affect the result and the package version, so an edited source
+or an upgraded package never reuses a stale entry. Each file holds a digest
+of its payload and is discarded if it does not match.
+
+Entries are pickled: only point the cache at directories that untrusted
+users cannot write to.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import cobol_data_structure
+from cobol_data_structure.layout import LayoutPlan, compile_layout
+from cobol_data_structure.models import CobolRecord, ParserWarning
+from cobol_data_structure.parser import CobolParser
+
+#: Bumped whenever the entry file layout changes.
+CACHE_FORMAT = 2
+
+_MAGIC = b"CDSC"
+_SUFFIX = ".cdsc"
+_HEADER_LENGTH = len(_MAGIC) + 1 + 32
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """Everything one parse produced.
+
+    Attributes:
+        key: Cache key the entry was stored under
+        records: Parsed records
+        plans: Compiled layout of each record, in the same order
+        warnings: Warnings the parser reported while parsing the source
+    """
+
+    key: str
+    records: list[CobolRecord]
+    plans: list[LayoutPlan]
+    warnings: list[ParserWarning]
+
+
+class ParseCache:
+    """Directory of cached parse results with size and age limits.
+
+    Args:
+        directory: Cache directory; created on first store
+        max_bytes: Entries are evicted, least recently used first, once
+            their total size exceeds this
+        max_age: Entries unused for more seconds than this are discarded;
+            no age limit when None
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float | None = 30 * 24 * 3600,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source: str, parser: CobolParser) -> str:
+        """Cache key of a source parsed with a given parser's options."""
+        digest = hashlib.sha256()
+        options = (
+            cobol_data_structure.__version__,
+            CACHE_FORMAT,
+            type(parser).__qualname__,
+            parser.encoding,
+            parser.max_depth,
+        )
+        digest.update(repr(options).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def entry(self, source: str, parser: CobolParser | None = None) -> CacheEntry:
+        """Load the entry for a source, parsing and storing it on a miss.
+
+        On a hit, the cached warnings are appended to ``parser.warnings``
+        just as parsing would have done.
+
+        Args:
+            source: COBOL source (program or copybook)
+            parser: Parser whose options (and warnings list) to use; a
+                default :class:`CobolParser` when None
+
+        Returns:
+            The cached or freshly parsed entry
+        """
+        parser = parser if parser is not None else CobolParser()
+        key = self.key(source, parser)
+        entry = self.load(key)
+        if entry is not None:
+            self.hits += 1
+            parser.warnings.extend(entry.warnings)
+            return entry
+        self.misses += 1
+        start = len(parser.warnings)
+        records = parser.parse(source)
+        entry = CacheEntry(
+            key=key,
+            records=records,
+            plans=[compile_layout(record) for record in records],
+            warnings=list(parser.warnings[start:]),
+        )
+        self.store(entry)
+        return entry
+
+    def parse(self, source: str, parser: CobolParser | None = None) -> list[CobolRecord]:
+        """Cached equivalent of :meth:`CobolParser.parse`."""
+        return self.entry(source, parser).records
+
+    def plans(self, source: str, parser: CobolParser | None = None) -> list[LayoutPlan]:
+        """Compiled layouts of the records of a source."""
+        return self.entry(source, parser).plans
+
+    def entry_for_file(
+        self,
+        path: str | Path,
+        parser: CobolParser | None = None,
+        encoding: str = "utf-8",
+    ) -> CacheEntry:
+        """Cached entry of a source file; see :meth:`entry`.
+
+        Warnings added to ``parser.warnings`` get ``source_file`` set to
+        ``path``, as with :meth:`CobolParser.parse_file`.
+        """
+        parser = parser if parser is not None else CobolParser()
+        source_path = Path(path)
+        with source_path.open(encoding=encoding, newline=None) as handle:
+            source = handle.read()
+        start = len(parser.warnings)
+        entry = self.entry(source, parser)
+        for warning in parser.warnings[start:]:
+            warning.source_file = source_path
+        return entry
+
+    def parse_file(
+        self,
+        path: str | Path,
+        parser: CobolParser | None = None,
+        encoding: str = "utf-8",
+    ) -> list[CobolRecord]:
+        """Cached equivalent of :meth:`CobolParser.parse_file`."""
+        return self.entry_for_file(path, parser, encoding).records
+
+    def plans_for_file(
+        self,
+        path: str | Path,
+        parser: CobolParser | None = None,
+        encoding: str = "utf-8",
+    ) -> list[LayoutPlan]:
+        """Compiled layouts of the records of a source file."""
+        return self.entry_for_file(path, parser, encoding).plans
+
+    def load(self, key: str) -> CacheEntry | None:
+        """Read a valid, unexpired entry, or return None.
+
+        Entries that are expired, truncated, corrupted or written by another
+        cache format are deleted.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                status = os.fstat(handle.fileno())
+                data = handle.read()
+        except FileNotFoundError:
+            return None
+        entry = None
+        if self.max_age is None or time.time() - status.st_mtime <= self.max_age:
+            entry = _decode_entry(data, key)
+        if entry is None:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        return entry
+
+    def store(self, entry: CacheEntry) -> Path:
+        """Write an entry atomically, then evict entries over the limits."""
+        path = self._path(entry.key)
+        _write_atomic(path, _encode_entry(entry))
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Delete expired entries, then the least recently used ones until
+        the cache fits in ``max_bytes``.
+
+        Returns:
+            Number of entries deleted
+        """
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                status = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime, status.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        deleted = 0
+        for mtime, size, path in entries:
+            expired = self.max_age is not None and now - mtime > self.max_age
+            if not expired and total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+
+def _encode_entry(entry: CacheEntry) -> bytes:
+    """Serialise an entry: header (magic, format, payload digest) + payload."""
+    payload = zlib.compress(pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+    return _MAGIC + bytes([CACHE_FORMAT]) + hashlib.sha256(payload).digest() + payload
+
+
+def _decode_entry(data: bytes, key: str) -> CacheEntry | None:
+    """Deserialise an entry file; None unless it is intact and for ``key``."""
+    if len(data) < _HEADER_LENGTH or data[: len(_MAGIC)] != _MAGIC:
+        return None
+    if data[len(_MAGIC)] != CACHE_FORMAT:
+        return None
+    payload = data[_HEADER_LENGTH:]
+    if hashlib.sha256(payload).digest() != data[len(_MAGIC) + 1 : _HEADER_LENGTH]:
+        return None
+    try:
+        entry = pickle.loads(zlib.decompress(payload))
+    except Exception:
+        return None
+    if not isinstance(entry, CacheEntry) or entry.key != key:
+        return None
+    return entry
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.stem[:16], suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
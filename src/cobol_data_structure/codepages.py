@@ -0,0 +1,221 @@
+"""Bulk EBCDIC translation of record buffers.
+
+Decoding EBCDIC text one field at a time goes through a charmap codec per
+value. Instead, :class:`RecordTranslator` translates a whole record, or a
+whole buffer of records, with a single ``bytes.translate`` call into a
+single-byte target encoding (Latin-1 by default), then puts back the bytes
+of every field that is not text (packed, binary, zoned, floating point,
+national), so those are never translated. Text fields are then decoded from
+the translated buffer with the much cheaper target codec.
+
+Example:
+    >>> translator = RecordTranslator(record)  # record parsed with encoding="cp037"
+    >>> text = translator.translate(data)
+    >>> translator.plan.decode(text[:translator.record_length])
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import cache
+from pathlib import Path
+
+from cobol_data_structure.layout import CODEC_ALPHANUMERIC, LayoutPlan, as_plan
+from cobol_data_structure.models import CobolRecord
+
+#: EBCDIC code pages with precomputed translation tables.
+EBCDIC_CODE_PAGES = ("cp037", "cp500", "cp1140", "cp273")
+
+#: Byte written for characters the target encoding cannot represent (SUB).
+SUBSTITUTE = 0x1A
+
+
+@cache
+def translation_table(encoding: str, target: str = "latin-1") -> bytes:
+    """Build a 256-byte ``bytes.translate`` table between single-byte encodings.
+
+    Args:
+        encoding: Source code page, e.g. ``"cp037"``
+        target: Single-byte encoding the bytes are translated to
+
+    Returns:
+        Table mapping each source byte to the target byte of the same
+        character. Characters the target cannot represent (such as the euro
+        sign of cp1140 in Latin-1) map to :data:`SUBSTITUTE`.
+
+    Raises:
+        ValueError: If the source is not a single-byte encoding
+    """
+    table = bytearray(256)
+    for byte in range(256):
+        try:
+            char = bytes([byte]).decode(encoding)
+        except UnicodeDecodeError:
+            char = ""
+        if len(char) != 1:
+            raise ValueError(f"{encoding} is not a single-byte encoding")
+        try:
+            encoded = char.encode(target)
+        except UnicodeEncodeError:
+            encoded = b""
+        table[byte] = encoded[0] if len(encoded) == 1 else SUBSTITUTE
+    return bytes(table)
+
+
+# Precompute the common code pages at import time
+for _code_page in EBCDIC_CODE_PAGES:
+    translation_table(_code_page)
+
+
+class RecordTranslator:
+    """Translate the text fields of fixed-length records in bulk.
+
+    Bytes belonging only to alphanumeric leaves in the source encoding are
+    translated; every other byte (non-text leaves, and text leaves that
+    REDEFINES a non-text area) keeps its original value.
+
+    Attributes:
+        encoding: Source code page
+        target: Encoding of the translated text
+        table: The translation table
+        record_length: Record length in bytes
+        plan: Plan for decoding *translated* records; fully translated text
+            leaves are decoded with ``target``
+    """
+
+    def __init__(
+        self,
+        layout: CobolRecord | LayoutPlan,
+        encoding: str | None = None,
+        target: str = "latin-1",
+    ) -> None:
+        """Prepare the translation of one record layout.
+
+        Args:
+            layout: Record or compiled plan
+            encoding: Source code page; defaults to the encoding of the
+                layout's text fields
+            target: Single-byte encoding to translate to
+
+        Raises:
+            ValueError: If no source encoding is given or found, or the
+                layout has OCCURS DEPENDING ON tables
+        """
+        source = as_plan(layout)
+        if source.variable is not None:
+            raise ValueError(
+                f"Record {source.record_name} has OCCURS DEPENDING ON tables; "
+                "only fixed layouts can be translated in bulk"
+            )
+        if encoding is None:
+            encoding = next(
+                (p[0] for c, p in zip(source.codecs, source.params) if c == CODEC_ALPHANUMERIC),
+                None,
+            )
+            if encoding is None:
+                raise ValueError(f"Record {source.record_name} has no text fields")
+        self.encoding = encoding
+        self.target = target
+        self.table = translation_table(encoding, target)
+        self.record_length = source.record_length
+
+        text = bytearray(self.record_length)
+        for offset, length, codec, params in zip(
+            source.offsets, source.lengths, source.codecs, source.params
+        ):
+            if codec == CODEC_ALPHANUMERIC and params[0] == encoding:
+                text[offset : offset + length] = b"\x01" * length
+        for offset, length, codec in zip(source.offsets, source.lengths, source.codecs):
+            if codec != CODEC_ALPHANUMERIC:
+                text[offset : offset + length] = bytes(length)
+        #: Byte ranges of the record that are never translated
+        self.keep_spans: tuple[tuple[int, int], ...] = _spans(text, 0)
+
+        def translated(offset: int, length: int, codec: int) -> bool:
+            return codec == CODEC_ALPHANUMERIC and all(text[offset : offset + length])
+
+        leaf_params = [
+            (target,) if translated(offset, length, codec) else params
+            for offset, length, codec, params in zip(
+                source.offsets, source.lengths, source.codecs, source.params
+            )
+        ]
+        tables = {
+            path: (
+                replace(table, params=(target,))
+                if all(translated(offset, table.length, table.codec) for offset in table.offsets())
+                else table
+            )
+            for path, table in source.tables.items()
+        }
+        self.plan = replace(source, params=tuple(leaf_params), tables=tables)
+
+    def translate(self, data: bytes) -> bytes:
+        """Translate the text bytes of one or more consecutive records.
+
+        Args:
+            data: A record, or a buffer of back-to-back records; a trailing
+                partial record is translated like the start of a record
+
+        Returns:
+            The translated buffer, the same length as ``data``
+        """
+        data = bytes(data)
+        if not self.keep_spans:
+            return data.translate(self.table)
+        out = bytearray(data.translate(self.table))
+        length = self.record_length
+        count = -(-len(data) // length)
+        kept = sum(end - start for start, end in self.keep_spans)
+        if count * len(self.keep_spans) <= kept:
+            # Few records: copy original spans back record by record
+            for base in range(0, len(data), length):
+                for start, end in self.keep_spans:
+                    out[base + start : base + end] = data[base + start : base + end]
+        else:
+            # Many records: copy back one byte column at a time across records
+            for start, end in self.keep_spans:
+                for column in range(start, end):
+                    out[column::length] = data[column::length]
+        return bytes(out)
+
+    def translate_file(
+        self,
+        source: str | Path,
+        destination: str | Path,
+        chunk_records: int = 65536,
+    ) -> int:
+        """Translate a RECFM=F file into another file, in chunks of records.
+
+        Args:
+            source: Input data file
+            destination: Output file (overwritten)
+            chunk_records: Records translated per ``translate`` call
+
+        Returns:
+            Number of bytes written
+        """
+        size = chunk_records * self.record_length
+        written = 0
+        with open(source, "rb") as reader, open(destination, "wb") as writer:
+            while True:
+                chunk = reader.read(size)
+                if not chunk:
+                    break
+                written += writer.write(self.translate(chunk))
+        return written
+
+
+def _spans(mask: bytearray, value: int) -> tuple[tuple[int, int], ...]:
+    """Maximal ``(start, end)`` ranges of ``mask`` whose bytes equal ``value``."""
+    spans: list[tuple[int, int]] = []
+    start: int | None = None
+    for i, byte in enumerate(mask):
+        if byte == value and start is None:
+            start = i
+        elif byte != value and start is not None:
+            spans.append((start, i))
+            start = None
+    if start is not None:
+        spans.append((start, len(mask)))
+    return tuple(spans)
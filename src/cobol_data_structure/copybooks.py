@@ -0,0 +1,357 @@
+"""COPY statement preprocessor.
+
+:class:`CopybookResolver` expands ``COPY member [OF|IN library]
+[REPLACING ...]`` statements against a list of search paths, recursively,
+before the source is handed to :class:`~cobol_data_structure.parser.CobolParser`:
+
+    >>> resolver = CopybookResolver(["copybooks", "shared/copy"])
+    >>> records = CobolParser().parse(resolver.expand_file("BILLING.cbl"))
+
+REPLACING accepts pseudo-text (``==:PFX:== BY ==WS==``), words and
+literals, and the ``LEADING`` / ``TRAILING`` forms; all pairs of a clause
+are applied in one pass, and never inside literals they do not name.
+
+Expanded copybook text is memoized per (copybook file, REPLACING clause)
+and reused while the files it was built from are unchanged. The resolver
+also keeps a reverse dependency graph: :meth:`invalidate`
+drops the memoized expansions that depend on a changed copybook and
+returns every document that includes it, directly or not, so callers can
+invalidate exactly the layouts built from them (see
+:meth:`LayoutRegistry.invalidate
+<cobol_data_structure.registry.LayoutRegistry.invalidate>`).
+
+The expanded text is free-format: comments and fixed-format sequence and
+indicator areas are removed from every line.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from cobol_data_structure.models import ParserWarning, WarningSeverity
+from cobol_data_structure.tokenizer import LineTokenizer
+
+#: Copybook file name extensions tried, in order, after the bare name.
+COPYBOOK_EXTENSIONS = (".cpy", ".cbl", ".cob", ".copy")
+
+# (kind, operand, replacement); kind is "", "LEADING" or "TRAILING"
+Replacement = tuple[str, str, str]
+
+_COPY_PATTERN = re.compile(r"(?<![\w-])COPY(?![\w-])", re.IGNORECASE)
+_WORD_TOKEN = re.compile(
+    r"\s*(==.*?==|'[^']*'|\"[^\"]*\"|\.(?=\s|$)|[^\s.'\"]+(?:\.(?!\s|$)[^\s.'\"]*)*)", re.DOTALL
+)
+_LITERAL_PATTERN = r"'[^']*'|\"[^\"]*\""
+
+
+class CopybookResolver:
+    """Expand COPY statements, memoizing copybook expansions.
+
+    Args:
+        search_paths: Directories searched for copybooks, in order. For
+            ``COPY member OF library``, ``<path>/<library>`` is searched
+            before ``<path>`` itself.
+        extensions: File name extensions tried after the bare member name
+        encoding: Text encoding of copybook files
+        max_depth: Deepest chain of nested COPY statements accepted
+    """
+
+    def __init__(
+        self,
+        search_paths: Iterable[str | Path] = (".",),
+        extensions: Sequence[str] = COPYBOOK_EXTENSIONS,
+        encoding: str = "utf-8",
+        max_depth: int = 20,
+    ) -> None:
+        self.search_paths = [Path(path) for path in search_paths]
+        self.extensions = tuple(extensions)
+        self.encoding = encoding
+        self.max_depth = max_depth
+        self.warnings: list[ParserWarning] = []
+        self.hits = 0
+        self.misses = 0
+        self._memo: dict[tuple[str, tuple[Replacement, ...]], tuple[Any, list[str]]] = {}
+        self._includes: dict[str, set[str]] = {}
+        self._included_by: dict[str, set[str]] = {}
+
+    def expand(self, source: str, document: str = "<string>") -> str:
+        """Expand every COPY statement of a source.
+
+        Args:
+            source: COBOL program or copybook text
+            document: Name under which the source's dependencies are
+                recorded (a path for files)
+
+        Returns:
+            Free-format source with copybooks inlined
+        """
+        lines = [LineTokenizer.remove_comments(line) for line in source.splitlines()]
+        self._set_includes(document, set())
+        return "\n".join(self._expand_lines(lines, document, (document,))) + "\n"
+
+    def expand_file(self, path: str | Path, encoding: str | None = None) -> str:
+        """Expand a source file, recording its dependencies under its resolved path."""
+        path = Path(path)
+        source = path.read_text(encoding=encoding or self.encoding)
+        return self.expand(source, document=str(path.resolve()))
+
+    def resolve(self, member: str, library: str | None = None) -> Path | None:
+        """Path of a copybook, or None if no search path holds it."""
+        member = member.strip("'\"")
+        names = [member + ext for ext in ("",) + self.extensions]
+        names += [name.upper() for name in names] + [name.lower() for name in names]
+        directories: list[Path] = []
+        for path in self.search_paths:
+            if library:
+                library = library.strip("'\"")
+                directories += [path / library, path / library.upper(), path / library.lower()]
+            directories.append(path)
+        for directory in directories:
+            for name in names:
+                candidate = directory / name
+                if candidate.is_file():
+                    return candidate.resolve()
+        return None
+
+    def dependencies(self, document: str) -> set[str]:
+        """Copybook files a document includes, directly or not."""
+        seen: set[str] = set()
+        pending = list(self._includes.get(document, ()))
+        while pending:
+            path = pending.pop()
+            if path not in seen:
+                seen.add(path)
+                pending.extend(self._includes.get(path, ()))
+        return seen
+
+    def dependents(self, copybook: str | Path) -> set[str]:
+        """Documents and copybooks that include a copybook, directly or not."""
+        seen: set[str] = set()
+        pending = list(self._included_by.get(str(Path(copybook).resolve()), ()))
+        while pending:
+            document = pending.pop()
+            if document not in seen:
+                seen.add(document)
+                pending.extend(self._included_by.get(document, ()))
+        return seen
+
+    def invalidate(self, copybook: str | Path) -> set[str]:
+        """Forget a changed copybook's expansions and those including it.
+
+        Returns:
+            Every document and copybook that depends on it
+        """
+        path = str(Path(copybook).resolve())
+        affected = self.dependents(path)
+        stale = affected | {path}
+        for key in [key for key in self._memo if key[0] in stale]:
+            del self._memo[key]
+        return affected
+
+    def clear(self) -> None:
+        """Forget all expansions and dependencies."""
+        self._memo.clear()
+        self._includes.clear()
+        self._included_by.clear()
+
+    def _set_includes(self, document: str, includes: set[str]) -> None:
+        """Replace the direct includes recorded for a document."""
+        for old in self._includes.get(document, ()):
+            self._included_by.get(old, set()).discard(document)
+        self._includes[document] = includes
+        for path in includes:
+            self._included_by.setdefault(path, set()).add(document)
+
+    def _expand_lines(self, lines: list[str], document: str, stack: tuple[str, ...]) -> list[str]:
+        """Expand the COPY statements of comment-free lines."""
+        output: list[str] = []
+        includes = self._includes.setdefault(document, set())
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            match = _COPY_PATTERN.search(_mask_literals(line))
+            if match is None:
+                output.append(line.strip())
+                i += 1
+                continue
+            statement = _read_statement(lines, i, match.end())
+            if statement is None:
+                self._warn(f"Unterminated COPY statement in {document}", i + 1)
+                output.append(line.strip())
+                i += 1
+                continue
+            member, library, replacing, end_line, rest = statement
+            before = line[: match.start()].strip()
+            if before:
+                output.append(before)
+            path = self.resolve(member, library)
+            if path is None:
+                self._warn(f"Copybook {member} not found for {document}", i + 1)
+            elif str(path) in stack or len(stack) > self.max_depth:
+                self._warn(f"Recursive or too deeply nested COPY {member} in {document}", i + 1)
+            else:
+                includes.add(str(path))
+                self._included_by.setdefault(str(path), set()).add(document)
+                output.extend(self._copybook(path, replacing, stack))
+            if rest.strip():
+                lines = lines[:end_line] + [rest] + lines[end_line + 1 :]
+                i = end_line
+            else:
+                i = end_line + 1
+        return output
+
+    def _copybook(
+        self, path: Path, replacing: tuple[Replacement, ...], stack: tuple[str, ...]
+    ) -> list[str]:
+        """Expanded (and replaced) lines of a copybook, memoized.
+
+        A memoized expansion is used only while the copybook and the
+        copybooks it includes keep their size and modification time.
+        """
+        key = (str(path), replacing)
+        cached = self._memo.get(key)
+        if cached is not None:
+            if cached[0] == copybook_stamp(self.dependencies(str(path)) | {str(path)}):
+                self.hits += 1
+                return cached[1]
+            self.invalidate(path)
+        self.misses += 1
+        text = path.read_text(encoding=self.encoding)
+        lines = [LineTokenizer.remove_comments(line) for line in text.splitlines()]
+        self._set_includes(str(path), set())
+        lines = self._expand_lines(lines, str(path), stack + (str(path),))
+        if replacing:
+            lines = apply_replacing("\n".join(lines), replacing).split("\n")
+        self._memo[key] = (copybook_stamp(self.dependencies(str(path)) | {str(path)}), lines)
+        return lines
+
+    def _warn(self, message: str, line_number: int) -> None:
+        self.warnings.append(
+            ParserWarning(
+                severity=WarningSeverity.WARNING, message=message, line_number=line_number
+            )
+        )
+
+
+def _mask_literals(text: str) -> str:
+    """Blank out quoted literals so that keywords inside them are not seen."""
+    return re.sub(_LITERAL_PATTERN, lambda m: " " * len(m.group()), text)
+
+
+def _read_statement(
+    lines: list[str], index: int, start: int
+) -> tuple[str, str | None, tuple[Replacement, ...], int, str] | None:
+    """Parse a COPY statement from just after its ``COPY`` keyword.
+
+    Returns:
+        (member, library, replacing pairs, index of the line holding the
+        terminating period, text after the period), or None if the
+        statement has no period
+    """
+    text = "\n".join([lines[index][start:]] + lines[index + 1 :])
+    words: list[str] = []
+    position = 0
+    while True:
+        match = _WORD_TOKEN.match(text, position)
+        if match is None or not match.group(1):
+            return None
+        position = match.end()
+        word = match.group(1)
+        if word == ".":
+            break
+        words.append(word)
+    if not words:
+        return None
+    end_line = index + text.count("\n", 0, position)
+    rest = text[position:].split("\n", 1)[0]
+
+    member, library, i = words[0], None, 1
+    if i + 1 < len(words) and words[i].upper() in ("OF", "IN"):
+        library, i = words[i + 1], i + 2
+    if i < len(words) and words[i].upper() == "SUPPRESS":
+        i += 1
+    replacing: list[Replacement] = []
+    if i < len(words) and words[i].upper() == "REPLACING":
+        i += 1
+        while i < len(words):
+            kind = ""
+            if words[i].upper() in ("LEADING", "TRAILING"):
+                kind, i = words[i].upper(), i + 1
+            if i + 2 >= len(words) or words[i + 1].upper() != "BY":
+                break
+            replacing.append((kind, _operand(words[i]), _operand(words[i + 2])))
+            i += 3
+    return member, library, tuple(replacing), end_line, rest
+
+
+def _operand(word: str) -> str:
+    """Text of a REPLACING operand, with pseudo-text delimiters removed."""
+    if word.startswith("==") and word.endswith("==") and len(word) >= 4:
+        return " ".join(word[2:-2].split())
+    return word
+
+
+def apply_replacing(text: str, replacing: Sequence[Replacement]) -> str:
+    """Apply REPLACING pairs to copybook text in a single pass.
+
+    Operands match whole text words, separated by any whitespace; operands
+    starting or ending with a separator such as ``:`` also match inside
+    words. Literals are only replaced by operands that are literals.
+
+    Args:
+        text: Copybook text (comments removed)
+        replacing: ``(kind, operand, replacement)`` triples, kind being
+            ``""``, ``"LEADING"`` or ``"TRAILING"``
+
+    Returns:
+        The replaced text
+    """
+    literal_patterns: list[str] = []
+    word_patterns: list[str] = []
+    targets: dict[str, str] = {}
+    for n, (kind, operand, replacement) in enumerate(replacing):
+        if not operand:
+            continue
+        name = f"r{n}"
+        targets[name] = replacement
+        body = r"\s+".join(re.escape(part) for part in operand.split())
+        if operand[0] in "'\"":
+            literal_patterns.append(f"(?P<{name}>{body})")
+            continue
+        if kind == "LEADING":
+            pattern = rf"(?<![\w-]){body}(?=[\w-])"
+        elif kind == "TRAILING":
+            pattern = rf"(?<=[\w-]){body}(?![\w-])"
+        else:
+            before = r"(?<![\w-])" if re.match(r"[\w-]", operand[0]) else ""
+            after = r"(?![\w-])" if re.match(r"[\w-]", operand[-1]) else ""
+            pattern = f"{before}{body}{after}"
+        word_patterns.append(f"(?P<{name}>{pattern})")
+    if not targets:
+        return text
+    combined = re.compile(
+        "|".join(literal_patterns + [f"(?:{_LITERAL_PATTERN})"] + word_patterns), re.IGNORECASE
+    )
+
+    def substitute(match: re.Match[str]) -> str:
+        name = match.lastgroup
+        return targets[name] if name else match.group()
+
+    return combined.sub(substitute, text)
+
+
+def copybook_stamp(paths: Iterable[str]) -> tuple[tuple[str, int, int], ...]:
+    """Size and modification time of files, for change detection."""
+    stamps = []
+    for path in sorted(paths):
+        try:
+            status = os.stat(path)
+        except FileNotFoundError:
+            stamps.append((path, -1, -1))
+        else:
+            stamps.append((path, status.st_size, status.st_mtime_ns))
+    return tuple(stamps)
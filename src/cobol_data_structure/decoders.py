@@ -0,0 +1,95 @@
+"""Decoders for elementary COBOL storage formats.
+
+Every decoder takes the bytes of one field occurrence (``bytes``,
+``bytearray`` or ``memoryview``) and returns a Python value. Decoders raise
+``ValueError`` when the bytes are not valid for the format; callers decide
+whether that becomes a warning or an error.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Union
+
+from cobol_data_structure import packed
+
+Number = Union[int, float]
+
+_FLOAT = struct.Struct(">f")
+_DOUBLE = struct.Struct(">d")
+
+
+def apply_scale(value: int, decimal_places: int) -> Number:
+    """Apply an implied decimal point to an integer value.
+
+    Examples:
+        >>> apply_scale(12345, 2)
+        123.45
+        >>> apply_scale(12345, 0)
+        12345
+    """
+    if decimal_places > 0:
+        divisor: int = 10**decimal_places
+        return value / divisor
+    return value
+
+
+def decode_alphanumeric(data: bytes, encoding: str) -> str:
+    """Decode a PIC X / PIC A field, dropping trailing spaces."""
+    try:
+        return str(data, encoding).rstrip()
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Cannot decode with {encoding}: {e}") from e
+
+
+def decode_national(data: bytes) -> str:
+    """Decode a PIC N (UTF-16 big-endian) field, dropping trailing spaces."""
+    return decode_alphanumeric(data, "utf-16-be")
+
+
+def decode_zoned(data: bytes, is_signed: bool, decimal_places: int) -> Number:
+    """Decode a DISPLAY numeric (PIC 9) field written as text.
+
+    A leading or trailing ``+``/``-`` (SIGN SEPARATE) is honoured.
+    """
+    try:
+        text = str(data, "ascii").strip()
+        if text[-1:] in ("+", "-"):
+            text = text[-1] + text[:-1]
+        value = int(text)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Cannot parse numeric display: {e}") from e
+    if value < 0 and not is_signed:
+        raise ValueError(f"Negative value {value} in unsigned field")
+    return apply_scale(value, decimal_places)
+
+
+def decode_packed(data: bytes, decimal_places: int) -> Number:
+    """Decode a COMP-3 (packed decimal) field.
+
+    Each byte holds two decimal digits; the low nibble of the last byte
+    holds the sign (0xD or 0xB negative, 0xC, 0xF, 0xA or 0xE positive).
+    See :mod:`cobol_data_structure.packed` for column-wise decoding.
+    """
+    return apply_scale(packed.unpack(data), decimal_places)
+
+
+def decode_binary(data: bytes, is_signed: bool, decimal_places: int) -> Number:
+    """Decode a COMP/COMP-4/COMP-5/BINARY (big-endian) field."""
+    if len(data) not in (2, 4, 8):
+        raise ValueError(f"Invalid binary data length: {len(data)}")
+    return apply_scale(int.from_bytes(data, "big", signed=is_signed), decimal_places)
+
+
+def decode_float(data: bytes) -> float:
+    """Decode a COMP-1 (4 bytes) or COMP-2 (8 bytes) big-endian IEEE float."""
+    if len(data) == 4:
+        return float(_FLOAT.unpack(data)[0])
+    if len(data) == 8:
+        return float(_DOUBLE.unpack(data)[0])
+    raise ValueError(f"Invalid floating point data length: {len(data)}")
+
+
+def decode_raw(data: bytes) -> str:
+    """Return the bytes of an unsupported field as a hex string."""
+    return bytes(data).hex()
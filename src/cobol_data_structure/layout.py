@@ -0,0 +1,863 @@
+"""Compiled, flat decoding plans for :class:`CobolRecord` layouts.
+
+:func:`compile_layout` walks a record tree once and flattens it into a
+:class:`LayoutPlan`: parallel tuples holding the offset, length and codec of
+every elementary leaf, with OCCURS tables already expanded into one leaf per
+occurrence. Decoding a record is then a single loop over the plan, with no
+recursion and no per-field type dispatch.
+
+Example:
+    >>> plan = compile_layout(record)
+    >>> plan.decode(data)["TYPE.CODE"]
+    12345
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Any, Callable, Union
+
+from cobol_data_structure import decoders, zoned
+from cobol_data_structure.binary_parser import ParsedValue
+from cobol_data_structure.models import (
+    BINARY_USAGES,
+    PACKED_USAGES,
+    CobolField,
+    CobolRecord,
+    ParserWarning,
+    PictureCategory,
+    UsageType,
+    WarningSeverity,
+)
+from cobol_data_structure.odo import Guard, OccursDependency, Shift, VariableLayout, VariableTable
+
+# Codec ids stored in LayoutPlan.codecs
+CODEC_ALPHANUMERIC = 0
+CODEC_NATIONAL = 1
+CODEC_ZONED = 2
+CODEC_PACKED = 3
+CODEC_BINARY = 4
+CODEC_FLOAT = 5
+CODEC_RAW = 6
+CODEC_OVERPUNCH = 7
+
+# Decoder for each codec id; called as ``decoder(field_bytes, *params)``
+DECODERS: tuple[Callable[..., ParsedValue], ...] = (
+    decoders.decode_alphanumeric,
+    decoders.decode_national,
+    decoders.decode_zoned,
+    decoders.decode_packed,
+    decoders.decode_binary,
+    decoders.decode_float,
+    decoders.decode_raw,
+    zoned.decode_overpunch,
+)
+
+CodecParams = tuple[Any, ...]
+
+# Record bytes accepted by the decode methods
+RecordData = Union[bytes, bytearray, memoryview]
+
+# Codecs an OCCURS DEPENDING ON counter may use
+_COUNTER_CODECS = (CODEC_ZONED, CODEC_PACKED, CODEC_BINARY, CODEC_OVERPUNCH)
+
+# Most resolved layouts memoized per variable plan
+_RESOLVED_CACHE_SIZE = 1024
+
+_SUBSCRIPTS = re.compile(r"\([^)]*\)")
+
+
+def field_codec(field: CobolField) -> tuple[int, CodecParams]:
+    """Select the codec id and decoder parameters for an elementary field.
+
+    Args:
+        field: Elementary field definition
+
+    Returns:
+        Tuple of (codec id, parameters passed after the field bytes)
+    """
+    category = field.picture_category
+    if category in (
+        PictureCategory.ALPHANUMERIC,
+        PictureCategory.ALPHABETIC,
+        PictureCategory.NUMERIC_EDITED,
+    ):
+        return CODEC_ALPHANUMERIC, (field.encoding,)
+    if category == PictureCategory.NATIONAL:
+        return CODEC_NATIONAL, ()
+    if category == PictureCategory.NUMERIC:
+        if field.usage == UsageType.DISPLAY:
+            convention = zoned.overpunch_convention(field)
+            if convention is not None:
+                return CODEC_OVERPUNCH, (
+                    convention,
+                    field.is_signed,
+                    field.decimal_places,
+                    field.sign_leading,
+                )
+            return CODEC_ZONED, (field.is_signed, field.decimal_places)
+        if field.usage in PACKED_USAGES:
+            return CODEC_PACKED, (field.decimal_places,)
+        if field.usage in BINARY_USAGES:
+            return CODEC_BINARY, (field.is_signed, field.decimal_places)
+        if field.usage in (UsageType.COMP1, UsageType.COMP2):
+            return CODEC_FLOAT, ()
+    return CODEC_RAW, ()
+
+
+@dataclass(frozen=True)
+class StrideTable:
+    """Closed-form offsets of a leaf repeated by (nested) OCCURS tables.
+
+    Occurrence ``(i1, ..., in)`` of the leaf, with 1-based subscripts
+    outermost first, starts at ``offset + (i1 - 1) * strides[0] + ... +
+    (in - 1) * strides[n - 1]``.
+
+    Attributes:
+        path: Dotted path without subscripts, e.g. ``MONTH.DAY.RATE``
+        offset: Offset of the first occurrence
+        length: Byte length of one occurrence
+        codec: Codec id
+        params: Decoder parameters
+        strides: Bytes between occurrences of each enclosing table
+        counts: Occurrences of each enclosing table
+    """
+
+    path: str
+    offset: int
+    length: int
+    codec: int
+    params: CodecParams
+    strides: tuple[int, ...]
+    counts: tuple[int, ...]
+
+    def __len__(self) -> int:
+        return math.prod(self.counts)
+
+    def offset_of(self, *subscripts: int) -> int:
+        """Offset of one occurrence.
+
+        Raises:
+            IndexError: If there is not one subscript per table, or one is
+                out of range
+        """
+        if len(subscripts) != len(self.strides):
+            raise IndexError(
+                f"{self.path} needs {len(self.strides)} subscripts, got {len(subscripts)}"
+            )
+        offset = self.offset
+        for subscript, stride, count in zip(subscripts, self.strides, self.counts):
+            if not 1 <= subscript <= count:
+                raise IndexError(f"Subscript {subscript} out of range 1-{count}")
+            offset += (subscript - 1) * stride
+        return offset
+
+    def offsets(self) -> list[int]:
+        """Offsets of every occurrence, last subscript varying fastest."""
+        offsets = [self.offset]
+        for stride, count in zip(self.strides, self.counts):
+            steps = range(0, stride * count, stride)
+            offsets = [offset + step for offset in offsets for step in steps]
+        return offsets
+
+    def decode(self, data: RecordData) -> list[ParsedValue]:
+        """Decode every occurrence, in :meth:`offsets` order.
+
+        ``data`` is not length-checked; invalid occurrences are None.
+        """
+        decode, length, params = DECODERS[self.codec], self.length, self.params
+        values: list[ParsedValue] = []
+        append = values.append
+        for start in self.offsets():
+            try:
+                append(decode(data[start : start + length], *params))
+            except ValueError:
+                append(None)
+        return values
+
+    def decode_at(self, data: RecordData, *subscripts: int) -> ParsedValue:
+        """Decode one occurrence; None if its bytes are invalid."""
+        start = self.offset_of(*subscripts)
+        try:
+            return DECODERS[self.codec](data[start : start + self.length], *self.params)
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True)
+class LayoutPlan:
+    """Immutable flat decoding plan for one record layout.
+
+    The ``paths``, ``offsets``, ``lengths``, ``codecs`` and ``params`` tuples
+    are parallel: entry ``i`` of each describes leaf ``i``. Paths are dotted
+    from the record's top-level fields, with 1-based subscripts for
+    occurrences, e.g. ``MONTH-DATA(3).SALES``.
+
+    ``tables`` maps the unsubscripted path of every leaf inside OCCURS
+    tables to its :class:`StrideTable`.
+
+    Records with OCCURS DEPENDING ON tables compile to a *variable* plan:
+    its leaves and ``record_length`` are those of the maximum layout, and
+    ``variable`` describes how counts change them. :meth:`resolve` lays the
+    plan out for one record's counts; the decode methods do so themselves.
+    """
+
+    record_name: str
+    record_length: int
+    paths: tuple[str, ...]
+    offsets: tuple[int, ...]
+    lengths: tuple[int, ...]
+    codecs: tuple[int, ...]
+    params: tuple[CodecParams, ...]
+    warnings: tuple[ParserWarning, ...] = ()
+    tables: dict[str, StrideTable] = field(default_factory=dict, repr=False, compare=False)
+    variable: VariableLayout | None = field(default=None, repr=False)
+    _steps: tuple[tuple[Callable[..., ParsedValue], int, int, CodecParams], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _resolved: dict[tuple[int, ...], tuple[LayoutPlan, tuple[int, ...]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        steps = tuple(
+            (DECODERS[codec], offset, offset + length, params)
+            for offset, length, codec, params in zip(
+                self.offsets, self.lengths, self.codecs, self.params
+            )
+        )
+        object.__setattr__(self, "_steps", steps)
+        object.__setattr__(self, "_resolved", {})
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable hex digest identifying the decoding behaviour of this plan.
+
+        Two plans with the same fingerprint decode any buffer identically,
+        which makes the digest usable as a cache key across processes.
+        """
+        canonical = repr(
+            (
+                self.record_length,
+                self.paths,
+                self.offsets,
+                self.lengths,
+                self.codecs,
+                self.params,
+            )
+        )
+        if self.variable is not None:
+            canonical += repr(self.variable)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def index(self) -> dict[str, int]:
+        """Position of each leaf path in the parallel tuples."""
+        return {path: i for i, path in enumerate(self.paths)}
+
+    @cached_property
+    def groups(self) -> dict[str, int]:
+        """Paths above the leaves: groups, occurrences and tables.
+
+        Groups and single occurrences (``TYPE``, ``MONTH-DATA(2)``) map to 0.
+        Tables, addressed without a subscript (``MONTH-DATA``, or a leaf
+        table such as ``CODES``), map to their number of occurrences.
+        """
+        groups: dict[str, int] = {}
+        for path in self.paths:
+            parts = path.split(".")
+            prefix = ""
+            for depth, part in enumerate(parts):
+                name, subscripted, subscript = part.partition("(")
+                if subscripted:
+                    table = prefix + name
+                    groups[table] = max(groups.get(table, 0), int(subscript[:-1]))
+                if depth < len(parts) - 1:
+                    groups.setdefault(prefix + part, 0)
+                prefix += part + "."
+        return groups
+
+    @cached_property
+    def min_length(self) -> int:
+        """Length of the shortest valid record.
+
+        ``record_length``, except for variable plans: their length at the
+        minimum counts.
+        """
+        variable = self.variable
+        if variable is None:
+            return self.record_length
+        minimums = [dependency.minimum for dependency in variable.dependencies]
+        return self.record_length - variable.shrinkage(variable.terms(minimums))
+
+    def counts(self, data: RecordData) -> tuple[int, ...]:
+        """Read the OCCURS DEPENDING ON counters of a record.
+
+        Returns:
+            The count of each of ``variable.dependencies``; empty for fixed
+            plans
+
+        Raises:
+            ValueError: If a counter is invalid or out of its table's range
+        """
+        variable = self.variable
+        if variable is None:
+            return ()
+        counts: list[int] = []
+        for dependency, index in zip(variable.dependencies, variable.counters):
+            count = self.decode_leaf(data, index)
+            if not isinstance(count, int) or not (
+                dependency.minimum <= count <= dependency.maximum
+            ):
+                raise ValueError(
+                    f"OCCURS DEPENDING ON counter {dependency.counter} is {count!r}; "
+                    f"{dependency.table} allows {dependency.minimum} to {dependency.maximum}"
+                )
+            counts.append(count)
+        return tuple(counts)
+
+    def resolve(self, data: RecordData) -> LayoutPlan:
+        """The plan laid out for one record's OCCURS DEPENDING ON counts.
+
+        Fixed plans return themselves. For variable plans see
+        :meth:`resolve_counts`.
+
+        Raises:
+            ValueError: If data is shorter than :attr:`min_length` or a
+                counter is invalid
+        """
+        if self.variable is None:
+            return self
+        return self._resolution(self._record_counts(data))[0]
+
+    def resolve_counts(self, counts: Sequence[int]) -> LayoutPlan:
+        """The plan laid out for given OCCURS DEPENDING ON counts.
+
+        The result is a fixed plan holding the occurrences that exist, at
+        their actual offsets, with the actual record length. It is computed
+        from the compiled shifts (no field tree is walked) and memoized per
+        distinct counts.
+
+        Args:
+            counts: One count per entry of ``variable.dependencies``
+        """
+        return self._resolution(tuple(counts))[0]
+
+    def select(self, fields: Sequence[str]) -> LayoutPlan:
+        """The plan pruned to the leaves of some fields.
+
+        A reference selects every leaf at or below it. It may be a leaf
+        path (``TYPE.CODE``), a group or occurrence (``TYPE``,
+        ``MONTH-DATA(2)``), or a table: names without a subscript cover
+        every occurrence (``MONTH-DATA``, ``MONTH-DATA.SALES``).
+
+        Decoding the result touches only the selected bytes. Variable
+        plans also keep their OCCURS DEPENDING ON counters, which place
+        the selected leaves. ``tables`` keeps the stride tables whose every
+        occurrence is selected.
+
+        Args:
+            fields: Field references, as plan paths
+
+        Returns:
+            The pruned plan, leaves in plan order
+
+        Raises:
+            KeyError: If a reference selects no leaf
+        """
+        leaves = [_path_parts(path) for path in self.paths]
+        selected = set()
+        for reference in fields:
+            parts = _path_parts(reference)
+            matches = [i for i, leaf in enumerate(leaves) if _selects(parts, leaf)]
+            if not matches:
+                raise KeyError(reference)
+            selected.update(matches)
+
+        variable = self.variable
+        if variable is not None:
+            selected.update(variable.counters)
+        kept = sorted(selected)
+        position = {leaf: i for i, leaf in enumerate(kept)}
+
+        occurrences: dict[str, int] = {}
+        for leaf in kept:
+            name = _SUBSCRIPTS.sub("", self.paths[leaf])
+            occurrences[name] = occurrences.get(name, 0) + 1
+        tables = {
+            path: table
+            for path, table in self.tables.items()
+            if occurrences.get(path) == len(table)
+        }
+
+        if variable is not None:
+            variable = replace(
+                variable,
+                counters=tuple(position[leaf] for leaf in variable.counters),
+                shifts=tuple(variable.shifts[leaf] for leaf in kept),
+                guards=tuple(variable.guards[leaf] for leaf in kept),
+                strides={
+                    path: (position[first], dimensions)
+                    for path, (first, dimensions) in variable.strides.items()
+                    if path in tables
+                },
+            )
+        return LayoutPlan(
+            record_name=self.record_name,
+            record_length=self.record_length,
+            paths=tuple(self.paths[leaf] for leaf in kept),
+            offsets=tuple(self.offsets[leaf] for leaf in kept),
+            lengths=tuple(self.lengths[leaf] for leaf in kept),
+            codecs=tuple(self.codecs[leaf] for leaf in kept),
+            params=tuple(self.params[leaf] for leaf in kept),
+            warnings=self.warnings,
+            tables=tables,
+            variable=variable,
+        )
+
+    def _record_counts(self, data: RecordData) -> tuple[int, ...]:
+        """Counts of a record at least :attr:`min_length` bytes long."""
+        if len(data) < self.min_length:
+            raise ValueError(f"Data length {len(data)} is less than expected {self.min_length}")
+        return self.counts(data)
+
+    def _resolution(self, counts: tuple[int, ...]) -> tuple[LayoutPlan, tuple[int, ...]]:
+        """Memoized resolved plan and the index of each of its leaves in this plan."""
+        resolution = self._resolved.get(counts)
+        if resolution is None:
+            if len(self._resolved) >= _RESOLVED_CACHE_SIZE:
+                self._resolved.clear()
+            resolution = self._resolved[counts] = self._resolve(counts)
+        return resolution
+
+    def _resolve(self, counts: tuple[int, ...]) -> tuple[LayoutPlan, tuple[int, ...]]:
+        """Apply the shifts and guards of a variable plan to a set of counts."""
+        variable = self.variable
+        assert variable is not None
+        terms = variable.terms(counts)
+
+        def shifted(leaf: int) -> int:
+            offset = self.offsets[leaf]
+            for term, coefficient in variable.shifts[leaf]:
+                offset -= coefficient * terms[term]
+            return offset
+
+        kept: list[int] = []
+        offsets: list[int] = []
+        for leaf, guards in enumerate(variable.guards):
+            if all(subscript <= counts[dependency] for dependency, subscript in guards):
+                kept.append(leaf)
+                offsets.append(shifted(leaf))
+
+        tables: dict[str, StrideTable] = {}
+        for path, (first, dimensions) in variable.strides.items():
+            table = self.tables[path]
+            strides, sizes = list(table.strides), list(table.counts)
+            for k, dimension in enumerate(dimensions):
+                if dimension >= 0:
+                    strides[k] = variable.item_length(dimension, terms)
+                    dependency = variable.tables[dimension].dependency
+                    if dependency >= 0:
+                        sizes[k] = counts[dependency]
+            tables[path] = replace(
+                table, offset=shifted(first), strides=tuple(strides), counts=tuple(sizes)
+            )
+        for path, table in self.tables.items():
+            tables.setdefault(path, table)
+
+        plan = LayoutPlan(
+            record_name=self.record_name,
+            record_length=self.record_length - variable.shrinkage(terms),
+            paths=tuple(self.paths[leaf] for leaf in kept),
+            offsets=tuple(offsets),
+            lengths=tuple(self.lengths[leaf] for leaf in kept),
+            codecs=tuple(self.codecs[leaf] for leaf in kept),
+            params=tuple(self.params[leaf] for leaf in kept),
+            warnings=self.warnings,
+            tables=tables,
+        )
+        return plan, tuple(kept)
+
+    def decode_values(self, data: RecordData) -> list[ParsedValue]:
+        """Decode every leaf of a record, in plan order.
+
+        Args:
+            data: Record bytes (``bytes``, ``bytearray`` or ``memoryview``)
+
+        Returns:
+            One value per leaf; leaves whose bytes are invalid for their
+            format, and occurrences beyond an OCCURS DEPENDING ON count,
+            are None
+
+        Raises:
+            ValueError: If data is shorter than the record length, or an
+                OCCURS DEPENDING ON counter is invalid
+        """
+        if self.variable is not None:
+            plan, kept = self._resolution(self._record_counts(data))
+            values: list[ParsedValue] = [None] * len(self.paths)
+            for leaf, value in zip(kept, plan.decode_values(data)):
+                values[leaf] = value
+            return values
+        if len(data) < self.record_length:
+            raise ValueError(f"Data length {len(data)} is less than expected {self.record_length}")
+        values = []
+        append = values.append
+        for decode, start, end, params in self._steps:
+            try:
+                append(decode(data[start:end], *params))
+            except ValueError:
+                append(None)
+        return values
+
+    def decode_leaf(self, data: RecordData, index: int) -> ParsedValue:
+        """Decode leaf ``index`` of a record; None if its bytes are invalid.
+
+        ``data`` is not length-checked; slice it from a whole record. The
+        leaf is read at this plan's offset: :meth:`resolve` variable plans
+        first.
+        """
+        decode, start, end, params = self._steps[index]
+        try:
+            return decode(data[start:end], *params)
+        except ValueError:
+            return None
+
+    def decode(self, data: RecordData) -> dict[str, ParsedValue]:
+        """Decode a record into a flat ``{path: value}`` dictionary.
+
+        Occurrences beyond an OCCURS DEPENDING ON count are left out.
+        """
+        if self.variable is not None:
+            return self.resolve(data).decode(data)
+        return dict(zip(self.paths, self.decode_values(data)))
+
+
+def compile_layout(record: CobolRecord, fields: Sequence[str] | None = None) -> LayoutPlan:
+    """Flatten a record into a :class:`LayoutPlan`.
+
+    Elementary FILLER items are left out because they cannot be referenced.
+    OCCURS DEPENDING ON tables are expanded to their maximum number of
+    occurrences and the plan gets a
+    :class:`~cobol_data_structure.odo.VariableLayout`; tables whose counter
+    cannot be used stay at their maximum, with a warning.
+
+    Args:
+        record: Parsed record layout
+        fields: Only compile the leaves of these fields (see
+            :meth:`LayoutPlan.select`); every leaf when None
+
+    Returns:
+        The compiled plan
+
+    Raises:
+        KeyError: If one of ``fields`` selects no leaf
+    """
+    variable = any(cobol_field.occurs_depending_on for cobol_field in record.iter_fields())
+    builder = _PlanBuilder(variable)
+    for top in record.fields:
+        builder.add(top)
+    variable_layout = builder.variable_layout(record)
+    plan = LayoutPlan(
+        record_name=record.name,
+        record_length=record.total_length,
+        paths=tuple(builder.paths),
+        offsets=tuple(builder.offsets),
+        lengths=tuple(builder.lengths),
+        codecs=tuple(builder.codecs),
+        params=tuple(builder.params),
+        warnings=tuple(builder.warnings),
+        tables=builder.tables,
+        variable=variable_layout,
+    )
+    if fields is not None:
+        return plan.select(fields)
+    return plan
+
+
+def as_plan(layout: CobolRecord | LayoutPlan) -> LayoutPlan:
+    """Return ``layout`` itself if it is a plan, else compile the record."""
+    if isinstance(layout, LayoutPlan):
+        return layout
+    return compile_layout(layout)
+
+
+def _path_parts(path: str) -> tuple[tuple[str, str], ...]:
+    """Split a plan path into (name, subscript) pairs; the subscript may be empty."""
+    parts = []
+    for part in path.upper().split("."):
+        name, _, subscript = part.partition("(")
+        parts.append((name.strip(), subscript.rstrip(") ")))
+    return tuple(parts)
+
+
+def _selects(reference: tuple[tuple[str, str], ...], leaf: tuple[tuple[str, str], ...]) -> bool:
+    """Check that a reference names a leaf or one of its ancestors.
+
+    Names the reference leaves unsubscripted match every occurrence.
+    """
+    return len(reference) <= len(leaf) and all(
+        name == leaf_name and (not subscript or subscript == leaf_subscript)
+        for (name, subscript), (leaf_name, leaf_subscript) in zip(reference, leaf)
+    )
+
+
+class _PlanBuilder:
+    """Accumulates the parallel leaf arrays while walking a record tree.
+
+    Only the first occurrence of a table is walked; the leaves of the others
+    are copies of its leaves, shifted by the table's stride.
+
+    Args:
+        variable: Also track the OCCURS DEPENDING ON shifts and guards of
+            every leaf (see :mod:`cobol_data_structure.odo`)
+    """
+
+    def __init__(self, variable: bool = False) -> None:
+        self.paths: list[str] = []
+        self.offsets: list[int] = []
+        self.lengths: list[int] = []
+        self.codecs: list[int] = []
+        self.params: list[CodecParams] = []
+        self.warnings: list[ParserWarning] = []
+        self.tables: dict[str, StrideTable] = {}
+
+        self.variable = variable
+        self.shifts: list[tuple[Shift, ...]] = []
+        self.guards: list[tuple[Guard, ...]] = []
+        self.variable_tables: list[VariableTable] = []
+        self.anchors: dict[str, tuple[int, ...]] = {}
+        # ODO tables as (field, counter name, variable table) until their counters are resolved
+        self._odo: list[tuple[CobolField, str, int]] = []
+        # Variable tables stored before the current position, outermost only
+        self._before: list[int] = []
+        # Per field id, self._before on entering and on leaving the field
+        self._extents: dict[int, tuple[tuple[int, ...], tuple[int, ...]]] = {}
+        # Per id of an elementary field outside tables, its leaf index
+        self._leaves: dict[int, int] = {}
+        # Per stride table, its first leaf and the table path of each dimension
+        self._firsts: dict[str, tuple[int, tuple[str, ...]]] = {}
+
+    def add(
+        self,
+        field: CobolField,
+        prefix: str = "",
+        name_prefix: str = "",
+        dimensions: tuple[tuple[int, int, str], ...] = (),
+    ) -> None:
+        """Add the leaves of ``field`` (all occurrences) to the plan.
+
+        Args:
+            field: Field to add
+            prefix: Subscripted path of the enclosing group, ending in ``.``
+            name_prefix: ``prefix`` without subscripts
+            dimensions: (stride, count, path) of each enclosing table
+        """
+        path = f"{prefix}{field.name}"
+        name = f"{name_prefix}{field.name}"
+        variable = self.variable
+        if variable:
+            redefined = None
+            if field.redefines_field is not None:
+                redefined = self._extents.get(id(field.redefines_field))
+            if redefined is not None:
+                # Stored at the redefined item, before whatever followed it
+                self._before = list(redefined[0])
+            before = tuple(self._before)
+            if before:
+                self.anchors[name] = before
+
+        if not (field.occurs or field.occurs_max):
+            self._add_occurrence(field, path, name, dimensions)
+        else:
+            stride, count = field.item_length(), field.occurrence_count()
+            head = f"{path}(1)"
+            start = len(self.paths)
+            mark = len(self._before)
+            self._add_occurrence(field, head, name, dimensions + ((stride, count, name),))
+            end = len(self.paths)
+
+            # Variable table whose occurrences change length, and ODO dependency
+            resized, dependency = -1, -1
+            shifts, guards = self.shifts[start:end], self.guards[start:end]
+            if variable:
+                children = tuple(self._before[mark:])
+                if field.occurs_depending_on or children:
+                    table = len(self.variable_tables)
+                    if children:
+                        resized = table
+                    if field.occurs_depending_on:
+                        dependency = len(self._odo)
+                        self._odo.append((field, field.occurs_depending_on, table))
+                        self.guards[start:end] = [guard + ((dependency, 1),) for guard in guards]
+                    self.variable_tables.append(
+                        VariableTable(name, stride, count, dependency, children)
+                    )
+                    del self._before[mark:]
+                    self._before.append(table)
+
+            paths, offsets = self.paths[start:end], self.offsets[start:end]
+            lengths, codecs, params = (
+                self.lengths[start:end],
+                self.codecs[start:end],
+                self.params[start:end],
+            )
+            cut = len(head)
+            for i in range(1, count):
+                shift = i * stride
+                occurrence = f"{path}({i + 1})"
+                self.paths.extend([occurrence + leaf[cut:] for leaf in paths])
+                self.offsets.extend([offset + shift for offset in offsets])
+                self.lengths.extend(lengths)
+                self.codecs.extend(codecs)
+                self.params.extend(params)
+                if variable:
+                    if resized >= 0:
+                        self.shifts.extend([leaf + ((2 * resized + 1, i),) for leaf in shifts])
+                    else:
+                        self.shifts.extend(shifts)
+                    if dependency >= 0:
+                        self.guards.extend([leaf + ((dependency, i + 1),) for leaf in guards])
+                    else:
+                        self.guards.extend(guards)
+
+        if variable:
+            self._extents[id(field)] = (before, tuple(self._before))
+            if redefined is not None:
+                self._before = list(redefined[1])
+
+    def _add_occurrence(
+        self,
+        field: CobolField,
+        path: str,
+        name: str,
+        dimensions: tuple[tuple[int, int, str], ...],
+    ) -> None:
+        """Add the leaves of the first occurrence of ``field``."""
+        if field.is_group():
+            for child in field.children:
+                self.add(child, f"{path}.", f"{name}.", dimensions)
+            return
+        if field.is_filler():
+            return
+        codec, params = field_codec(field)
+        if codec == CODEC_RAW:
+            self.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.WARNING,
+                    message=f"Unsupported picture category: {field.picture_category}; "
+                    "decoded as hex",
+                    field_name=field.name,
+                )
+            )
+        index = len(self.paths)
+        offset = field.byte_offset
+        length = field.item_length()
+        self.paths.append(path)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.codecs.append(codec)
+        self.params.append(params)
+        if dimensions:
+            strides, counts, tables = zip(*dimensions)
+            self.tables[name] = StrideTable(name, offset, length, codec, params, strides, counts)
+        if self.variable:
+            self.shifts.append(tuple((2 * table, 1) for table in self._before))
+            self.guards.append(())
+            if dimensions:
+                self._firsts[name] = (index, tables)
+            else:
+                self._leaves[id(field)] = index
+
+    def variable_layout(self, record: CobolRecord) -> VariableLayout | None:
+        """Resolve the ODO counters and assemble the variable layout.
+
+        Tables whose counter is missing, ambiguous, inside a table, not
+        numeric or itself moved by a count keep their maximum size, with a
+        warning.
+
+        Returns:
+            The layout; None if no table depends on a usable counter
+        """
+        if not self.variable:
+            return None
+        dependencies: list[OccursDependency] = []
+        counters: list[int] = []
+        renumbered: dict[int, int] = {}
+        for old, (table_field, counter_name, table) in enumerate(self._odo):
+            index, problem = self._counter(record, counter_name)
+            if problem:
+                self.warnings.append(
+                    ParserWarning(
+                        severity=WarningSeverity.WARNING,
+                        message=f"OCCURS DEPENDING ON {counter_name} of {table_field.name} "
+                        f"{problem}; compiled for maximum "
+                        f"{table_field.occurrence_count()} occurrences",
+                        field_name=table_field.name,
+                    )
+                )
+                continue
+            renumbered[old] = len(dependencies)
+            variable_table = self.variable_tables[table]
+            dependencies.append(
+                OccursDependency(
+                    variable_table.path,
+                    self.paths[index],
+                    table_field.occurs_min or 0,
+                    variable_table.maximum,
+                )
+            )
+            counters.append(index)
+        if not dependencies:
+            return None
+
+        tables = tuple(
+            replace(table, dependency=renumbered.get(table.dependency, -1))
+            for table in self.variable_tables
+        )
+        table_ids = {table.path: i for i, table in enumerate(tables)}
+        return VariableLayout(
+            dependencies=tuple(dependencies),
+            counters=tuple(counters),
+            tables=tables,
+            shifts=tuple(self.shifts),
+            guards=tuple(
+                tuple(
+                    (renumbered[dependency], subscript)
+                    for dependency, subscript in guards
+                    if dependency in renumbered
+                )
+                for guards in self.guards
+            ),
+            tail=tuple(self._before),
+            anchors=self.anchors,
+            strides={
+                path: (first, tuple(table_ids.get(table, -1) for table in dimensions))
+                for path, (first, dimensions) in self._firsts.items()
+            },
+        )
+
+    def _counter(self, record: CobolRecord, name: str) -> tuple[int, str]:
+        """Leaf index of an ODO counter, or -1 and why it cannot be used."""
+        try:
+            counter = record.field_index.get(name)
+        except LookupError:
+            return -1, "is ambiguous"
+        if counter is None:
+            return -1, "is not defined"
+        index = self._leaves.get(id(counter))
+        if index is None:
+            return -1, "is not an elementary item outside tables"
+        if self.codecs[index] not in _COUNTER_CODECS:
+            return -1, "is not numeric"
+        if self.shifts[index]:
+            return -1, "moves with another table's count"
+        return index, ""
@@ -0,0 +1,168 @@
+"""Extract MOVE payload captures from application logs.
+
+The values a program moves into a record, e.g. ``QU01-DATA`` when
+``MOVE QU01-DATA TO LAST-DATA`` runs, are often written to a log. This
+module streams such logs and yields one :class:`MoveCapture` per captured
+MOVE, ready to be decoded with the target record's layout:
+
+    >>> for capture in extract_moves("app.log", target="LAST-DATA"):
+    ...     view = RecordView(plan, capture.payload)
+
+By default a capture is a line such as::
+
+    2024-05-01 10:15:02.123 ... MOVE QU01-DATA TO LAST-DATA HEX=D1D6C8D5...
+    2024-05-01 10:15:03.456 ... MOVE QU01-DATA TO LAST-DATA VALUE='JOHN DOE  ...'
+
+Other formats can be matched by passing a pattern with the same named
+groups (see :data:`DEFAULT_PATTERN`). Logs are scanned as bytes, so raw
+payloads keep their exact bytes; they cannot contain line breaks, so binary
+payloads should be logged as hex.
+"""
+
+from __future__ import annotations
+
+import binascii
+import mmap
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from re import Pattern
+from typing import NamedTuple
+
+from cobol_data_structure.models import ParserWarning, WarningSeverity
+
+#: Default capture line pattern. Required groups: ``timestamp``, ``source``,
+#: ``target`` and either ``hex`` (hex-encoded payload) or ``raw`` (payload
+#: bytes as logged).
+DEFAULT_PATTERN: Pattern[bytes] = re.compile(
+    rb"(?P<timestamp>\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:[.,]\d+)?)"
+    rb".*?\bMOVE\s+(?P<source>[A-Za-z0-9][\w-]*)\s+TO\s+(?P<target>[A-Za-z0-9][\w-]*)"
+    rb"[\s:|]+(?:HEX\s*[=:]\s*(?P<hex>[0-9A-Fa-f]*)"
+    rb"|(?:VALUE|DATA)\s*[=:]\s*(?P<quote>['\"])(?P<raw>.*)(?P=quote))\s*$"
+)
+
+
+class MoveCapture(NamedTuple):
+    """One captured MOVE: when it ran, its operands and the moved bytes."""
+
+    timestamp: str
+    source: str
+    target: str
+    payload: bytes
+
+
+class MoveLogExtractor:
+    """Streaming extractor of MOVE captures.
+
+    Lines are first tested for :attr:`keyword` with a plain substring search
+    and only candidate lines are matched against the pattern, so unrelated
+    log lines cost one C-level scan.
+    """
+
+    def __init__(
+        self,
+        pattern: bytes | Pattern[bytes] = DEFAULT_PATTERN,
+        source: str | None = None,
+        target: str | None = None,
+        keyword: bytes = b"MOVE",
+    ) -> None:
+        """Configure the extractor.
+
+        Args:
+            pattern: Capture line regex (bytes), compiled or not
+            source: Only yield MOVEs from this variable (case-insensitive)
+            target: Only yield MOVEs into this variable (case-insensitive)
+            keyword: Substring every capture line contains
+        """
+        self.pattern = re.compile(pattern) if isinstance(pattern, bytes) else pattern
+        self.source = source.upper() if source else None
+        self.target = target.upper() if target else None
+        self.keyword = keyword
+        self.warnings: list[ParserWarning] = []
+
+    def match_line(self, line: bytes) -> MoveCapture | None:
+        """Parse one log line, or return None if it is not a wanted capture.
+
+        Captures whose hex payload cannot be decoded are skipped and
+        reported in :attr:`warnings`.
+        """
+        match = self.pattern.search(line)
+        if match is None:
+            return None
+        source = match["source"].decode("ascii").upper()
+        target = match["target"].decode("ascii").upper()
+        if (self.source and source != self.source) or (self.target and target != self.target):
+            return None
+        hex_payload = match["hex"]
+        if hex_payload is not None:
+            try:
+                payload = binascii.unhexlify(hex_payload)
+            except binascii.Error as e:
+                self.warnings.append(
+                    ParserWarning(
+                        severity=WarningSeverity.WARNING,
+                        message=f"Invalid hex payload in MOVE {source} TO {target} "
+                        f"at {match['timestamp'].decode('ascii')}: {e}",
+                        field_name=target,
+                    )
+                )
+                return None
+        else:
+            payload = match["raw"]
+        return MoveCapture(match["timestamp"].decode("ascii"), source, target, payload)
+
+    def iter_lines(self, lines: Iterable[bytes]) -> Iterator[MoveCapture]:
+        """Yield the captures found in an iterable of log lines."""
+        keyword = self.keyword
+        match_line = self.match_line
+        for line in lines:
+            if keyword in line:
+                capture = match_line(line)
+                if capture is not None:
+                    yield capture
+
+    def extract(self, path: str | Path, use_mmap: bool = True) -> Iterator[MoveCapture]:
+        """Yield the captures of a log file, in file order.
+
+        Args:
+            path: Log file path
+            use_mmap: Memory-map the file and jump between keyword hits;
+                otherwise read it line by line. Both use constant memory.
+        """
+        with open(path, "rb") as handle:
+            if not use_mmap or not os.fstat(handle.fileno()).st_size:
+                yield from self.iter_lines(handle)
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                yield from self._scan_mapping(mapping)
+
+    def _scan_mapping(self, mapping: mmap.mmap) -> Iterator[MoveCapture]:
+        """Find keyword hits in a mapping and match the lines holding them."""
+        keyword = self.keyword
+        match_line = self.match_line
+        size = len(mapping)
+        position = mapping.find(keyword)
+        while position >= 0:
+            start = mapping.rfind(b"\n", 0, position) + 1
+            end = mapping.find(b"\n", position)
+            if end < 0:
+                end = size
+            capture = match_line(mapping[start:end])
+            if capture is not None:
+                yield capture
+            position = mapping.find(keyword, end)
+
+
+def extract_moves(
+    path: str | Path,
+    source: str | None = None,
+    target: str | None = None,
+    pattern: bytes | Pattern[bytes] = DEFAULT_PATTERN,
+    use_mmap: bool = True,
+) -> Iterator[MoveCapture]:
+    """Yield the MOVE captures of a log file.
+
+    See :class:`MoveLogExtractor` for the arguments.
+    """
+    return MoveLogExtractor(pattern, source, target).extract(path, use_mmap)
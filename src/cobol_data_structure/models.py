@@ -0,0 +1,241 @@
+"""Data model for COBOL data structures.
+
+The classes in this module describe the *layout* of a COBOL record: the
+hierarchy of fields, their storage format and where each one lives in the
+record's byte buffer. They do not hold values; see
+:class:`~cobol_data_structure.binary_parser.BinaryDataParser` for that.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cobol_data_structure.names import FieldIndex
+
+if TYPE_CHECKING:
+    from cobol_data_structure.accessors import FieldAccessor
+    from cobol_data_structure.layout import LayoutPlan
+
+
+class PictureCategory(Enum):
+    """Picture clause category (base type)."""
+
+    ALPHABETIC = "A"
+    ALPHANUMERIC = "X"
+    NUMERIC = "9"
+    NATIONAL = "N"  # Unicode (UTF-16)
+    NUMERIC_EDITED = "E"  # Z, $, *, ... stored as display characters
+
+
+class UsageType(Enum):
+    """Storage usage type."""
+
+    DISPLAY = "DISPLAY"
+    COMP = "COMP"  # Binary
+    COMP1 = "COMP-1"  # Single-precision float
+    COMP2 = "COMP-2"  # Double-precision float
+    COMP3 = "COMP-3"  # Packed decimal
+    COMP4 = "COMP-4"  # Binary (synonym for COMP)
+    COMP5 = "COMP-5"  # Native binary
+    PACKED_DECIMAL = "PACKED-DECIMAL"
+    BINARY = "BINARY"
+
+
+#: Usages stored as two's complement big-endian integers.
+BINARY_USAGES = frozenset({UsageType.COMP, UsageType.COMP4, UsageType.COMP5, UsageType.BINARY})
+
+#: Usages stored as packed decimal (two digits per byte plus a sign nibble).
+PACKED_USAGES = frozenset({UsageType.COMP3, UsageType.PACKED_DECIMAL})
+
+
+class WarningSeverity(Enum):
+    """Warning severity levels."""
+
+    INFO = "info"
+    WARNING = "warning"
+    ERROR = "error"
+
+
+@dataclass
+class ParserWarning:
+    """Structured warning with context."""
+
+    severity: WarningSeverity
+    message: str
+    line_number: int | None = None
+    field_name: str | None = None
+    source_file: Path | None = None
+
+    def __str__(self) -> str:
+        if self.line_number is not None:
+            context = f"{self.source_file or '<source>'}:{self.line_number}"
+        else:
+            context = str(self.source_file or "<source>")
+        return f"[{self.severity.value.upper()}] {context}: {self.message}"
+
+
+@dataclass
+class CobolField:
+    """Represents a COBOL data field.
+
+    ``byte_length`` is the total storage of the field, including all of its
+    occurrences when the field has an OCCURS clause. ``byte_offset`` is the
+    offset of the first occurrence from the start of the record.
+    """
+
+    # Core attributes
+    level: int
+    name: str
+    picture_string: str = ""  # Original PIC clause (e.g., "S9(5)V99")
+    picture_category: PictureCategory | None = None
+    usage: UsageType = UsageType.DISPLAY
+
+    # Size attributes
+    display_length: int = 0  # Character/display length
+    byte_offset: int = 0  # Byte offset in record
+    byte_length: int = 0  # Actual bytes in storage (all occurrences)
+
+    # Numeric attributes
+    is_signed: bool = False  # Has S in picture
+    decimal_places: int = 0  # Digits after V (implied decimal)
+
+    # Array attributes
+    occurs: int | None = None  # Simple OCCURS count
+    occurs_min: int | None = None  # For OCCURS DEPENDING ON
+    occurs_max: int | None = None  # For OCCURS DEPENDING ON
+    occurs_depending_on: str | None = None  # Field name for ODO
+
+    # Relationship attributes
+    redefines: str | None = None  # Name of field being redefined
+    redefines_field: CobolField | None = field(default=None, repr=False, compare=False)
+    parent: CobolField | None = field(default=None, repr=False, compare=False)
+    children: list[CobolField] = field(default_factory=list)
+
+    # Storage attributes
+    sign_separate: bool = False  # SIGN LEADING/TRAILING SEPARATE
+    sign_leading: bool = False  # SIGN LEADING
+    synchronized: bool = False  # SYNCHRONIZED/SYNC
+    justified_right: bool = False  # JUSTIFIED RIGHT
+    encoding: str = "cp1252"  # Encoding for alphanumeric fields
+
+    def is_group(self) -> bool:
+        """Check if this is a group item (has children)."""
+        return len(self.children) > 0
+
+    def is_elementary(self) -> bool:
+        """Check if this is an elementary item (no children)."""
+        return len(self.children) == 0
+
+    def is_filler(self) -> bool:
+        """Check if this is an unnamed (FILLER) item."""
+        return self.name.upper() == "FILLER"
+
+    def occurrence_count(self) -> int:
+        """Number of occurrences reserved in storage.
+
+        Returns ``occurs`` for fixed tables, ``occurs_max`` for OCCURS
+        DEPENDING ON tables and 1 for scalar fields.
+        """
+        if self.occurs:
+            return self.occurs
+        if self.occurs_max:
+            return self.occurs_max
+        return 1
+
+    def item_length(self) -> int:
+        """Byte length of a single occurrence."""
+        return self.byte_length // self.occurrence_count()
+
+    def get_field_path(self) -> str:
+        """Get the full dotted path to this field."""
+        if self.parent:
+            return f"{self.parent.get_field_path()}.{self.name}"
+        return self.name
+
+    def walk(self) -> Iterator[CobolField]:
+        """Iterate over this field and all of its descendants, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class CobolRecord:
+    """Represents a COBOL 01-level (or 77-level) record."""
+
+    name: str
+    level: int  # Typically 01, but can be 77
+    fields: list[CobolField]
+    total_length: int  # Total record length in bytes
+    warnings: list[ParserWarning] = field(default_factory=list)
+    _field_index: FieldIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _accessors: dict[str, FieldAccessor] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _plan: LayoutPlan | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def field_index(self) -> FieldIndex:
+        """Index of the record's fields by simple and qualified name.
+
+        Built on first use.
+        """
+        if self._field_index is None:
+            self._field_index = self._build_field_index()
+        return self._field_index
+
+    def _build_field_index(self) -> FieldIndex:
+        """Build the qualified-name index of the fields."""
+        # An elementary 01 or 77 item is its own single field; its name is
+        # then not also a qualifier.
+        own_field = len(self.fields) == 1 and self.fields[0].name == self.name
+        return FieldIndex(self.fields, None if own_field else self.name)
+
+    def iter_fields(self) -> Iterator[CobolField]:
+        """Iterate over every field of the record, depth first."""
+        for cobol_field in self.fields:
+            yield from cobol_field.walk()
+
+    def get_field(self, name: str) -> CobolField | None:
+        """Get a field by name or qualified name (e.g., 'CODE OF TYPE').
+
+        Raises:
+            AmbiguousReferenceError: If the name matches several fields
+        """
+        index = self._field_index if self._field_index is not None else self.field_index
+        return index.get(name)
+
+    def get_field_by_path(self, path: str) -> CobolField | None:
+        """Get a field by dotted path (e.g., 'TYPE.CODE').
+
+        The path may start below the record, at any unambiguous point.
+        """
+        return self.get_field(path)
+
+    def accessor(self, reference: str) -> FieldAccessor:
+        """Precompiled reader of one field, e.g. ``record.accessor("MONTH-DATA(3).SALES")``.
+
+        Accessors are cached per record; see
+        :mod:`cobol_data_structure.accessors`.
+
+        Raises:
+            KeyError: If no field matches
+            AmbiguousReferenceError: If several fields match
+            IndexError: If a subscript does not fit the enclosing tables
+            ValueError: If the field is a group holding OCCURS DEPENDING ON
+                tables
+        """
+        accessor = self._accessors.get(reference)
+        if accessor is None:
+            from cobol_data_structure.accessors import compile_accessor
+            from cobol_data_structure.layout import compile_layout
+
+            if self._plan is None:
+                self._plan = compile_layout(self)
+            accessor = compile_accessor(self, reference, self._plan)
+            self._accessors[reference] = accessor
+        return accessor
@@ -0,0 +1,189 @@
+"""Qualified data-name resolution for COBOL records.
+
+Copybooks reuse names such as ``CODE`` or ``DATE`` under different groups;
+COBOL tells them apart by qualification. :class:`FieldIndex` resolves a
+reference written either way:
+
+    >>> index = FieldIndex(record.fields, record.name)
+    >>> index.resolve("CODE OF TYPE OF LAST-DATA") is index.resolve("TYPE.CODE")
+    True
+
+Qualifiers may skip levels (``CODE OF LAST-DATA``), as in COBOL. Every
+suffix of every field's qualified name is precomputed, so a reference whose
+qualifiers are consecutive ancestors, or whose last name is unique, is
+resolved with dictionary lookups; other references are checked against the
+fields of that name once and then memoized. FILLER items are never found and
+never act as qualifiers.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cobol_data_structure.models import CobolField
+
+# Qualified name of a field: its own name last, outermost qualifier first
+QualifiedName = tuple[str, ...]
+
+_QUALIFIER_PATTERN = re.compile(r"\s+(?:OF|IN)\s+", re.IGNORECASE)
+
+
+class AmbiguousReferenceError(LookupError):
+    """A data-name reference matches more than one field.
+
+    Attributes:
+        reference: The reference as written
+        candidates: Every field it matches, in source order
+    """
+
+    def __init__(self, reference: str, candidates: Sequence[CobolField]) -> None:
+        paths = ", ".join(candidate.get_field_path() for candidate in candidates)
+        super().__init__(f"{reference} is ambiguous: {paths}")
+        self.reference = reference
+        self.candidates = list(candidates)
+
+
+def parse_reference(reference: str) -> QualifiedName:
+    """Split a data-name reference into names, outermost first.
+
+    ``OF``/``IN`` chains list the innermost name first, dotted paths the
+    outermost; both may be combined.
+
+    Examples:
+        >>> parse_reference("CODE OF TYPE IN LAST-DATA")
+        ('LAST-DATA', 'TYPE', 'CODE')
+        >>> parse_reference("type.code")
+        ('TYPE', 'CODE')
+    """
+    names: list[str] = []
+    for part in reversed(_QUALIFIER_PATTERN.split(reference.strip())):
+        names.extend(name.strip() for name in part.upper().split("."))
+    return tuple(name for name in names if name)
+
+
+class FieldIndex:
+    """Lookup of a record's fields by simple or qualified name.
+
+    Args:
+        fields: Top-level fields of the record
+        record_name: Name of the record, accepted as the outermost
+            qualifier; None when the record is its own single field
+    """
+
+    def __init__(self, fields: Iterable[CobolField], record_name: str | None = None) -> None:
+        base: QualifiedName = (record_name.upper(),) if record_name else ()
+        self._by_name: dict[str, list[tuple[CobolField, QualifiedName]]] = {}
+        self._suffixes: dict[QualifiedName, list[CobolField]] = {}
+        self._memo: dict[str, tuple[CobolField, ...]] = {}
+
+        stack = [(cobol_field, base) for cobol_field in reversed(list(fields))]
+        while stack:
+            cobol_field, qualifiers = stack.pop()
+            if cobol_field.is_filler():
+                name = qualifiers
+            else:
+                name = qualifiers + (cobol_field.name.upper(),)
+                self._by_name.setdefault(name[-1], []).append((cobol_field, name))
+                for start in range(len(name)):
+                    self._suffixes.setdefault(name[start:], []).append(cobol_field)
+            stack.extend((child, name) for child in reversed(cobol_field.children))
+
+    def find(self, reference: str) -> list[CobolField]:
+        """Every field a reference matches, in source order.
+
+        Args:
+            reference: Data name, ``OF``/``IN`` chain or dotted path
+
+        Returns:
+            The matching fields; more than one means the reference is
+            ambiguous
+        """
+        return list(self._matches(reference))
+
+    def get(self, reference: str) -> CobolField | None:
+        """The field a reference names, or None if there is none.
+
+        Raises:
+            AmbiguousReferenceError: If several fields match
+        """
+        matches = self._memo.get(reference)
+        if matches is None:
+            matches = self._matches(reference)
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            raise AmbiguousReferenceError(reference, matches)
+        return None
+
+    def resolve(self, reference: str) -> CobolField:
+        """The one field a reference names.
+
+        Raises:
+            KeyError: If no field matches
+            AmbiguousReferenceError: If several fields match
+        """
+        match = self.get(reference)
+        if match is None:
+            raise KeyError(reference)
+        return match
+
+    def _matches(self, reference: str) -> tuple[CobolField, ...]:
+        """Memoized matches of a reference."""
+        matches = self._memo.get(reference)
+        if matches is None:
+            matches = self._memo[reference] = self._match(parse_reference(reference))
+        return matches
+
+    def _match(self, name: QualifiedName) -> tuple[CobolField, ...]:
+        """Fields whose qualified name ends in ``name[-1]`` and contains the rest in order."""
+        if not name:
+            return ()
+        consecutive = self._suffixes.get(name, [])
+        candidates = self._by_name.get(name[-1], [])
+        if len(consecutive) == len(candidates):
+            # Every field of that name is matched with consecutive qualifiers
+            return tuple(consecutive)
+        return tuple(
+            cobol_field
+            for cobol_field, qualified in candidates
+            if _in_order(name[:-1], qualified[:-1])
+        )
+
+    def duplicates(self) -> dict[str, list[CobolField]]:
+        """Names declared more than once, with their fields in source order."""
+        return {
+            name: [cobol_field for cobol_field, _ in entries]
+            for name, entries in self._by_name.items()
+            if len(entries) > 1
+        }
+
+    def unique_reference(self, target: CobolField) -> str | None:
+        """Shortest ``OF`` reference that resolves to a field.
+
+        Only consecutive qualifiers are tried, innermost first.
+
+        Returns:
+            The reference, or None for FILLER items and fields no
+            qualification singles out
+        """
+        for cobol_field, qualified in self._by_name.get(target.name.upper(), []):
+            if cobol_field is not target:
+                continue
+            for start in range(len(qualified) - 1, -1, -1):
+                reference = " OF ".join(reversed(qualified[start:]))
+                matches = self._matches(reference)
+                if len(matches) == 1 and matches[0] is target:
+                    return reference
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_name.values())
+
+
+def _in_order(qualifiers: QualifiedName, ancestors: QualifiedName) -> bool:
+    """Check that every qualifier appears among the ancestors, in order."""
+    remaining = iter(ancestors)
+    return all(qualifier in remaining for qualifier in qualifiers)
@@ -0,0 +1,322 @@
+"""Optional NumPy backend for bulk, column-wise record decoding.
+
+A record layout maps onto a NumPy structured dtype with one sub-field per
+plan leaf at its byte offset, so a buffer or file of N fixed-length records
+can be viewed as an array without copying and decoded one column at a time:
+
+- PIC X / PIC A: ``S<n>`` byte strings, decoded to ``str`` arrays
+- COMP / BINARY: big-endian ``>i<n>`` / ``>u<n>`` integers
+- COMP-1 / COMP-2: big-endian ``>f4`` / ``>f8`` floats
+- COMP-3 and DISPLAY numerics: ``(u1, n)`` byte matrices converted with
+  vectorised digit arithmetic
+
+Numeric columns are returned as masked arrays; entries whose bytes are not
+valid for their format are masked, mirroring the None values produced by
+:meth:`~cobol_data_structure.layout.LayoutPlan.decode`.
+
+Requires the ``numpy`` extra: ``pip install cobol-data-structure[numpy]``.
+
+Example:
+    >>> records = view_records(last_data, data)
+    >>> columns = decode_columns(last_data, records, fields=["TYPE.CODE"])
+    >>> columns["TYPE.CODE"].sum()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "The NumPy backend requires numpy: pip install 'cobol-data-structure[numpy]'"
+    ) from e
+
+from cobol_data_structure import decoders
+from cobol_data_structure.layout import (
+    CODEC_ALPHANUMERIC,
+    CODEC_BINARY,
+    CODEC_FLOAT,
+    CODEC_OVERPUNCH,
+    CODEC_PACKED,
+    CODEC_ZONED,
+    DECODERS,
+    LayoutPlan,
+    as_plan,
+)
+from cobol_data_structure.models import CobolRecord
+from cobol_data_structure.packed import _INT64_DIGITS, decode_packed_array
+from cobol_data_structure.zoned import OVERPUNCH_TABLES, decode_zoned_array
+
+Layout = Union[CobolRecord, LayoutPlan]
+
+
+def record_dtype(layout: Layout) -> np.dtype:
+    """Build the structured dtype of one record.
+
+    Args:
+        layout: Record or compiled plan
+
+    Returns:
+        Structured dtype whose field names are the plan paths and whose
+        itemsize is the record length
+
+    Raises:
+        ValueError: If the layout has OCCURS DEPENDING ON tables
+    """
+    plan = as_plan(layout)
+    if plan.variable is not None:
+        raise ValueError(
+            f"Record {plan.record_name} has OCCURS DEPENDING ON tables; "
+            "NumPy decoding needs a fixed layout"
+        )
+    formats: list[Any] = []
+    for length, codec, params in zip(plan.lengths, plan.codecs, plan.params):
+        formats.append(_leaf_format(length, codec, params))
+    return np.dtype(
+        {
+            "names": list(plan.paths),
+            "formats": formats,
+            "offsets": list(plan.offsets),
+            "itemsize": plan.record_length,
+        }
+    )
+
+
+def _leaf_format(length: int, codec: int, params: Any) -> Any:
+    """NumPy format of one leaf."""
+    if codec == CODEC_ALPHANUMERIC:
+        return f"S{length}"
+    if codec in (CODEC_PACKED, CODEC_ZONED, CODEC_OVERPUNCH):
+        return ("u1", (length,))
+    if codec == CODEC_BINARY and length in (2, 4, 8):
+        return f">{'i' if params[0] else 'u'}{length}"
+    if codec == CODEC_FLOAT and length in (4, 8):
+        return f">f{length}"
+    return f"V{length}"
+
+
+def view_records(layout: Layout, data: Any) -> np.ndarray:
+    """View a buffer of consecutive fixed-length records as a record array.
+
+    No bytes are copied; the array shares memory with ``data``. Trailing
+    bytes that do not form a whole record are ignored.
+
+    Args:
+        layout: Record or compiled plan
+        data: ``bytes``, ``bytearray``, ``memoryview``, ``mmap`` or any
+            object supporting the buffer protocol
+
+    Returns:
+        1-D structured array with one element per record
+    """
+    dtype = record_dtype(layout)
+    count = len(memoryview(data).cast("B")) // dtype.itemsize
+    return np.frombuffer(data, dtype=dtype, count=count)
+
+
+def map_records(layout: Layout, path: str | Path) -> np.ndarray:
+    """Memory-map a fixed-length (RECFM=F) record file as a record array.
+
+    Args:
+        layout: Record or compiled plan
+        path: Data file path
+
+    Returns:
+        Read-only 1-D structured memmap with one element per record
+    """
+    dtype = record_dtype(layout)
+    count = Path(path).stat().st_size // dtype.itemsize
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+
+def decode_columns(
+    layout: Layout, records: np.ndarray, fields: Iterable[str] | None = None
+) -> dict[str, np.ndarray]:
+    """Decode record array columns into plain NumPy arrays.
+
+    Args:
+        layout: Record or compiled plan the array was built with
+        records: Array returned by :func:`view_records` or :func:`map_records`
+        fields: Plan paths to decode; all leaves when None
+
+    Returns:
+        Mapping of path to decoded column. Text columns are ``str`` arrays,
+        binary and float columns plain arrays and packed/zoned columns masked
+        arrays; implied decimals turn integer columns into float64.
+
+    Raises:
+        KeyError: If a requested field is not a plan path
+    """
+    plan = as_plan(layout)
+    index = plan.index
+    wanted = plan.paths if fields is None else list(fields)
+    columns: dict[str, np.ndarray] = {}
+    for path in wanted:
+        i = index[path]
+        columns[path] = _decode_column(records[path], plan.codecs[i], plan.params[i])
+    return columns
+
+
+def _decode_column(column: np.ndarray, codec: int, params: Any) -> np.ndarray:
+    """Decode one column according to its codec."""
+    if codec == CODEC_ALPHANUMERIC:
+        return _text_column(column, params[0])
+    if codec == CODEC_PACKED:
+        return packed_column(column, params[0])
+    if codec == CODEC_ZONED:
+        return zoned_column(column, params[0], params[1])
+    if codec == CODEC_OVERPUNCH:
+        return _overpunch_column(column, *params)
+    if codec == CODEC_BINARY and column.dtype.kind in "iu":
+        return _scale(column.astype(column.dtype.newbyteorder("=")), params[1])
+    if codec == CODEC_FLOAT and column.dtype.kind == "f":
+        return column.astype(np.float64)
+    # National, raw and odd-length binary items: element-wise decoding
+    decoder = DECODERS[codec]
+    values = np.empty(column.shape[0], dtype=object)
+    for i, raw in enumerate(column):
+        try:
+            values[i] = decoder(bytes(raw), *params)
+        except ValueError:
+            values[i] = None
+    return values
+
+
+def _text_column(column: np.ndarray, encoding: str) -> np.ndarray:
+    """Decode an ``S<n>`` column, dropping trailing whitespace.
+
+    Single-byte encodings are decoded with a 256-entry code point table and
+    viewed as a ``U<n>`` array, with no per-value Python work. Rows holding
+    bytes the table cannot map (undefined or multi-byte sequences) are
+    decoded one by one. NumPy strings drop trailing NUL characters, so a
+    value ending in NULs decodes without them.
+    """
+    width = column.dtype.itemsize
+    if width == 0 or column.shape[0] == 0:
+        return column.astype(f"U{max(width, 1)}")
+    code_points, whitespace = _charmap(encoding)
+    raw = np.ascontiguousarray(column).view(np.uint8).reshape(-1, width)
+    chars = code_points[raw]
+    # Trailing positions that are all whitespace become NULs and are dropped
+    trailing = np.logical_and.accumulate(whitespace[raw][:, ::-1], axis=1)[:, ::-1]
+    chars[trailing] = 0
+    bad_rows = (chars < 0).any(axis=1)
+    text = chars.astype(np.uint32).view(f"U{width}").reshape(-1)
+    if not bad_rows.any():
+        return text
+    values = text.astype(object)
+    for i in np.flatnonzero(bad_rows):
+        try:
+            values[i] = decoders.decode_alphanumeric(column[i], encoding)
+        except ValueError:
+            values[i] = None
+    return values
+
+
+@cache
+def _charmap(encoding: str) -> tuple[np.ndarray, np.ndarray]:
+    """Code point and whitespace tables for the bytes of an encoding.
+
+    Bytes that do not decode to exactly one character on their own map to
+    code point -1.
+    """
+    code_points = np.full(256, -1, dtype=np.int64)
+    whitespace = np.zeros(256, dtype=bool)
+    for byte in range(256):
+        try:
+            char = bytes([byte]).decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        if len(char) == 1:
+            code_points[byte] = ord(char)
+            whitespace[byte] = char.isspace()
+    return code_points, whitespace
+
+
+def _scale(values: np.ndarray, decimal_places: int) -> np.ndarray:
+    """Apply an implied decimal point to an integer column."""
+    if decimal_places > 0:
+        scaled: np.ndarray = values / 10**decimal_places
+        return scaled
+    return values
+
+
+def packed_column(column: np.ndarray, decimal_places: int) -> np.ma.MaskedArray:
+    """Decode an (N, n) uint8 matrix of COMP-3 values.
+
+    See :func:`cobol_data_structure.packed.decode_packed_array`.
+    """
+    return decode_packed_array(column, decimal_places)
+
+
+def _overpunch_column(
+    column: np.ndarray, convention: str, is_signed: bool, decimal_places: int, sign_leading: bool
+) -> np.ma.MaskedArray:
+    """Decode an overpunched zoned column.
+
+    As in :func:`~cobol_data_structure.zoned.decode_overpunch`, ASCII rows
+    that are not valid overpunch are decoded as text.
+    """
+    table = OVERPUNCH_TABLES[convention]
+    values = decode_zoned_array(column, table, is_signed, decimal_places, sign_leading)
+    if convention == "ascii" and values.mask.any():
+        rows = np.flatnonzero(values.mask)
+        values[rows] = zoned_column(column[rows], is_signed, decimal_places)
+    return values
+
+
+def zoned_column(column: np.ndarray, is_signed: bool, decimal_places: int) -> np.ma.MaskedArray:
+    """Decode an (N, n) uint8 matrix of DISPLAY numeric values (ASCII digits).
+
+    Accepts exactly what :func:`decoders.decode_zoned` accepts: surrounding
+    whitespace, a leading ``+``/``-``, or a trailing one that may follow
+    whitespace (``"4 +"``), and single underscores between digits, as
+    ``int()`` does.
+
+    Args:
+        column: One row of text bytes per value
+        is_signed: Whether negative values are allowed
+        decimal_places: Implied decimal places
+
+    Returns:
+        Masked array of values; values that are not numbers are masked
+    """
+    is_digit = (column >= 0x30) & (column <= 0x39)
+    # ASCII whitespace for int(); str.strip() also removes 0x1C-0x1F
+    int_space = (column == 0x20) | ((column >= 0x09) & (column <= 0x0D))
+    is_space = int_space | ((column >= 0x1C) & (column <= 0x1F))
+    is_sign = (column == 0x2B) | (column == 0x2D)
+    between_digits = np.zeros_like(is_digit)
+    between_digits[:, 1:-1] = is_digit[:, :-2] & is_digit[:, 2:]
+    is_number = is_digit | ((column == 0x5F) & between_digits)
+    content = ~is_space
+    # First and last non-whitespace characters, which may be the sign
+    first = np.argmax(content, axis=1)[:, None]
+    last = column.shape[1] - 1 - np.argmax(content[:, ::-1], axis=1)[:, None]
+    positions = np.arange(column.shape[1])
+    leading = (is_sign & (positions == first)).any(axis=1)
+    trailing = (is_sign & (positions == last)).any(axis=1)
+    # The number between the signs; whitespace may only end it, before a trailing sign
+    body = (positions >= first + leading[:, None]) & (positions <= last - trailing[:, None])
+    after_space = np.cumsum(is_space & body, axis=1) > 0
+    valid = (body <= (is_number | int_space)).all(axis=1) & (is_digit & body).any(axis=1)
+    valid &= ~(is_number & body & after_space).any(axis=1) & ~(leading & trailing)
+    negative = ((column == 0x2D) & ((positions == first) | (positions == last))).any(axis=1)
+    if not is_signed:
+        valid &= ~negative
+    # Place value of each digit: 10 ** (number of digits to its right)
+    exponents: np.ndarray = np.cumsum(is_digit[:, ::-1], axis=1)[:, ::-1] - is_digit
+    digits = np.where(is_digit, column - 0x30, 0)
+    if column.shape[1] <= _INT64_DIGITS:
+        values = (digits.astype(np.int64) * 10 ** exponents.astype(np.int64)).sum(axis=1)
+    else:
+        values = (digits.astype(object) * 10 ** exponents.astype(object)).sum(axis=1)
+    values = np.where(negative, -values, values)
+    return np.ma.masked_array(_scale(values, decimal_places), mask=~valid)
@@ -0,0 +1,136 @@
+"""OCCURS DEPENDING ON layouts: which counters govern which tables.
+
+A record with ``OCCURS ... DEPENDING ON`` tables is compiled for the
+maximum number of occurrences of every table. :func:`compile_layout
+<cobol_data_structure.layout.compile_layout>` then attaches a
+:class:`VariableLayout` describing how the actual counts change that
+layout:
+
+* every ODO table, and every table containing one, is a *variable table*.
+  Per record it shrinks by ``E = maximum * static item length - count *
+  actual item length`` bytes in total and by ``D = static item length -
+  actual item length`` bytes per occurrence;
+* every leaf moves back by the ``E`` of each variable table stored before
+  it and by ``subscript - 1`` times the ``D`` of each variable table it is
+  in. These are the leaf's *shifts*, fixed at compile time;
+* every leaf inside ODO tables exists only while its subscripts are within
+  the counts. These are the leaf's *guards*.
+
+Decoding a record reads the counters, computes ``E`` and ``D`` for each
+variable table (innermost first, a few integer operations each) and applies
+the shifts; see :meth:`LayoutPlan.resolve
+<cobol_data_structure.layout.LayoutPlan.resolve>`.
+
+Counters must be numeric elementary items outside any table whose position
+does not itself depend on a count, as COBOL requires.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cached_property
+
+# (term, coefficient): term 2 * t is E of variable table t, 2 * t + 1 its D
+Shift = tuple[int, int]
+
+# (dependency index, 1-based subscript)
+Guard = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class OccursDependency:
+    """An OCCURS DEPENDING ON table and the counter governing it.
+
+    Attributes:
+        table: Dotted path of the table, without subscripts
+        counter: Plan path of the counter
+        minimum: Fewest occurrences allowed
+        maximum: Most occurrences, as compiled
+    """
+
+    table: str
+    counter: str
+    minimum: int
+    maximum: int
+
+
+@dataclass(frozen=True)
+class VariableTable:
+    """A table whose size depends on counts.
+
+    Attributes:
+        path: Dotted path of the table, without subscripts
+        item_length: Length of one occurrence at maximum counts
+        maximum: Occurrences at maximum counts
+        dependency: Index of its :class:`OccursDependency`; -1 for a fixed
+            table that contains ODO tables
+        children: Variable tables directly inside one occurrence
+    """
+
+    path: str
+    item_length: int
+    maximum: int
+    dependency: int
+    children: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class VariableLayout:
+    """How OCCURS DEPENDING ON counts move the leaves of a plan.
+
+    Attributes:
+        dependencies: The ODO tables, inner tables before those containing them
+        counters: Leaf index of each dependency's counter
+        tables: Variable tables, each listed after its children
+        shifts: Per leaf, the terms it moves back by
+        guards: Per leaf, the counts it needs to exist
+        tail: Variable tables stored before the end of the record
+        anchors: Per field path (without subscripts) whose position depends
+            on counts, the variable tables stored before its first
+            occurrence
+        strides: Per :class:`~cobol_data_structure.layout.StrideTable`
+            path, its first leaf and the variable table of each of its
+            dimensions (-1 for fixed ones)
+    """
+
+    dependencies: tuple[OccursDependency, ...]
+    counters: tuple[int, ...]
+    tables: tuple[VariableTable, ...]
+    shifts: tuple[tuple[Shift, ...], ...]
+    guards: tuple[tuple[Guard, ...], ...]
+    tail: tuple[int, ...]
+    anchors: dict[str, tuple[int, ...]] = field(default_factory=dict, compare=False)
+    strides: dict[str, tuple[int, tuple[int, ...]]] = field(default_factory=dict, compare=False)
+
+    @cached_property
+    def table_ids(self) -> dict[str, int]:
+        """Index of each variable table by path."""
+        return {table.path: i for i, table in enumerate(self.tables)}
+
+    def terms(self, counts: Sequence[int]) -> list[int]:
+        """``E`` and ``D`` of every variable table for one set of counts.
+
+        Args:
+            counts: Occurrences of each dependency's table
+
+        Returns:
+            ``[E0, D0, E1, D1, ...]`` indexed as in :data:`Shift`
+        """
+        terms = [0] * (2 * len(self.tables))
+        for i, table in enumerate(self.tables):
+            length = table.item_length
+            for child in table.children:
+                length -= terms[2 * child]
+            count = counts[table.dependency] if table.dependency >= 0 else table.maximum
+            terms[2 * i] = table.maximum * table.item_length - count * length
+            terms[2 * i + 1] = table.item_length - length
+        return terms
+
+    def item_length(self, table: int, terms: Sequence[int]) -> int:
+        """Actual length of one occurrence of a variable table."""
+        return self.tables[table].item_length - terms[2 * table + 1]
+
+    def shrinkage(self, terms: Sequence[int]) -> int:
+        """Bytes the record is shorter than at maximum counts."""
+        return sum(terms[2 * table] for table in self.tail)
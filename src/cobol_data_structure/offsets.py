@@ -0,0 +1,188 @@
+"""Byte length and offset calculation for COBOL fields."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from cobol_data_structure.models import (
+    BINARY_USAGES,
+    PACKED_USAGES,
+    CobolField,
+    ParserWarning,
+    PictureCategory,
+    UsageType,
+    WarningSeverity,
+)
+from cobol_data_structure.picture import PictureInfo
+
+
+class OffsetCalculator:
+    """Calculate byte offsets for COBOL fields, handling REDEFINES and SYNC."""
+
+    def __init__(self) -> None:
+        self.warnings: list[ParserWarning] = []
+
+    def calculate_byte_length(self, field: CobolField, pic_info: PictureInfo | None) -> int:
+        """Calculate the byte length of one occurrence of an elementary field.
+
+        Args:
+            field: The COBOL field
+            pic_info: Parsed picture information
+
+        Returns:
+            Byte length in storage
+        """
+        if field.usage == UsageType.COMP1:
+            return 4  # Single-precision float
+        if field.usage == UsageType.COMP2:
+            return 8  # Double-precision float
+
+        if not pic_info:
+            return 0
+
+        digits = pic_info.display_length
+
+        if field.usage in PACKED_USAGES:
+            # Two digits per byte plus the sign nibble, rounded up
+            return digits // 2 + 1
+
+        if field.usage in BINARY_USAGES:
+            if digits <= 4:
+                return 2  # Halfword
+            if digits <= 9:
+                return 4  # Fullword
+            return 8  # Doubleword
+
+        if pic_info.category == PictureCategory.NATIONAL:
+            return digits * 2
+
+        # DISPLAY: one byte per character, plus the separate sign byte
+        if pic_info.is_signed and field.sign_separate:
+            return digits + 1
+        return digits
+
+    def calculate_offsets(
+        self, fields: Sequence[CobolField], base_offset: int = 0
+    ) -> dict[str, int]:
+        """Calculate offsets for a list of sibling fields, handling REDEFINES.
+
+        Group lengths are derived from their children; elementary fields must
+        already carry their ``byte_length`` (including OCCURS).
+
+        Args:
+            fields: List of fields at the same level
+            base_offset: Starting offset
+
+        Returns:
+            Dictionary mapping field names to their offsets
+        """
+        offsets: dict[str, int] = {}
+        siblings: dict[str, CobolField] = {}
+        max_offset = base_offset
+
+        for cobol_field in fields:
+            if cobol_field.redefines:
+                redefined = siblings.get(cobol_field.redefines)
+                if redefined is not None:
+                    cobol_field.byte_offset = redefined.byte_offset
+                else:
+                    self.warnings.append(
+                        ParserWarning(
+                            severity=WarningSeverity.WARNING,
+                            message=f"REDEFINES target {cobol_field.redefines} not found "
+                            "among preceding siblings",
+                            field_name=cobol_field.name,
+                        )
+                    )
+                    cobol_field.byte_offset = max_offset
+            else:
+                cobol_field.byte_offset = self.align(cobol_field, max_offset)
+
+            if cobol_field.children:
+                offsets.update(
+                    self.calculate_offsets(cobol_field.children, cobol_field.byte_offset)
+                )
+                item_length = (
+                    max(child.byte_offset + child.byte_length for child in cobol_field.children)
+                    - cobol_field.byte_offset
+                )
+                cobol_field.byte_length = item_length * cobol_field.occurrence_count()
+
+            max_offset = max(max_offset, cobol_field.byte_offset + cobol_field.byte_length)
+            offsets[cobol_field.name] = cobol_field.byte_offset
+            siblings[cobol_field.name] = cobol_field
+
+        return offsets
+
+    def align(self, field: CobolField, offset: int) -> int:
+        """Apply SYNCHRONIZED alignment to a binary or floating point item.
+
+        Args:
+            field: Field that would start at ``offset``
+            offset: Next free offset
+
+        Returns:
+            The field's offset, moved up to its natural boundary if needed
+        """
+        if not field.synchronized or field.is_group():
+            return offset
+        if field.usage not in BINARY_USAGES and field.usage not in (
+            UsageType.COMP1,
+            UsageType.COMP2,
+        ):
+            return offset
+        boundary = field.item_length()
+        remainder = offset % boundary if boundary else 0
+        return offset + (boundary - remainder if remainder else 0)
+
+    def resolve_redefines(self, fields: Sequence[CobolField]) -> None:
+        """Resolve REDEFINES references to actual field objects.
+
+        Args:
+            fields: List of sibling fields to process (recursively)
+        """
+        siblings: dict[str, CobolField] = {}
+        for cobol_field in fields:
+            if cobol_field.redefines:
+                cobol_field.redefines_field = siblings.get(cobol_field.redefines)
+            siblings[cobol_field.name] = cobol_field
+            if cobol_field.children:
+                self.resolve_redefines(cobol_field.children)
+
+    def get_offset_for_occurrence(self, field: CobolField, indices: Sequence[int]) -> int:
+        """Calculate the offset of a field inside (nested) OCCURS tables.
+
+        Args:
+            field: The target field
+            indices: One 1-based subscript per enclosing OCCURS, outermost first
+                (the field's own OCCURS, if any, is the last subscript)
+
+        Returns:
+            Byte offset of the selected occurrence
+
+        Raises:
+            IndexError: If the number of subscripts or a subscript is invalid
+        """
+        tables = [node for node in _ancestry(field) if node.occurs or node.occurs_max]
+        if len(indices) != len(tables):
+            raise IndexError(f"{field.name} needs {len(tables)} subscript(s), got {len(indices)}")
+        offset = field.byte_offset
+        for table, index in zip(tables, indices):
+            if not 1 <= index <= table.occurrence_count():
+                raise IndexError(
+                    f"Subscript {index} out of range 1..{table.occurrence_count()} "
+                    f"for {table.name}"
+                )
+            offset += (index - 1) * table.item_length()
+        return offset
+
+
+def _ancestry(field: CobolField) -> list[CobolField]:
+    """Return the chain of fields from the outermost ancestor down to ``field``."""
+    chain: list[CobolField] = []
+    node: CobolField | None = field
+    while node is not None:
+        chain.append(node)
+        node = node.parent
+    chain.reverse()
+    return chain
@@ -0,0 +1,258 @@
+"""Packed-decimal (COMP-3) codec for single values and whole columns.
+
+A packed field of ``n`` bytes holds ``2n - 1`` decimal digits, one per
+nibble, followed by a sign nibble: 0xD or 0xB negative, 0xC, 0xA, 0xE
+positive and 0xF unsigned. Every path in this module validates signs with
+the same :data:`PACKED_SIGN` table, so the pure-Python and NumPy paths
+accept and reject exactly the same bytes.
+
+Pure-Python path
+    The sign and the last digit come from one lookup in a 256-entry
+    last-byte table; the remaining digits are converted by ``bytes.hex()``
+    and ``int()``, which run in C and reject non-decimal nibbles. (A per-byte
+    loop over a byte-to-digit-pair table measured about 40% slower.)
+
+NumPy path
+    An (N, n) ``uint8`` matrix is split into nibbles with array shifts and
+    masks and the digits are accumulated with an int64 dot product (Python
+    integers beyond 18 digits). Requires the ``numpy`` extra.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import ROUND_HALF_EVEN, Decimal
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy import ndarray
+    from numpy.ma import MaskedArray
+
+Number = Union[int, float]
+
+NEGATIVE_SIGNS = frozenset({0x0B, 0x0D})
+POSITIVE_SIGNS = frozenset({0x0A, 0x0C, 0x0E, 0x0F})
+
+#: Sign nibble validity, indexed by nibble: 1 positive, -1 negative, 0 invalid.
+SIGN_NIBBLE: tuple[int, ...] = tuple(
+    -1 if nibble in NEGATIVE_SIGNS else 1 if nibble in POSITIVE_SIGNS else 0 for nibble in range(16)
+)
+
+#: Sign of a packed value, indexed by its last byte (see :data:`SIGN_NIBBLE`).
+PACKED_SIGN: tuple[int, ...] = tuple(SIGN_NIBBLE[byte & 0x0F] for byte in range(256))
+
+# Largest number of decimal digits that always fits in an int64.
+_INT64_DIGITS = 18
+
+
+def packed_length(digits: int) -> int:
+    """Number of bytes needed to store ``digits`` digits plus the sign nibble."""
+    return digits // 2 + 1
+
+
+def _scale(value: Any, decimal_places: int) -> Any:
+    """Apply an implied decimal point."""
+    if decimal_places > 0:
+        return value / (10**decimal_places)
+    return value
+
+
+def unpack(data: bytes) -> int:
+    """Decode the unscaled integer held in a packed field.
+
+    Args:
+        data: Packed bytes (``bytes``, ``bytearray`` or ``memoryview``)
+
+    Raises:
+        ValueError: If a digit nibble is above 9 or the sign nibble is invalid
+    """
+    if not data:
+        return 0
+    sign = PACKED_SIGN[data[-1]]
+    if not sign:
+        raise ValueError(f"Invalid COMP-3 sign nibble: {hex(data[-1] & 0x0F)}")
+    try:
+        return sign * int(data.hex()[:-1])
+    except ValueError:
+        raise ValueError(f"Invalid COMP-3 digit nibble in {data.hex()}") from None
+
+
+def decode_packed_column(values: Iterable[bytes], decimal_places: int = 0) -> list[Number | None]:
+    """Decode a column of packed values; invalid values become None.
+
+    Args:
+        values: Packed byte strings, one per value
+        decimal_places: Implied decimal places
+
+    Returns:
+        Decoded values in input order
+    """
+    divisor = 10**decimal_places if decimal_places > 0 else 0
+    signs = PACKED_SIGN
+    result: list[Number | None] = []
+    append = result.append
+    for data in values:
+        sign = signs[data[-1]] if data else 1
+        if not sign:
+            append(None)
+            continue
+        try:
+            value = sign * int(data.hex()[:-1] or "0")
+        except ValueError:
+            append(None)
+            continue
+        append(value / divisor if divisor else value)
+    return result
+
+
+def _scaled_int(value: int | float | Decimal, decimal_places: int) -> int:
+    """Convert a value to an integer count of the smallest decimal unit."""
+    scale: int = 10**decimal_places
+    if isinstance(value, int):
+        return value * scale
+    if isinstance(value, Decimal):
+        return int(value.scaleb(decimal_places).to_integral_value(ROUND_HALF_EVEN))
+    return round(value * scale)
+
+
+def encode_packed(
+    value: int | float | Decimal,
+    length: int,
+    decimal_places: int = 0,
+    signed: bool = True,
+) -> bytes:
+    """Encode one value as a packed field.
+
+    Args:
+        value: Number to encode; floats are rounded to ``decimal_places``
+        length: Field length in bytes
+        decimal_places: Implied decimal places
+        signed: Use a C/D sign nibble; unsigned fields use F
+
+    Returns:
+        ``length`` packed bytes
+
+    Raises:
+        ValueError: If the value does not fit, or is negative for an
+            unsigned field
+    """
+    scaled = _scaled_int(value, decimal_places)
+    if scaled < 0 and not signed:
+        raise ValueError(f"Negative value {value} for unsigned packed field")
+    digits = 2 * length - 1
+    text = str(abs(scaled))
+    if len(text) > digits:
+        raise ValueError(f"Value {value} does not fit in {digits} packed digits")
+    sign = "d" if scaled < 0 else "c" if signed else "f"
+    return bytes.fromhex(text.rjust(digits, "0") + sign)
+
+
+def encode_packed_column(
+    values: Iterable[int | float | Decimal],
+    length: int,
+    decimal_places: int = 0,
+    signed: bool = True,
+) -> bytes:
+    """Encode a column of values as contiguous packed fields of ``length`` bytes."""
+    return b"".join(encode_packed(value, length, decimal_places, signed) for value in values)
+
+
+def _numpy() -> Any:
+    """Import NumPy for the array paths."""
+    try:
+        import numpy
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "The NumPy packed-decimal path requires numpy: "
+            "pip install 'cobol-data-structure[numpy]'"
+        ) from e
+    return numpy
+
+
+def digits_to_int(digits: np.ndarray) -> np.ndarray:
+    """Combine an (N, d) matrix of decimal digits into integers.
+
+    Uses int64 arithmetic for up to 18 digits and Python integers (object
+    arrays) beyond that.
+    """
+    np = _numpy()
+    width = digits.shape[1]
+    if width <= _INT64_DIGITS:
+        powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+        combined: ndarray = digits.astype(np.int64) @ powers
+        return combined
+    result: ndarray = np.zeros(digits.shape[0], dtype=object)
+    for start in range(0, width, _INT64_DIGITS):
+        chunk = digits[:, start : start + _INT64_DIGITS]
+        result = result * (10 ** chunk.shape[1]) + digits_to_int(chunk).astype(object)
+    return result
+
+
+def decode_packed_array(matrix: np.ndarray, decimal_places: int = 0) -> np.ma.MaskedArray:
+    """Decode an (N, n) ``uint8`` matrix holding one packed value per row.
+
+    Args:
+        matrix: Packed bytes, one row per value
+        decimal_places: Implied decimal places
+
+    Returns:
+        Masked array of values; rows with an invalid digit or sign nibble
+        are masked
+    """
+    np = _numpy()
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    high = matrix >> 4
+    low = matrix & 0x0F
+    count, width = matrix.shape
+    digits = np.empty((count, 2 * width - 1), dtype=np.uint8)
+    digits[:, 0::2] = high
+    digits[:, 1::2] = low[:, :-1]
+    sign = np.asarray(SIGN_NIBBLE, dtype=np.int8)[low[:, -1]]
+    valid = (digits <= 9).all(axis=1) & (sign != 0)
+    values = digits_to_int(np.where(digits <= 9, digits, 0))
+    values = np.where(sign < 0, -values, values)
+    decoded: MaskedArray = np.ma.masked_array(_scale(values, decimal_places), mask=~valid)
+    return decoded
+
+
+def encode_packed_array(
+    values: Any, length: int, decimal_places: int = 0, signed: bool = True
+) -> np.ndarray:
+    """Encode an array of values as an (N, length) ``uint8`` packed matrix.
+
+    Args:
+        values: Integers or floats; floats are rounded to ``decimal_places``
+        length: Field length in bytes (at most 9, i.e. 17 digits)
+        decimal_places: Implied decimal places
+        signed: Use C/D sign nibbles; unsigned fields use F
+
+    Returns:
+        One row of packed bytes per value
+
+    Raises:
+        ValueError: If a value does not fit, or is negative for an unsigned
+            field
+    """
+    np = _numpy()
+    digits = 2 * length - 1
+    if digits > _INT64_DIGITS:
+        raise ValueError("encode_packed_array supports at most 17 digits; use encode_packed")
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        scaled = np.rint(values * 10.0**decimal_places).astype(np.int64)
+    else:
+        scaled = values.astype(np.int64) * np.int64(10**decimal_places)
+    negative = scaled < 0
+    if negative.any() and not signed:
+        raise ValueError("Negative value for unsigned packed field")
+    magnitude = np.abs(scaled)
+    if (magnitude >= 10**digits).any():
+        raise ValueError(f"Value does not fit in {digits} packed digits")
+
+    nibbles = np.empty((scaled.shape[0], 2 * length), dtype=np.uint8)
+    for position in range(digits - 1, -1, -1):
+        magnitude, nibbles[:, position] = np.divmod(magnitude, 10)
+    nibbles[:, -1] = np.where(negative, 0x0D, 0x0C if signed else 0x0F)
+    encoded: ndarray = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+    return encoded
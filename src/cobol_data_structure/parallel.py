@@ -0,0 +1,240 @@
+"""Decode large record files on several processes.
+
+:func:`decode_file_parallel` splits a file into record-aligned chunks and
+decodes them in a :class:`~concurrent.futures.ProcessPoolExecutor`. Each
+worker receives the compiled :class:`~cobol_data_structure.layout.LayoutPlan`
+once, when it starts; each task then carries only the byte range of its
+chunk, and the worker reads the bytes itself. The parent only reads a
+variable-length file once, to index its records.
+
+Example:
+    >>> for chunk in decode_file_parallel(plan, "extract.dat", workers=16):
+    ...     for values in chunk.records:
+    ...         ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from cobol_data_structure.binary_parser import ParsedValue
+from cobol_data_structure.codegen import GeneratedDecoder, compile_decoder
+from cobol_data_structure.layout import LayoutPlan, as_plan
+from cobol_data_structure.models import CobolRecord
+from cobol_data_structure.readers import VariableRecordReader
+
+Record = Optional[dict[str, ParsedValue]]
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    """Outcome of decoding one chunk of a file.
+
+    Attributes:
+        index: Chunk number, in file order
+        first_record: Number of the chunk's first record in the file
+        count: Number of records in the chunk
+        records: Decoded records, or None when written to ``output``. A
+            record shorter than the layout, or than its OCCURS DEPENDING ON
+            counts call for, decodes to None, as does one with an invalid
+            counter.
+        output: JSON Lines file holding the records, if any
+    """
+
+    index: int
+    first_record: int
+    count: int
+    records: list[Record] | None = None
+    output: Path | None = None
+
+
+@dataclass(frozen=True)
+class _ChunkTask:
+    """What a worker needs to decode one chunk: a byte range and its records.
+
+    Fixed-length chunks set ``record_length``; variable-length chunks list
+    record offsets (relative to ``start``) and lengths.
+    """
+
+    index: int
+    first_record: int
+    start: int
+    stop: int
+    record_length: int = 0
+    offsets: array | None = None
+    lengths: array | None = None
+
+
+def decode_file_parallel(
+    layout: CobolRecord | LayoutPlan,
+    path: str | Path,
+    workers: int | None = None,
+    chunk_records: int = 10000,
+    ordered: bool = True,
+    blocked: bool | None = None,
+    output_dir: str | Path | None = None,
+) -> Iterator[ChunkResult]:
+    """Decode every record of a file using a pool of worker processes.
+
+    At most two chunks per worker are in flight at any time, so memory use
+    stays bounded however large the file is.
+
+    Args:
+        layout: Record or compiled plan
+        path: Data file path
+        workers: Number of processes; ``os.cpu_count()`` when None
+        chunk_records: Records per chunk
+        ordered: Yield chunks in file order; otherwise as they complete
+        blocked: None for fixed-length records (RECFM=F); True for
+            variable-length records with block descriptor words (RECFM=V/VB);
+            False for variable-length records with RDWs only
+        output_dir: Write each chunk to ``chunk-<index>.jsonl`` in this
+            directory instead of returning the records
+
+    Returns:
+        Iterator of chunk results
+    """
+    plan = as_plan(layout)
+    path = Path(path)
+    if chunk_records <= 0:
+        raise ValueError(f"Invalid chunk size: {chunk_records}")
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = _plan_chunks(plan, path, chunk_records, blocked)
+    return _run(plan, path, tasks, workers or os.cpu_count() or 1, ordered, output_dir)
+
+
+def _plan_chunks(
+    plan: LayoutPlan, path: Path, chunk_records: int, blocked: bool | None
+) -> Iterator[_ChunkTask]:
+    """Split a file into record-aligned chunk tasks."""
+    if blocked is None:
+        length = plan.record_length
+        count = path.stat().st_size // length
+        for index, first in enumerate(range(0, count, chunk_records)):
+            last = min(first + chunk_records, count)
+            yield _ChunkTask(index, first, first * length, last * length, record_length=length)
+        return
+
+    with VariableRecordReader(path, blocked=blocked) as reader:
+        offsets, lengths = reader.record_index()
+        for index, first in enumerate(range(0, len(offsets), chunk_records)):
+            last = min(first + chunk_records, len(offsets))
+            start = offsets[first]
+            yield _ChunkTask(
+                index,
+                first,
+                start,
+                offsets[last - 1] + lengths[last - 1],
+                offsets=array("q", (offset - start for offset in offsets[first:last])),
+                lengths=lengths[first:last],
+            )
+
+
+def _run(
+    plan: LayoutPlan,
+    path: Path,
+    tasks: Iterator[_ChunkTask],
+    workers: int,
+    ordered: bool,
+    output_dir: Path | None,
+) -> Iterator[ChunkResult]:
+    """Submit chunk tasks with a bounded window and yield their results."""
+    window = 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plan, path, output_dir)
+    ) as executor:
+        pending: deque[Future] = deque()  # Submission order; only kept when ordered
+        running: set[Future] = set()
+        for task in tasks:
+            future = executor.submit(_decode_chunk, task)
+            if ordered:
+                pending.append(future)
+            running.add(future)
+            while len(running) >= window:
+                yield from _collect(pending, running, ordered)
+        while running:
+            yield from _collect(pending, running, ordered)
+
+
+def _collect(pending: deque[Future], running: set[Future], ordered: bool) -> Iterator[ChunkResult]:
+    """Yield the next available result(s), in order if requested."""
+    if ordered:
+        future = pending.popleft()
+        running.discard(future)
+        yield future.result()
+        return
+    done, _ = wait(running, return_when=FIRST_COMPLETED)
+    for future in done:
+        running.discard(future)
+        yield future.result()
+
+
+@dataclass(frozen=True)
+class _Worker:
+    """What every task of a worker process shares, set up once per process."""
+
+    plan: LayoutPlan
+    decoder: GeneratedDecoder
+    path: Path
+    output_dir: Path | None
+
+
+_WORKER: _Worker | None = None
+
+
+def _init_worker(plan: LayoutPlan, path: Path, output_dir: Path | None) -> None:
+    """Worker initializer: keep the plan and compile its decoder."""
+    global _WORKER
+    _WORKER = _Worker(plan, compile_decoder(plan), path, output_dir)
+
+
+def _decode_chunk(task: _ChunkTask) -> ChunkResult:
+    """Worker: read one chunk's byte range and decode its records."""
+    worker = _WORKER
+    assert worker is not None, "worker process not initialized"
+    decoder, path, output_dir = worker.decoder, worker.path, worker.output_dir
+    with open(path, "rb") as handle:
+        handle.seek(task.start)
+        data = handle.read(task.stop - task.start)
+
+    records: list[Record] = []
+    if task.record_length:
+        length = task.record_length
+        records = [
+            _decode_record(decoder, data[i : i + length]) for i in range(0, len(data), length)
+        ]
+    else:
+        assert task.offsets is not None and task.lengths is not None
+        minimum = worker.plan.min_length
+        for offset, length in zip(task.offsets, task.lengths):
+            record = None
+            if length >= minimum:
+                record = _decode_record(decoder, data[offset : offset + length])
+            records.append(record)
+
+    if output_dir is None:
+        return ChunkResult(task.index, task.first_record, len(records), records=records)
+    output = output_dir / f"chunk-{task.index:06d}.jsonl"
+    with open(output, "w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False))
+            handle.write("\n")
+    return ChunkResult(task.index, task.first_record, len(records), output=output)
+
+
+def _decode_record(decoder: GeneratedDecoder, data: bytes) -> Record:
+    """Decode one record; None when its OCCURS DEPENDING ON counts are unusable."""
+    try:
+        return decoder(data)
+    except ValueError:
+        return None  # Counts call for more bytes than the record has, or are invalid
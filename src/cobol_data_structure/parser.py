@@ -0,0 +1,454 @@
+"""Parser that turns COBOL DATA DIVISION source into :class:`CobolRecord` trees."""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from cobol_data_structure.models import (
+    CobolField,
+    CobolRecord,
+    ParserWarning,
+    PictureCategory,
+    UsageType,
+    WarningSeverity,
+)
+from cobol_data_structure.offsets import OffsetCalculator
+from cobol_data_structure.picture import PictureClauseParser
+from cobol_data_structure.tokenizer import LineTokenizer, TokenInfo
+
+# Source entry: (line number of its first line, entry text)
+Entry = tuple[int, str]
+
+_DIVISION_PATTERN = re.compile(r"^\s*(DATA|PROCEDURE)\s+DIVISION\b", re.IGNORECASE)
+
+_USAGE_MAP = {
+    "COMP": UsageType.COMP,
+    "COMP1": UsageType.COMP1,
+    "COMP2": UsageType.COMP2,
+    "COMP3": UsageType.COMP3,
+    "COMP4": UsageType.COMP4,
+    "COMP5": UsageType.COMP5,
+    "COMPUTATIONAL": UsageType.COMP,
+    "COMPUTATIONAL1": UsageType.COMP1,
+    "COMPUTATIONAL2": UsageType.COMP2,
+    "COMPUTATIONAL3": UsageType.COMP3,
+    "COMPUTATIONAL4": UsageType.COMP4,
+    "COMPUTATIONAL5": UsageType.COMP5,
+    "BINARY": UsageType.BINARY,
+    "PACKEDDECIMAL": UsageType.PACKED_DECIMAL,
+    "DISPLAY": UsageType.DISPLAY,
+}
+
+
+class CobolParser:
+    """Parse COBOL DATA DIVISION into structured format.
+
+    Args:
+        encoding: Encoding assigned to alphanumeric fields of parsed records
+        max_depth: Maximum nesting depth accepted before raising ``ValueError``;
+            no limit when None. Records are built without recursion, so any
+            depth COBOL level numbers allow is safe.
+    """
+
+    def __init__(self, encoding: str = "cp1252", max_depth: int | None = None) -> None:
+        self.encoding = encoding
+        self.max_depth = max_depth
+        self.tokenizer = LineTokenizer()
+        self.picture_parser = PictureClauseParser()
+        self._shapes: dict[tuple[str, str | None, bool], _FieldShape] = {}
+        self.offset_calculator = OffsetCalculator()
+        self.warnings: list[ParserWarning] = []
+
+    def parse(self, source: str) -> list[CobolRecord]:
+        """Parse COBOL source and return list of records.
+
+        The source may be a complete program (only its DATA DIVISION is read)
+        or a bare copybook.
+
+        Args:
+            source: COBOL source code as string
+
+        Returns:
+            List of CobolRecord objects
+        """
+        return self.parse_lines(self.data_lines(source))
+
+    def entries(self, lines: list[tuple[int, str]]) -> list[Entry]:
+        """Join DATA DIVISION lines into data description entries.
+
+        Args:
+            lines: Lines as returned by :meth:`data_lines`
+
+        Returns:
+            List of (first line number, entry text) pairs, comments removed
+        """
+        return self._join_entries(lines)
+
+    def parse_lines(self, lines: list[tuple[int, str]]) -> list[CobolRecord]:
+        """Parse DATA DIVISION lines into records.
+
+        Args:
+            lines: Lines as returned by :meth:`data_lines`, or a run of them
+                that starts at an entry
+
+        Returns:
+            List of CobolRecord objects
+        """
+        return self._build_records(self.tokenizer.scan(lines))
+
+    def _build_records(self, tokens: list[tuple[int, TokenInfo]]) -> list[CobolRecord]:
+        """Build records from tokenized entries, collecting tokenizer warnings.
+
+        Args:
+            tokens: (line number, token) pairs in source order
+
+        Returns:
+            List of CobolRecord objects
+        """
+        self.warnings.extend(self.tokenizer.warnings)
+        self.tokenizer.warnings = []
+
+        records: list[CobolRecord] = []
+        # Open fields, the record's root first. A field is closed (its group
+        # length computed) when a token at its level or above arrives.
+        stack: list[_Frame] = []
+        for line_number, token in tokens:
+            level = token["level"]
+            while stack and (level <= stack[-1].field.level or level == 77):
+                record = self._close(stack)
+                if record is not None:
+                    records.append(record)
+
+            if not stack:
+                if level not in (1, 77):
+                    self.warnings.append(
+                        ParserWarning(
+                            severity=WarningSeverity.WARNING,
+                            message=f"Level {level:02d} item outside of a record",
+                            line_number=line_number,
+                            field_name=token.get("name"),
+                        )
+                    )
+                    continue
+                warnings_start = len(self.warnings)
+                root = self._create_field(token, line_number)
+                stack.append(_Frame(root, 0, line_number, warnings_start))
+                if level == 77:
+                    # Level 77 items have no subordinate entries
+                    record = self._close(stack)
+                    assert record is not None
+                    records.append(record)
+                continue
+
+            frame = stack[-1]
+            if frame.child_level is None:
+                frame.child_level = level
+            elif level < frame.child_level:
+                # Level between the parent and its first child: keep it as a sibling
+                self.warnings.append(
+                    ParserWarning(
+                        severity=WarningSeverity.WARNING,
+                        message=f"Inconsistent level {level:02d} under {frame.field.name}",
+                        line_number=line_number,
+                        field_name=token.get("name"),
+                    )
+                )
+                frame.child_level = level
+            if self.max_depth is not None and len(stack) > self.max_depth:
+                raise ValueError(f"Nesting too deep (>{self.max_depth}) at line {line_number}")
+
+            field = self._create_field(token, line_number)
+            if len(stack) > 1:
+                field.parent = frame.field
+            frame.field.children.append(field)
+            self._place(field, frame, line_number)
+            stack.append(_Frame(field, field.byte_offset, line_number))
+
+        while stack:
+            record = self._close(stack)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def parse_file(self, path: str | Path, encoding: str = "utf-8") -> list[CobolRecord]:
+        """Parse a COBOL source file.
+
+        Args:
+            path: Path to a program or copybook
+            encoding: Text encoding of the source file
+
+        Returns:
+            List of CobolRecord objects
+        """
+        source_path = Path(path)
+        with source_path.open(encoding=encoding, newline=None) as handle:
+            source = handle.read()
+        start = len(self.warnings)
+        records = self.parse(source)
+        for warning in self.warnings[start:]:
+            warning.source_file = source_path
+        return records
+
+    def _place(self, field: CobolField, frame: _Frame, line_number: int) -> None:
+        """Set the offset of a field opened inside ``frame``, resolving REDEFINES.
+
+        Its preceding siblings are closed, so their offsets and lengths are
+        final. SYNCHRONIZED items are aligned when they are closed.
+        """
+        if field.redefines:
+            redefined = frame.siblings.get(field.redefines)
+            field.redefines_field = redefined
+            if redefined is not None:
+                field.byte_offset = redefined.byte_offset
+                return
+            self.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.WARNING,
+                    message=f"REDEFINES target {field.redefines} not found "
+                    "among preceding siblings",
+                    line_number=line_number,
+                    field_name=field.name,
+                )
+            )
+            field.byte_offset = frame.end
+        else:
+            # SYNC alignment waits for _close, once the field is known to be elementary
+            field.byte_offset = frame.end
+
+    def _close(self, stack: list[_Frame]) -> CobolRecord | None:
+        """Close the innermost open field; return its record if it is a root.
+
+        A group's length is derived from its children, which are all closed,
+        an elementary item is aligned if SYNCHRONIZED, and the field's extent
+        is added to its parent's.
+        """
+        frame = stack.pop()
+        field = frame.field
+        if not field.children and not field.redefines:
+            field.byte_offset = self.offset_calculator.align(field, field.byte_offset)
+        if field.children:
+            if field.picture_string:
+                self.warnings.append(
+                    ParserWarning(
+                        severity=WarningSeverity.WARNING,
+                        message=f"Group item {field.name} has a PICTURE clause; ignored",
+                        line_number=frame.line_number,
+                        field_name=field.name,
+                    )
+                )
+            if stack:
+                field.byte_length = (frame.end - field.byte_offset) * field.occurrence_count()
+
+        if stack:
+            parent = stack[-1]
+            parent.end = max(parent.end, field.byte_offset + field.byte_length)
+            parent.siblings[field.name] = field
+            return None
+
+        # A record with children exposes them as top-level fields; an
+        # elementary 01 or a 77 item is its own single field.
+        if field.children:
+            fields = field.children
+            total_length = frame.end
+        else:
+            self._place(field, _Frame(field, 0, frame.line_number), frame.line_number)
+            fields = [field]
+            total_length = field.byte_offset + field.byte_length
+        return CobolRecord(
+            name=field.name,
+            level=field.level,
+            fields=fields,
+            total_length=total_length,
+            warnings=list(self.warnings[frame.warnings_start :]),
+        )
+
+    def _create_field(self, token: TokenInfo, line_number: int) -> CobolField:
+        """Create a CobolField from a token.
+
+        Args:
+            token: Parsed token information
+            line_number: Source line number
+
+        Returns:
+            CobolField object with its elementary byte length set
+        """
+        picture = token.get("picture") or ""
+        sign_separate = token.get("sign_separate", False)
+        key = (picture, token.get("usage"), sign_separate)
+        shape = self._shapes.get(key)
+        if shape is None:
+            shape = self._shapes[key] = self._field_shape(*key)
+        if picture and not shape.valid_picture:
+            self.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.WARNING,
+                    message=f"Unsupported PICTURE clause {picture}",
+                    line_number=line_number,
+                    field_name=token.get("name"),
+                )
+            )
+
+        field = CobolField(
+            level=token["level"],
+            name=token.get("name", "FILLER"),
+            picture_string=picture,
+            picture_category=shape.category,
+            usage=shape.usage,
+            display_length=shape.display_length,
+            is_signed=shape.is_signed,
+            decimal_places=shape.decimal_places,
+            occurs=token.get("occurs"),
+            occurs_min=token.get("occurs_min"),
+            occurs_max=token.get("occurs_max"),
+            occurs_depending_on=token.get("occurs_depending_on"),
+            redefines=token.get("redefines"),
+            sign_separate=sign_separate,
+            sign_leading=token.get("sign_leading", False),
+            synchronized=token.get("synchronized", False),
+            justified_right=token.get("justified_right", False),
+            encoding=self.encoding,
+        )
+        field.byte_length = shape.item_length * field.occurrence_count()
+        return field
+
+    def _field_shape(
+        self, picture: str, usage_text: str | None, sign_separate: bool
+    ) -> _FieldShape:
+        """Attributes of an elementary item that follow from its PICTURE and USAGE.
+
+        Copybooks repeat a handful of these combinations, so
+        :meth:`_create_field` computes each once per parser.
+        """
+        pic_info = self.picture_parser.parse(picture) if picture else None
+
+        usage = UsageType.DISPLAY
+        if usage_text:
+            usage = _USAGE_MAP.get(usage_text.upper().replace("-", ""), UsageType.DISPLAY)
+
+        category = pic_info.category if pic_info else None
+        is_signed = pic_info.is_signed if pic_info else False
+        if usage in (UsageType.COMP1, UsageType.COMP2):
+            # Floating point items have no PICTURE and are always signed
+            category = PictureCategory.NUMERIC
+            is_signed = True
+
+        probe = CobolField(level=0, name="", usage=usage, sign_separate=sign_separate)
+        return _FieldShape(
+            valid_picture=pic_info is not None,
+            category=category,
+            usage=usage,
+            display_length=pic_info.display_length if pic_info else 0,
+            is_signed=is_signed,
+            decimal_places=pic_info.decimal_places if pic_info else 0,
+            item_length=self.offset_calculator.calculate_byte_length(probe, pic_info),
+        )
+
+    def data_lines(self, source: str) -> list[tuple[int, str]]:
+        """Extract DATA DIVISION lines from COBOL source.
+
+        Comments and fixed-format sequence/identification areas are removed.
+        If the source has no DATA DIVISION header (a copybook), every line is
+        returned.
+
+        Args:
+            source: Complete COBOL source code
+
+        Returns:
+            List of (1-based line number, code text) pairs
+        """
+        lines = [
+            (number, self.tokenizer.remove_comments(line))
+            for number, line in enumerate(source.splitlines(), start=1)
+        ]
+        has_header = any(
+            (m := _DIVISION_PATTERN.match(text)) and m.group(1).upper() == "DATA"
+            for _, text in lines
+        )
+        if not has_header:
+            return lines
+
+        data_lines = []
+        in_data_division = False
+        for number, text in lines:
+            match = _DIVISION_PATTERN.match(text)
+            if match:
+                if match.group(1).upper() == "PROCEDURE":
+                    break
+                in_data_division = True
+                continue
+            if in_data_division:
+                data_lines.append((number, text))
+        return data_lines
+
+    def _join_entries(self, lines: list[tuple[int, str]]) -> list[Entry]:
+        """Join source lines into period-terminated data description entries.
+
+        Section and paragraph headers (``WORKING-STORAGE SECTION.``,
+        ``FD ...``) are dropped.
+
+        Args:
+            lines: (line number, code text) pairs
+
+        Returns:
+            List of (first line number, entry text) pairs
+        """
+        entries: list[Entry] = []
+        buffer: list[str] = []
+        first_line = 0
+        for number, text in lines:
+            if not text.strip():
+                continue
+            if not buffer:
+                first_line = number
+            buffer.append(text.strip())
+            if _ends_entry(text):
+                entries.append((first_line, " ".join(buffer)))
+                buffer = []
+        if buffer:
+            entries.append((first_line, " ".join(buffer)))
+        return [entry for entry in entries if entry[1][:1].isdigit()]
+
+
+class _FieldShape(NamedTuple):
+    """PICTURE- and USAGE-derived attributes shared by similar items."""
+
+    valid_picture: bool
+    category: PictureCategory | None
+    usage: UsageType
+    display_length: int
+    is_signed: bool
+    decimal_places: int
+    item_length: int
+
+
+class _Frame:
+    """An open field while records are built: a stack entry.
+
+    Attributes:
+        field: The field
+        end: End offset of its closed children so far (its offset at first)
+        child_level: Level number of its first child
+        siblings: Its closed children, by name, for REDEFINES
+        line_number: Source line of the field
+        warnings_start: For a record root, where its warnings begin
+    """
+
+    __slots__ = ("field", "end", "child_level", "siblings", "line_number", "warnings_start")
+
+    def __init__(
+        self, field: CobolField, end: int, line_number: int, warnings_start: int = 0
+    ) -> None:
+        self.field = field
+        self.end = end
+        self.child_level: int | None = None
+        self.siblings: dict[str, CobolField] = {}
+        self.line_number = line_number
+        self.warnings_start = warnings_start
+
+
+def _ends_entry(text: str) -> bool:
+    """Check if a line terminates an entry (a period outside quoted literals)."""
+    stripped = re.sub(r"'[^']*'|\"[^\"]*\"", "", text).rstrip()
+    return stripped.endswith(".")
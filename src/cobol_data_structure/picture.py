@@ -0,0 +1,106 @@
+"""Parser for COBOL PICTURE clauses."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from cobol_data_structure.models import PictureCategory
+
+# One picture symbol with an optional repeat count, e.g. ``9(5)``, ``X``, ``CR``.
+_SYMBOL_PATTERN = re.compile(r"(CR|DB|[AXN9SVPZB0*$+\-.,/E])(?:\((\d+)\))?")
+
+_EDIT_SYMBOLS = frozenset("ZB0*$+-.,/E") | {"CR", "DB"}
+
+
+@dataclass
+class PictureInfo:
+    """Parsed information from a PICTURE clause."""
+
+    category: PictureCategory
+    display_length: int
+    is_signed: bool = False
+    decimal_places: int = 0
+    scaling_positions: int = 0  # P in picture (multiply/divide by 10^n)
+
+
+class PictureClauseParser:
+    """Parse COBOL PICTURE clauses into structured information."""
+
+    def parse(self, picture_string: str) -> PictureInfo | None:
+        """Parse a PICTURE clause.
+
+        Args:
+            picture_string: The picture string (e.g., "S9(5)V99", "X(10)")
+
+        Returns:
+            PictureInfo object with parsed details, or None if invalid
+
+        Examples:
+            >>> PictureClauseParser().parse("S9(7)V99").display_length
+            9
+        """
+        symbols = self._expand(picture_string)
+        if not symbols:
+            return None
+
+        kinds = {symbol for symbol, _ in symbols}
+        is_signed = "S" in kinds
+        decimal_places = 0
+        seen_v = False
+        display_length = 0
+        for symbol, count in symbols:
+            if symbol == "V":
+                seen_v = True
+            elif symbol in ("S", "P"):
+                continue
+            else:
+                display_length += count * (2 if symbol in ("CR", "DB") else 1)
+                if seen_v and symbol == "9":
+                    decimal_places += count
+        scaling = sum(count for symbol, count in symbols if symbol == "P")
+
+        if kinds & _EDIT_SYMBOLS:
+            category = PictureCategory.NUMERIC_EDITED
+        elif "N" in kinds:
+            if kinds - {"N"}:
+                return None
+            category = PictureCategory.NATIONAL
+        elif "X" in kinds or ("A" in kinds and "9" in kinds):
+            if kinds - {"X", "A", "9"}:
+                return None
+            category = PictureCategory.ALPHANUMERIC
+        elif kinds == {"A"}:
+            category = PictureCategory.ALPHABETIC
+        elif "9" in kinds:
+            category = PictureCategory.NUMERIC
+        else:
+            return None
+
+        return PictureInfo(
+            category=category,
+            display_length=display_length,
+            is_signed=is_signed and category == PictureCategory.NUMERIC,
+            decimal_places=decimal_places if category == PictureCategory.NUMERIC else 0,
+            scaling_positions=scaling,
+        )
+
+    def _expand(self, picture_string: str) -> list[tuple[str, int]]:
+        """Split a picture string into ``(symbol, repeat_count)`` pairs.
+
+        Returns an empty list if the string contains unknown symbols.
+
+        Examples:
+            >>> PictureClauseParser()._expand("S9(3)V99")
+            [('S', 1), ('9', 3), ('V', 1), ('9', 1), ('9', 1)]
+        """
+        text = picture_string.strip().upper()
+        symbols: list[tuple[str, int]] = []
+        position = 0
+        while position < len(text):
+            match = _SYMBOL_PATTERN.match(text, position)
+            if not match:
+                return []
+            symbols.append((match.group(1), int(match.group(2) or 1)))
+            position = match.end()
+        return symbols
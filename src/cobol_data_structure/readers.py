@@ -0,0 +1,299 @@
+"""Zero-copy readers for record data files.
+
+:class:`FixedRecordReader` memory-maps a RECFM=F file (back-to-back records
+of one fixed length) and exposes it as a sequence of records. Indexing and
+iteration return ``memoryview`` slices of the mapping, so no record is read
+or copied until its bytes are used, and files larger than memory can be
+processed:
+
+    >>> with FixedRecordReader("extract.dat", plan) as reader:
+    ...     print(len(reader), RecordView(plan, reader[-1]).NAME)
+    ...     for record in reader[1000:2000]:
+    ...         values = decoder(record)
+
+:class:`VariableRecordReader` streams RECFM=V/VB files, where every record
+is preceded by a record descriptor word (RDW) and, in blocked files, every
+block by a block descriptor word (BDW). It can record the offset of every
+record on its first pass, after which it supports ``len()`` and random
+access like the fixed-length reader.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from cobol_data_structure.layout import LayoutPlan
+from cobol_data_structure.models import CobolRecord
+
+T = TypeVar("T")
+
+Layout = Union[CobolRecord, LayoutPlan, int]
+
+
+def _map_file(path: Path) -> tuple[BinaryIO, mmap.mmap | None]:
+    """Open a file and map it read-only; empty files cannot be mapped (None)."""
+    handle = open(path, "rb")
+    if not os.fstat(handle.fileno()).st_size:
+        return handle, None
+    try:
+        return handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except BaseException:
+        handle.close()
+        raise
+
+
+def _unmap_file(buffer: memoryview, handle: BinaryIO, mapping: mmap.mmap | None) -> None:
+    """Release a mapping and close its file."""
+    buffer.release()
+    if mapping is not None:
+        mapping.close()
+    handle.close()
+
+
+def record_length_of(layout: Layout) -> int:
+    """Record length of a record, a compiled plan or a plain length."""
+    if isinstance(layout, int):
+        length = layout
+    elif isinstance(layout, LayoutPlan):
+        length = layout.record_length
+    else:
+        length = layout.total_length
+    if length <= 0:
+        raise ValueError(f"Invalid record length: {length}")
+    return length
+
+
+class RecordSequence(Sequence[memoryview]):
+    """Fixed-length records laid out back to back in a buffer.
+
+    Items are ``memoryview`` slices of the buffer; slicing the sequence
+    returns another :class:`RecordSequence` over the same buffer.
+    """
+
+    def __init__(self, buffer: Any, layout: Layout, records: range | None = None) -> None:
+        """Wrap a buffer without copying it.
+
+        Args:
+            buffer: Object supporting the buffer protocol
+            layout: Record, compiled plan or record length in bytes
+            records: Record numbers exposed by this sequence; all whole
+                records in the buffer when None
+        """
+        self._buffer = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        self.record_length = record_length_of(layout)
+        if records is None:
+            records = range(len(self._buffer) // self.record_length)
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @overload
+    def __getitem__(self, index: int) -> memoryview: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RecordSequence: ...
+
+    def __getitem__(self, index: int | slice) -> memoryview | RecordSequence:
+        if isinstance(index, slice):
+            return RecordSequence(self._buffer, self.record_length, self._records[index])
+        start = self._records[index] * self.record_length
+        return self._buffer[start : start + self.record_length]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        buffer = self._buffer
+        length = self.record_length
+        records = self._records
+        if records.step == 1:
+            for start in range(records.start * length, records.stop * length, length):
+                yield buffer[start : start + length]
+        else:
+            for record in records:
+                yield buffer[record * length : (record + 1) * length]
+
+    def decode(self, decoder: Callable[[memoryview], T]) -> Iterator[T]:
+        """Apply a decoder (e.g. ``plan.decode``) to every record, lazily."""
+        return map(decoder, self)
+
+
+class FixedRecordReader(RecordSequence):
+    """Memory-mapped RECFM=F record file.
+
+    Bytes after the last whole record are ignored; their count is
+    :attr:`trailing_bytes`. Close the reader (or use it as a context manager)
+    once no record views are referenced any more: an ``mmap`` cannot be
+    closed while memoryviews of it exist.
+    """
+
+    def __init__(self, path: str | Path, layout: Layout) -> None:
+        """Open and map a data file read-only.
+
+        Args:
+            path: Data file path
+            layout: Record, compiled plan or record length in bytes
+        """
+        self.path = Path(path)
+        self._file, self._mmap = _map_file(self.path)
+        super().__init__(self._mmap if self._mmap is not None else b"", layout)
+        self.trailing_bytes = len(self._buffer) % self.record_length
+
+    def close(self) -> None:
+        """Unmap and close the file.
+
+        Raises:
+            BufferError: If record memoryviews are still referenced
+        """
+        _unmap_file(self._buffer, self._file, self._mmap)
+
+    def __enter__(self) -> FixedRecordReader:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class VariableRecordReader:
+    """Memory-mapped RECFM=V / VB record file.
+
+    A descriptor word is four bytes: a big-endian halfword length that
+    includes the descriptor itself, then two bytes that must be zero (in an
+    RDW they flag the segments of spanned records, which are not supported).
+    A BDW with its high bit set is an extended BDW whose 31 low bits hold
+    the block length. Files transferred with only RDWs (no BDWs) are read
+    with ``blocked=False``.
+
+    Iterating yields the record data (without its RDW) as ``memoryview``
+    slices of the mapping.
+    """
+
+    def __init__(self, path: str | Path, blocked: bool = True, build_index: bool = False) -> None:
+        """Open and map a data file read-only.
+
+        Args:
+            path: Data file path
+            blocked: Records are grouped in blocks with BDWs
+            build_index: Record the offset and length of every record during
+                the first complete iteration
+        """
+        self.path = Path(path)
+        self.blocked = blocked
+        self._file, self._mmap = _map_file(self.path)
+        self._buffer = memoryview(self._mmap if self._mmap is not None else b"")
+        self._build_index = build_index
+        self._index: tuple[array, array] | None = None  # Record offsets and lengths
+
+    @property
+    def indexed(self) -> bool:
+        """Whether the record offset index has been built."""
+        return self._index is not None
+
+    def __iter__(self) -> Iterator[memoryview]:
+        buffer = self._buffer
+        if self._index is not None:
+            for start, length in zip(*self._index):
+                yield buffer[start : start + length]
+            return
+        if not self._build_index:
+            for start, end in self._scan():
+                yield buffer[start:end]
+            return
+        offsets = array("q")
+        lengths = array("l")
+        for start, end in self._scan():
+            offsets.append(start)
+            lengths.append(end - start)
+            yield buffer[start:end]
+        self._index = offsets, lengths
+
+    def _scan(self) -> Iterator[tuple[int, int]]:
+        """Yield the ``(start, end)`` data range of every record."""
+        buffer = self._buffer
+        size = len(buffer)
+        if not self.blocked:
+            yield from _scan_records(buffer, 0, size)
+            return
+        position = 0
+        while position < size:
+            if position + 4 > size:
+                raise ValueError(f"Truncated block descriptor at offset {position}")
+            if buffer[position] & 0x80:
+                length = int.from_bytes(buffer[position : position + 4], "big") & 0x7FFFFFFF
+            else:
+                if buffer[position + 2] or buffer[position + 3]:
+                    raise ValueError(f"Invalid block descriptor at offset {position}")
+                length = (buffer[position] << 8) | buffer[position + 1]
+            if length < 4 or position + length > size:
+                raise ValueError(f"Invalid block length {length} at offset {position}")
+            yield from _scan_records(buffer, position + 4, position + length)
+            position += length
+
+    def build_index(self) -> None:
+        """Scan the whole file once and record every record's position."""
+        self.record_index()
+
+    def record_index(self) -> tuple[array, array]:
+        """Data offsets and lengths of all records; builds the index if needed."""
+        if self._index is None:
+            self._build_index = True
+            for _ in self:
+                pass
+        assert self._index is not None
+        return self._index
+
+    def __len__(self) -> int:
+        """Number of records; builds the index if needed."""
+        offsets, _ = self.record_index()
+        return len(offsets)
+
+    def __getitem__(self, index: int) -> memoryview:
+        """Record ``index`` (negative from the end); builds the index if needed."""
+        offsets, lengths = self.record_index()
+        start = offsets[index]
+        return self._buffer[start : start + lengths[index]]
+
+    def decode(self, decoder: Callable[[memoryview], T]) -> Iterator[T]:
+        """Apply a decoder to every record, lazily."""
+        return map(decoder, self)
+
+    def close(self) -> None:
+        """Unmap and close the file.
+
+        Raises:
+            BufferError: If record memoryviews are still referenced
+        """
+        _unmap_file(self._buffer, self._file, self._mmap)
+
+    def __enter__(self) -> VariableRecordReader:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _scan_records(buffer: memoryview, position: int, end: int) -> Iterator[tuple[int, int]]:
+    """Yield the ``(start, end)`` data range of every RDW record in a range."""
+    while position < end:
+        if position + 4 > end:
+            raise ValueError(f"Truncated record descriptor at offset {position}")
+        length = (buffer[position] << 8) | buffer[position + 1]
+        if buffer[position + 2] or buffer[position + 3]:
+            raise ValueError(
+                f"Spanned or invalid record descriptor at offset {position}; "
+                "RECFM=VBS is not supported"
+            )
+        if length < 4 or position + length > end:
+            raise ValueError(f"Invalid record length {length} at offset {position}")
+        yield position + 4, position + length
+        position += length
@@ -0,0 +1,312 @@
+"""Thread-safe, bounded registry of compiled layouts.
+
+Long-running services decode many record types. :class:`LayoutRegistry`
+parses each copybook record once, keeps its
+:class:`~cobol_data_structure.layout.LayoutPlan` and evicts the least
+recently used plans when a count or size budget is exceeded:
+
+    >>> registry = LayoutRegistry(max_entries=500)
+    >>> plan = registry.get("copybooks/LASTDATA.cpy", "LAST-DATA")
+    >>> registry.stats().hit_rate
+
+A copybook is identified by a file path or by a name registered with
+:meth:`LayoutRegistry.add_source`. Concurrent requests for the same missing
+layout parse it once; the other threads wait for that result.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from cobol_data_structure.cache import ParseCache
+from cobol_data_structure.copybooks import CopybookResolver, copybook_stamp
+from cobol_data_structure.layout import LayoutPlan, compile_layout
+from cobol_data_structure.models import CobolRecord
+from cobol_data_structure.parser import CobolParser
+
+# (copybook, record name or "", encoding)
+RegistryKey = tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class EntryStats:
+    """Usage counters of one registry entry.
+
+    Attributes:
+        key: Registry key ``(copybook, record name, encoding)``
+        hits: Lookups served from the registry
+        loads: Times the layout was parsed and compiled since it entered
+            the registry (once, plus once per change of its file)
+        size: Number of plan leaves, the entry's weight in ``max_size``
+    """
+
+    key: RegistryKey
+    hits: int
+    loads: int
+    size: int
+
+
+@dataclass(frozen=True)
+class RegistryStats:
+    """Registry-wide counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without parsing."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    """A registered layout and its counters."""
+
+    __slots__ = ("record", "plan", "stamp", "hits", "loads")
+
+    def __init__(self, record: CobolRecord, plan: LayoutPlan, stamp: Any, loads: int) -> None:
+        self.record = record
+        self.plan = plan
+        self.stamp = stamp
+        self.hits = 0
+        self.loads = loads
+
+
+class LayoutRegistry:
+    """LRU map of (copybook, record name, options) to compiled layouts.
+
+    Args:
+        max_entries: Most layouts kept
+        max_size: Most plan leaves kept over all layouts; no size limit
+            when None. Counts OCCURS expansions, so large tables weigh more.
+        check_files: Reload a file-backed layout when the file's size or
+            modification time changes
+        cache: Optional on-disk cache consulted before parsing
+        resolver: Expands COPY statements before parsing. Layouts are then
+            also reloaded when an included copybook changes, and
+            :meth:`invalidate` reaches every source including a copybook.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_size: int | None = None,
+        check_files: bool = True,
+        cache: ParseCache | None = None,
+        resolver: CopybookResolver | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.check_files = check_files
+        self.cache = cache
+        self.resolver = resolver
+        self._resolver_lock = threading.Lock()
+        self._entries: OrderedDict[RegistryKey, _Entry] = OrderedDict()
+        self._pending: dict[RegistryKey, Future[_Entry]] = {}
+        self._sources: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def add_source(self, name: str, source: str) -> None:
+        """Register in-memory COBOL source under a copybook name.
+
+        Layouts already loaded from an earlier source of that name are
+        dropped.
+        """
+        name = name.upper()
+        with self._lock:
+            self._sources[name] = source
+            for key in [key for key in self._entries if key[0] == name]:
+                self._remove(key)
+
+    def get(
+        self,
+        copybook: str | Path,
+        record_name: str | None = None,
+        encoding: str = "cp1252",
+    ) -> LayoutPlan:
+        """Compiled layout of a record, parsing the copybook if needed.
+
+        Args:
+            copybook: Source file path, or a name given to :meth:`add_source`
+            record_name: 01/77-level record to use; the first when None
+            encoding: Encoding of alphanumeric fields
+
+        Returns:
+            The compiled plan
+
+        Raises:
+            KeyError: If the copybook has no such record
+            FileNotFoundError: If the copybook is neither registered nor a file
+        """
+        return self._lookup(copybook, record_name, encoding).plan
+
+    def record(
+        self,
+        copybook: str | Path,
+        record_name: str | None = None,
+        encoding: str = "cp1252",
+    ) -> CobolRecord:
+        """Parsed record behind :meth:`get`; see there for the arguments."""
+        return self._lookup(copybook, record_name, encoding).record
+
+    def _lookup(self, copybook: str | Path, record_name: str | None, encoding: str) -> _Entry:
+        """Return the entry for a key, loading it once across threads."""
+        name = self._copybook_id(copybook)
+        key: RegistryKey = (name, (record_name or "").upper(), encoding)
+        stamp = self._stamp(name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self._hits += 1
+                return entry
+            self._misses += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                future: Future[_Entry] = Future()
+                self._pending[key] = future
+                loads = entry.loads + 1 if entry is not None else 1
+        if pending is not None:
+            return pending.result()
+        try:
+            record, plan = self._load(name, key[1], encoding)
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(e)
+            raise
+        if self.resolver is not None:
+            stamp = self._stamp(name)  # Now covering the copybooks just included
+        entry = _Entry(record, plan, stamp, loads)
+        with self._lock:
+            del self._pending[key]
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(plan)
+            self._evict()
+        future.set_result(entry)
+        return entry
+
+    def _copybook_id(self, copybook: str | Path) -> str:
+        """Registered name, or absolute path of a source file."""
+        if isinstance(copybook, str) and copybook.upper() in self._sources:
+            return copybook.upper()
+        return str(Path(copybook).resolve())
+
+    def _stamp(self, name: str) -> Any:
+        """Change marker of a source: size and mtime of its file and copybooks.
+
+        None when files are not checked.
+        """
+        if not self.check_files:
+            return None
+        stamp = None
+        if name not in self._sources:
+            status = os.stat(name)
+            stamp = (status.st_size, status.st_mtime_ns)
+        if self.resolver is not None:
+            with self._resolver_lock:
+                dependencies = self.resolver.dependencies(name)
+            return stamp, copybook_stamp(dependencies)
+        return stamp
+
+    def _load(self, name: str, record_name: str, encoding: str) -> tuple[CobolRecord, LayoutPlan]:
+        """Parse a copybook and compile one of its records."""
+        parser = CobolParser(encoding=encoding)
+        source = self._sources.get(name)
+        if self.resolver is not None:
+            with self._resolver_lock:
+                if source is not None:
+                    source = self.resolver.expand(source, document=name)
+                else:
+                    source = self.resolver.expand_file(name)
+        if self.cache is not None:
+            entry = (
+                self.cache.entry(source, parser)
+                if source is not None
+                else self.cache.entry_for_file(name, parser)
+            )
+            records, plans = entry.records, entry.plans
+        else:
+            records = parser.parse(source) if source is not None else parser.parse_file(name)
+            plans = None
+        for i, record in enumerate(records):
+            if not record_name or record.name.upper() == record_name:
+                return record, plans[i] if plans is not None else compile_layout(record)
+        raise KeyError(f"No record {record_name or '(any)'} in {name}")
+
+    def _remove(self, key: RegistryKey) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.plan)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within both limits."""
+        max_size = self.max_size
+        while len(self._entries) > self.max_entries or (
+            max_size is not None and self._size > max_size and len(self._entries) > 1
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def invalidate(self, copybook: str | Path) -> int:
+        """Drop the layouts built from a changed copybook.
+
+        With a resolver, layouts of every source including the copybook (as
+        far as the resolver has seen them) are dropped too.
+
+        Returns:
+            Number of layouts dropped
+        """
+        name = self._copybook_id(copybook)
+        affected = {name}
+        if self.resolver is not None and name not in self._sources:
+            with self._resolver_lock:
+                affected |= self.resolver.invalidate(name)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] in affected]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def stats(self) -> RegistryStats:
+        """Registry-wide counters."""
+        with self._lock:
+            return RegistryStats(
+                self._hits, self._misses, self._evictions, len(self._entries), self._size
+            )
+
+    def entry_stats(self) -> list[EntryStats]:
+        """Counters of the current entries, least recently used first."""
+        with self._lock:
+            return [
+                EntryStats(key, entry.hits, entry.loads, len(entry.plan))
+                for key, entry in self._entries.items()
+            ]
+
+    def clear(self) -> None:
+        """Drop every layout; counters and registered sources are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
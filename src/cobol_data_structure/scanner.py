@@ -0,0 +1,298 @@
+"""Repository-wide catalog of COBOL records.
+
+:func:`scan_repository` walks a source tree, parses every program and
+copybook in a process pool and records, for each 01/77-level record, its
+name, length, layout fingerprint and warnings in a :class:`Catalog`. The
+catalog is saved as JSON, and later scans only parse the files that
+changed:
+
+    >>> catalog = scan_repository("src/cobol", "catalog.json", workers=16)
+    >>> [entry.source for entry in catalog.find("CUSTOMER-REC")]
+
+A file is unchanged if it was parsed with the same encodings and its size
+and modification time match the catalog; if only they differ, its content
+hash is compared before parsing it again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+from cobol_data_structure.layout import compile_layout
+from cobol_data_structure.parser import CobolParser
+
+#: Extensions scanned by default (compared case-insensitively).
+SOURCE_EXTENSIONS = (".cbl", ".cob", ".cpy")
+
+#: Bumped whenever the catalog JSON layout changes.
+CATALOG_FORMAT = 2
+
+
+@dataclass(frozen=True)
+class CatalogRecord:
+    """One record found in a source file.
+
+    Attributes:
+        source: Path of the file, relative to the scanned root
+        name: Record name
+        level: 1 or 77
+        length: Record length in bytes
+        fields: Number of leaves in its compiled layout
+        fingerprint: :attr:`LayoutPlan.fingerprint` of its layout
+        warnings: Parser and layout warnings, as text
+    """
+
+    source: str
+    name: str
+    level: int
+    length: int
+    fields: int
+    fingerprint: str
+    warnings: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class CatalogFile:
+    """Scan result of one source file.
+
+    Attributes:
+        path: Path relative to the scanned root
+        size: File size when scanned
+        mtime_ns: Modification time when scanned
+        digest: SHA-256 of the file content
+        encoding: Text encoding the file was read with
+        parser_encoding: Encoding assigned to alphanumeric fields
+        records: Records defined in the file
+        warnings: Warnings not tied to a record
+        error: Why the file could not be parsed, if it could not
+    """
+
+    path: str
+    size: int
+    mtime_ns: int
+    digest: str
+    encoding: str
+    parser_encoding: str
+    records: tuple[CatalogRecord, ...] = ()
+    warnings: tuple[str, ...] = ()
+    error: str | None = None
+
+
+@dataclass
+class ScanStats:
+    """What one scan did, by relative path."""
+
+    parsed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+class Catalog:
+    """Records of a source tree, by file."""
+
+    def __init__(self, files: Iterable[CatalogFile] | None = None) -> None:
+        self.files: dict[str, CatalogFile] = {entry.path: entry for entry in files or ()}
+
+    def records(self) -> Iterator[CatalogRecord]:
+        """Every record, by file path then source order."""
+        for path in sorted(self.files):
+            yield from self.files[path].records
+
+    def find(self, name: str) -> list[CatalogRecord]:
+        """Records with a given name (case-insensitive)."""
+        name = name.upper()
+        return [record for record in self.records() if record.name.upper() == name]
+
+    def by_fingerprint(self, fingerprint: str) -> list[CatalogRecord]:
+        """Records whose layouts decode identically."""
+        return [record for record in self.records() if record.fingerprint == fingerprint]
+
+    def with_warnings(self) -> list[CatalogRecord]:
+        """Records that produced warnings."""
+        return [record for record in self.records() if record.warnings]
+
+    def errors(self) -> dict[str, str]:
+        """Files that could not be parsed, with the reason."""
+        return {path: entry.error for path, entry in self.files.items() if entry.error}
+
+    def __len__(self) -> int:
+        return sum(len(entry.records) for entry in self.files.values())
+
+    def save(self, path: str | Path) -> None:
+        """Write the catalog as JSON."""
+        data = {
+            "format": CATALOG_FORMAT,
+            "files": [asdict(self.files[name]) for name in sorted(self.files)],
+        }
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> Catalog:
+        """Read a catalog written by :meth:`save`.
+
+        A catalog written in another format loads empty, so the next scan
+        rebuilds it.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("format") != CATALOG_FORMAT:
+            return cls()
+        files = []
+        for entry in data["files"]:
+            records = tuple(
+                CatalogRecord(**{**record, "warnings": tuple(record["warnings"])})
+                for record in entry["records"]
+            )
+            files.append(
+                CatalogFile(**{**entry, "records": records, "warnings": tuple(entry["warnings"])})
+            )
+        return cls(files)
+
+    def scan(
+        self,
+        root: str | Path,
+        workers: int | None = None,
+        extensions: Iterable[str] = SOURCE_EXTENSIONS,
+        encoding: str = "utf-8",
+        parser_encoding: str = "cp1252",
+    ) -> ScanStats:
+        """Bring the catalog up to date with a source tree.
+
+        Args:
+            root: Directory to walk
+            workers: Parser processes; ``os.cpu_count()`` when None, and no
+                process pool when 1
+            extensions: File extensions to scan
+            encoding: Text encoding of the source files; undecodable bytes
+                are replaced
+            parser_encoding: Encoding assigned to alphanumeric fields
+
+        Returns:
+            What the scan parsed, kept and removed
+        """
+        root = Path(root)
+        stats = ScanStats()
+        tasks: list[tuple[str, str, str | None, str, str]] = []
+        found = set()
+        for path, status in _walk(root, {ext.lower() for ext in extensions}):
+            relative = path.relative_to(root).as_posix()
+            found.add(relative)
+            known = self.files.get(relative)
+            if known and (known.encoding, known.parser_encoding) != (encoding, parser_encoding):
+                known = None  # Parsed with other options: its records may differ
+            if known and (known.size, known.mtime_ns) == (status.st_size, status.st_mtime_ns):
+                stats.unchanged.append(relative)
+                continue
+            digest = known.digest if known else None
+            tasks.append((str(path), relative, digest, encoding, parser_encoding))
+
+        for relative in sorted(set(self.files) - found):
+            del self.files[relative]
+            stats.removed.append(relative)
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) <= 1:
+            results = map(_scan_file, *zip(*tasks)) if tasks else iter(())
+            self._collect(results, stats)
+        else:
+            chunk = max(1, min(64, len(tasks) // (4 * workers)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                self._collect(executor.map(_scan_file, *zip(*tasks), chunksize=chunk), stats)
+        return stats
+
+    def _collect(self, results: Iterable[tuple[CatalogFile, bool]], stats: ScanStats) -> None:
+        """Store scanned files and sort them into the scan statistics."""
+        for entry, changed in results:
+            previous = self.files.get(entry.path)
+            if not changed and previous is not None:
+                entry = replace(previous, size=entry.size, mtime_ns=entry.mtime_ns)
+                stats.unchanged.append(entry.path)
+            elif entry.error:
+                stats.failed.append(entry.path)
+            else:
+                stats.parsed.append(entry.path)
+            self.files[entry.path] = entry
+
+
+def _walk(root: Path, extensions: set) -> Iterator[tuple[Path, os.stat_result]]:
+    """Source files below ``root`` with their status, in a stable order."""
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories.sort()
+        for name in sorted(names):
+            if os.path.splitext(name)[1].lower() in extensions:
+                path = Path(directory, name)
+                yield path, path.stat()
+
+
+def _scan_file(
+    path: str, relative: str, known_digest: str | None, encoding: str, parser_encoding: str
+) -> tuple[CatalogFile, bool]:
+    """Worker: hash a file and, if its content changed, parse it.
+
+    Returns:
+        The file's catalog entry (without records when unchanged) and
+        whether its content changed
+    """
+    with open(path, "rb") as handle:
+        status = os.fstat(handle.fileno())
+        data = handle.read()
+    digest = hashlib.sha256(data).hexdigest()
+    entry = CatalogFile(
+        relative, status.st_size, status.st_mtime_ns, digest, encoding, parser_encoding
+    )
+    if digest == known_digest:
+        return entry, False
+
+    parser = CobolParser(encoding=parser_encoding)
+    source = data.decode(encoding, errors="replace")
+    try:
+        records = parser.parse(source)
+    except ValueError as e:
+        return replace(entry, error=str(e)), True
+
+    in_records: set[int] = set()
+    catalog_records = []
+    for record in records:
+        plan = compile_layout(record)
+        in_records.update(map(id, record.warnings))
+        warnings = [str(w) for w in record.warnings] + [str(w) for w in plan.warnings]
+        catalog_records.append(
+            CatalogRecord(
+                source=relative,
+                name=record.name,
+                level=record.level,
+                length=record.total_length,
+                fields=len(plan),
+                fingerprint=plan.fingerprint,
+                warnings=tuple(warnings),
+            )
+        )
+    other = tuple(str(w) for w in parser.warnings if id(w) not in in_records)
+    return replace(entry, records=tuple(catalog_records), warnings=other), True
+
+
+def scan_repository(
+    root: str | Path,
+    catalog_path: str | Path | None = None,
+    workers: int | None = None,
+    extensions: Iterable[str] = SOURCE_EXTENSIONS,
+    encoding: str = "utf-8",
+    parser_encoding: str = "cp1252",
+) -> Catalog:
+    """Scan a source tree, updating and saving a catalog file if given.
+
+    See :meth:`Catalog.scan` for the arguments.
+    """
+    catalog = Catalog()
+    if catalog_path is not None and Path(catalog_path).is_file():
+        catalog = Catalog.load(catalog_path)
+    catalog.scan(root, workers, extensions, encoding, parser_encoding)
+    if catalog_path is not None:
+        catalog.save(catalog_path)
+    return catalog
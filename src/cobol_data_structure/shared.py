@@ -0,0 +1,331 @@
+"""Shared-memory input buffers and output columns for worker processes.
+
+Sending record bytes to workers and decoded dictionaries back costs more
+pickling than decoding. With this module the input records and the decoded
+NumPy columns live in :mod:`multiprocessing.shared_memory` blocks: workers
+attach to the blocks by name, decode their slice of records column-wise
+(see :mod:`cobol_data_structure.numpy_backend`) and write the results in
+place. Only block names and record ranges cross process boundaries.
+
+Blocks are owned by the objects that create them: :class:`SharedRecords`
+and :class:`SharedColumns` unlink their block on :meth:`close` (or when used
+as context managers); workers only attach and detach.
+
+Example:
+    >>> with decode_shared(plan, "extract.dat", fields=["TYPE.CODE"]) as result:
+    ...     codes = result.columns["TYPE.CODE"][result.valid["TYPE.CODE"]]
+
+Requires the ``numpy`` extra: ``pip install cobol-data-structure[numpy]``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Shared-memory columns require numpy: pip install 'cobol-data-structure[numpy]'"
+    ) from e
+
+from cobol_data_structure.layout import (
+    CODEC_ALPHANUMERIC,
+    CODEC_BINARY,
+    CODEC_FLOAT,
+    CODEC_NATIONAL,
+    CODEC_OVERPUNCH,
+    CODEC_PACKED,
+    CODEC_ZONED,
+    LayoutPlan,
+    as_plan,
+)
+from cobol_data_structure.models import CobolRecord
+from cobol_data_structure.numpy_backend import decode_columns, record_dtype
+from cobol_data_structure.packed import _INT64_DIGITS
+
+Layout = Union[CobolRecord, LayoutPlan]
+_ALIGNMENT = 64
+
+
+class SharedRecords:
+    """Fixed-length record bytes held in a shared memory block."""
+
+    def __init__(self, size: int) -> None:
+        """Create an empty block of ``size`` bytes (at least one byte)."""
+        self.size = size
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> SharedRecords:
+        """Copy a buffer into a new block."""
+        view = memoryview(data).cast("B")
+        records = cls(len(view))
+        records.buffer[:] = view
+        return records
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> SharedRecords:
+        """Read a data file straight into a new block."""
+        size = Path(path).stat().st_size
+        records = cls(size)
+        with open(path, "rb") as handle:
+            if handle.readinto(records.buffer) != size:
+                records.close()
+                raise OSError(f"Short read from {path}")
+        return records
+
+    @property
+    def name(self) -> str:
+        """Name workers attach to."""
+        return self._shm.name
+
+    @property
+    def buffer(self) -> memoryview:
+        """The record bytes (exactly ``size`` bytes)."""
+        return _buffer(self._shm)[: self.size]
+
+    def close(self) -> None:
+        """Detach and destroy the block."""
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedRecords:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Location of one column (and its validity mask) in a shared block."""
+
+    path: str
+    dtype: str
+    offset: int
+    valid_offset: int
+
+
+@dataclass(frozen=True)
+class ColumnsLayout:
+    """Picklable description of a :class:`SharedColumns` block."""
+
+    name: str
+    count: int
+    specs: tuple[ColumnSpec, ...]
+
+
+def column_dtype(codec: int, length: int, params: Any) -> np.dtype:
+    """Fixed-size NumPy dtype holding the decoded values of a leaf.
+
+    Text becomes ``U<n>``; numbers with decimals or more than 18 digits
+    become float64, other integers int64.
+    """
+    if codec == CODEC_ALPHANUMERIC:
+        return np.dtype(f"U{max(length, 1)}")
+    if codec == CODEC_NATIONAL:
+        return np.dtype(f"U{max(length // 2, 1)}")
+    if codec == CODEC_FLOAT:
+        return np.dtype(np.float64)
+    if codec == CODEC_PACKED:
+        digits, decimal_places = 2 * length - 1, params[0]
+    elif codec == CODEC_ZONED:
+        digits, decimal_places = length, params[1]
+    elif codec == CODEC_OVERPUNCH:
+        digits, decimal_places = length, params[2]
+    elif codec == CODEC_BINARY:
+        digits, decimal_places = 2 * length, params[1]
+    else:
+        return np.dtype(f"U{2 * length}")  # Raw bytes as hex
+    if decimal_places > 0 or digits > _INT64_DIGITS:
+        return np.dtype(np.float64)
+    return np.dtype(np.int64)
+
+
+class SharedColumns:
+    """Decoded columns and validity masks held in one shared memory block.
+
+    Attributes:
+        columns: Column arrays by path, backed by the block
+        valid: Boolean arrays by path; False where a value could not be
+            decoded (its column entry is then 0 or empty)
+    """
+
+    def __init__(self, layout: Layout, count: int, fields: Iterable[str] | None = None) -> None:
+        """Allocate zeroed columns for ``count`` records.
+
+        Args:
+            layout: Record or compiled plan
+            count: Number of records
+            fields: Plan paths to allocate; all leaves when None
+
+        Raises:
+            KeyError: If a requested field is not a plan path
+        """
+        plan = as_plan(layout)
+        wanted = plan.paths if fields is None else list(fields)
+        specs: list[ColumnSpec] = []
+        size = 0
+        for path in wanted:
+            i = plan.index[path]
+            dtype = column_dtype(plan.codecs[i], plan.lengths[i], plan.params[i])
+            offset = size
+            valid_offset = _align(offset + dtype.itemsize * count)
+            size = _align(valid_offset + count)
+            specs.append(ColumnSpec(path, dtype.str, offset, valid_offset))
+        self._shm = SharedMemory(create=True, size=max(size, 1))
+        _buffer(self._shm)[:size] = bytes(size)
+        self.layout = ColumnsLayout(self._shm.name, count, tuple(specs))
+        self.columns, self.valid = _arrays(self._shm, self.layout)
+
+    @property
+    def count(self) -> int:
+        """Number of records."""
+        return self.layout.count
+
+    def close(self) -> None:
+        """Release the arrays and destroy the block.
+
+        Raises:
+            BufferError: If views of the arrays are still referenced; copy
+                the values you keep before closing
+        """
+        self.columns.clear()
+        self.valid.clear()
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedColumns:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the block alignment."""
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    """Mapped bytes of an open block."""
+    buffer = shm.buf
+    assert buffer is not None, "shared memory block is closed"
+    return buffer
+
+
+def _arrays(
+    shm: SharedMemory, layout: ColumnsLayout
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray]]:
+    """Column and mask arrays described by ``layout`` over a block."""
+    columns: dict[str, np.ndarray] = {}
+    valid: dict[str, np.ndarray] = {}
+    for spec in layout.specs:
+        columns[spec.path] = np.ndarray(
+            layout.count, dtype=spec.dtype, buffer=_buffer(shm), offset=spec.offset
+        )
+        valid[spec.path] = np.ndarray(
+            layout.count, dtype=np.bool_, buffer=_buffer(shm), offset=spec.valid_offset
+        )
+    return columns, valid
+
+
+def decode_shared(
+    layout: Layout,
+    data: str | Path | bytes | SharedRecords,
+    fields: Iterable[str] | None = None,
+    workers: int | None = None,
+    chunk_records: int = 100000,
+) -> SharedColumns:
+    """Decode fixed-length records into shared columns with worker processes.
+
+    Args:
+        layout: Record or compiled plan
+        data: Data file path, record bytes, or records already in shared
+            memory; paths and bytes are copied into a temporary block
+        fields: Plan paths to decode; all leaves when None
+        workers: Number of processes; ``os.cpu_count()`` when None
+        chunk_records: Records decoded per task
+
+    Returns:
+        The decoded columns; close them (or use a ``with`` block) when done
+
+    Raises:
+        ValueError: If the layout has OCCURS DEPENDING ON tables
+    """
+    plan = as_plan(layout)
+    if plan.variable is not None:
+        raise ValueError(
+            f"Record {plan.record_name} has OCCURS DEPENDING ON tables; "
+            "shared columns need fixed-length records"
+        )
+    if isinstance(data, SharedRecords):
+        records, owned = data, False
+    elif isinstance(data, (str, Path)):
+        records, owned = SharedRecords.from_file(data), True
+    else:
+        records, owned = SharedRecords.from_bytes(data), True
+    try:
+        count = records.size // plan.record_length
+        result = SharedColumns(plan, count, fields)
+        try:
+            tasks = [
+                (plan, records.name, result.layout, start, min(start + chunk_records, count))
+                for start in range(0, count, chunk_records)
+            ]
+            if tasks:
+                with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+                    for future in [executor.submit(_decode_into, *task) for task in tasks]:
+                        future.result()
+        except BaseException:
+            result.close()
+            raise
+    finally:
+        if owned:
+            records.close()
+    return result
+
+
+def _decode_into(
+    plan: LayoutPlan, input_name: str, output: ColumnsLayout, start: int, stop: int
+) -> int:
+    """Worker: decode records ``start:stop`` from one block into another."""
+    source = SharedMemory(input_name)
+    target = SharedMemory(output.name)
+    try:
+        dtype = record_dtype(plan)
+        records = np.frombuffer(
+            _buffer(source), dtype=dtype, count=stop - start, offset=start * dtype.itemsize
+        )
+        columns, valid = _arrays(target, output)
+        decoded = decode_columns(plan, records, [spec.path for spec in output.specs])
+        for path, values in decoded.items():
+            _store(values, columns[path][start:stop], valid[path][start:stop])
+        del records, columns, valid, decoded
+    finally:
+        source.close()
+        target.close()
+    return stop - start
+
+
+def _store(values: np.ndarray, column: np.ndarray, valid: np.ndarray) -> None:
+    """Copy decoded values into a column slice, recording which are valid."""
+    if isinstance(values, np.ma.MaskedArray):
+        ok = ~np.ma.getmaskarray(values)
+        values = values.data
+    elif values.dtype == object:
+        ok = np.array([value is not None for value in values], dtype=bool)
+    else:
+        ok = np.ones(len(values), dtype=bool)
+    if values.dtype == object:
+        empty = "" if column.dtype.kind == "U" else 0
+        values = np.array([value if value is not None else empty for value in values])
+    column[ok] = values[ok]
+    valid[:] = ok
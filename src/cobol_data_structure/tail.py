@@ -0,0 +1,314 @@
+"""Follow growing logs and decode MOVE captures as they are written.
+
+:func:`tail_moves` watches one or more log files, like ``tail -F``, and
+yields a :class:`MoveSnapshot` for every MOVE capture (see
+:mod:`cobol_data_structure.logs`) into a record it has a layout for:
+
+    >>> async with tail_moves("app.log", [last_data]) as moves:
+    ...     async for snapshot in moves:
+    ...         publish(snapshot.capture.timestamp, snapshot.values)
+
+Files are polled. A file replaced under the same name (rotation) is read to
+its end and the new file is then followed from its first byte; a file that
+shrinks (truncation) is re-read from the start. Reads run on the event
+loop's default executor and matching and decoding on ``executor``, so the
+loop only schedules work. Each file's reader stops reading while the
+bounded snapshot queue is full, which makes a slow consumer throttle the
+tailers instead of growing memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from re import Pattern
+from typing import (
+    Any,
+    BinaryIO,
+    NamedTuple,
+    Union,
+)
+
+from cobol_data_structure.binary_parser import ParsedValue
+from cobol_data_structure.layout import LayoutPlan, as_plan
+from cobol_data_structure.logs import DEFAULT_PATTERN, MoveCapture, MoveLogExtractor
+from cobol_data_structure.models import CobolRecord, ParserWarning, WarningSeverity
+
+Layout = Union[CobolRecord, LayoutPlan]
+PathLike = Union[str, Path]
+
+
+class MoveSnapshot(NamedTuple):
+    """A decoded MOVE capture and the log it was read from.
+
+    ``values`` is the flat ``{path: value}`` dictionary of
+    :meth:`LayoutPlan.decode`, or None when the payload is shorter than the
+    target record.
+    """
+
+    path: Path
+    capture: MoveCapture
+    values: dict[str, ParsedValue] | None
+
+
+class LogFollower:
+    """Incremental line reader for one log file that survives rotation.
+
+    :meth:`read_lines` is blocking and returns the complete lines appended
+    since the previous call; a trailing line without its newline is kept
+    until the rest of it is written (or the file is rotated).
+    """
+
+    def __init__(self, path: PathLike, from_start: bool = False, max_bytes: int = 1 << 20) -> None:
+        """Configure the follower; the file is opened on the first read.
+
+        Args:
+            path: Log file path; the file does not need to exist yet
+            from_start: Read the lines already in the file; otherwise only
+                lines written after the first read
+            max_bytes: Most bytes read per call
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._at_end = not from_start
+        self._handle: BinaryIO | None = None
+        self._identity: tuple[int, int] | None = None
+        self._position = 0
+        self._partial = b""
+
+    def read_lines(self) -> list[bytes]:
+        """Return the complete lines written since the last call."""
+        handle = self._handle or self._open()
+        if handle is None:
+            return []
+        data = handle.read(self.max_bytes)
+        if not data:
+            return self._check_replaced(handle)
+        self._position += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        return lines
+
+    def _open(self) -> BinaryIO | None:
+        """Open the file, at its end the first time unless reading from start."""
+        try:
+            handle = open(self.path, "rb")
+        except FileNotFoundError:
+            self._at_end = False  # Created later: all of it is new
+            return None
+        status = os.fstat(handle.fileno())
+        self._identity = (status.st_dev, status.st_ino)
+        self._position = handle.seek(0, os.SEEK_END) if self._at_end else 0
+        self._at_end = False
+        self._handle = handle
+        return handle
+
+    def _check_replaced(self, handle: BinaryIO) -> list[bytes]:
+        """At the end of the file: handle rotation and truncation."""
+        try:
+            status = os.stat(self.path)
+        except FileNotFoundError:
+            return []  # Renamed away; keep the old file until a new one appears
+        if (status.st_dev, status.st_ino) != self._identity:
+            lines = [self._partial] if self._partial else []
+            self.close()
+            self._open()
+            return lines
+        if status.st_size < self._position:
+            handle.seek(0)
+            self._position = 0
+            self._partial = b""
+        return []
+
+    def close(self) -> None:
+        """Close the file; a later read reopens it from the start."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._partial = b""
+
+
+def _plans_by_target(
+    layouts: Mapping[str, Layout] | Iterable[Layout],
+) -> dict[str, LayoutPlan]:
+    """Compile layouts and key them by (upper-case) MOVE target name."""
+    items: Iterable[tuple[str, Layout]]
+    if isinstance(layouts, Mapping):
+        items = layouts.items()
+    else:
+        items = ((_layout_name(layout), layout) for layout in layouts)
+    return {name.upper(): as_plan(layout) for name, layout in items}
+
+
+def _layout_name(layout: Layout) -> str:
+    """Record name of a record or plan."""
+    return layout.record_name if isinstance(layout, LayoutPlan) else layout.name
+
+
+def _decode_lines(
+    pattern: Pattern[bytes],
+    source: str | None,
+    plans: dict[str, LayoutPlan],
+    path: Path,
+    lines: list[bytes],
+) -> tuple[list[MoveSnapshot], list[ParserWarning]]:
+    """Executor job: match a batch of lines and decode the wanted captures."""
+    extractor = MoveLogExtractor(pattern, source=source)
+    snapshots: list[MoveSnapshot] = []
+    for capture in extractor.iter_lines(lines):
+        plan = plans.get(capture.target)
+        if plan is None:
+            continue
+        problem = None
+        values = None
+        if len(capture.payload) < plan.min_length:
+            problem = f"record length is {plan.min_length}"
+        else:
+            try:
+                values = plan.decode(capture.payload)
+            except ValueError as e:  # OCCURS DEPENDING ON counts do not fit the payload
+                problem = str(e)
+        if problem is not None:
+            extractor.warnings.append(
+                ParserWarning(
+                    severity=WarningSeverity.WARNING,
+                    message=f"Payload of MOVE {capture.source} TO {capture.target} at "
+                    f"{capture.timestamp} is {len(capture.payload)} bytes; {problem}",
+                    field_name=capture.target,
+                )
+            )
+        snapshots.append(MoveSnapshot(path, capture, values))
+    return snapshots, extractor.warnings
+
+
+class MoveTailer:
+    """Asynchronous iterator of :class:`MoveSnapshot` from followed logs.
+
+    Tailing starts on entering an ``async with`` block (or with the first
+    ``__anext__``) and runs until :meth:`aclose`, which leaving the block
+    calls. Snapshots from one file keep their log order; files are
+    interleaved as read.
+    """
+
+    def __init__(
+        self,
+        paths: PathLike | Iterable[PathLike],
+        layouts: Mapping[str, Layout] | Iterable[Layout],
+        source: str | None = None,
+        pattern: bytes | Pattern[bytes] = DEFAULT_PATTERN,
+        from_start: bool = False,
+        poll_interval: float = 0.5,
+        max_queue: int = 1000,
+        executor: Executor | None = None,
+    ) -> None:
+        """Configure the tailer.
+
+        Args:
+            paths: Log file path(s)
+            layouts: Records or plans to decode captures with, keyed by
+                MOVE target name, or a list keyed by their record names.
+                Captures into other targets are ignored.
+            source: Only decode MOVEs from this variable
+            pattern: Capture line regex (see :data:`logs.DEFAULT_PATTERN`)
+            from_start: Also decode the lines already in the files
+            poll_interval: Seconds to wait when a file has no new lines
+            max_queue: Most snapshots waiting for the consumer
+            executor: Executor that matches and decodes line batches; the
+                loop's default thread pool when None. A process pool keeps
+                decoding off the GIL (plans and lines must then pickle).
+        """
+        if isinstance(paths, (str, Path)):
+            paths = [paths]
+        self.followers = [LogFollower(path, from_start) for path in paths]
+        self.plans = _plans_by_target(layouts)
+        self.source = source.upper() if source else None
+        self.pattern = MoveLogExtractor(pattern).pattern
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        self.executor = executor
+        self.warnings: list[ParserWarning] = []
+        self._queue: asyncio.Queue[MoveSnapshot | Exception] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._closed = False
+
+    def __aiter__(self) -> MoveTailer:
+        return self
+
+    async def __anext__(self) -> MoveSnapshot:
+        if self._closed:
+            raise StopAsyncIteration
+        queue = self._start()
+        item = await queue.get()
+        if isinstance(item, BaseException):
+            await self.aclose()
+            raise item
+        return item
+
+    def _start(self) -> asyncio.Queue[MoveSnapshot | Exception]:
+        """Start one producer task per file, once; return their queue."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_queue)
+            self._tasks = [
+                asyncio.ensure_future(self._follow(follower, self._queue))
+                for follower in self.followers
+            ]
+        return self._queue
+
+    async def _follow(
+        self, follower: LogFollower, queue: asyncio.Queue[MoveSnapshot | Exception]
+    ) -> None:
+        """Producer: read, decode and enqueue the snapshots of one file."""
+        loop = asyncio.get_running_loop()
+        decode = partial(_decode_lines, self.pattern, self.source, self.plans, follower.path)
+        try:
+            while True:
+                lines = await loop.run_in_executor(None, follower.read_lines)
+                if not lines:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                snapshots, warnings = await loop.run_in_executor(self.executor, decode, lines)
+                self.warnings.extend(warnings)
+                for snapshot in snapshots:
+                    await queue.put(snapshot)
+        except Exception as e:
+            await queue.put(e)
+
+    async def aclose(self) -> None:
+        """Stop tailing and close the files."""
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for follower in self.followers:
+            follower.close()
+
+    async def __aenter__(self) -> MoveTailer:
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def tail_moves(
+    paths: PathLike | Iterable[PathLike],
+    layouts: Mapping[str, Layout] | Iterable[Layout],
+    source: str | None = None,
+    pattern: bytes | Pattern[bytes] = DEFAULT_PATTERN,
+    from_start: bool = False,
+    poll_interval: float = 0.5,
+    max_queue: int = 1000,
+    executor: Executor | None = None,
+) -> MoveTailer:
+    """Follow log files and yield their decoded MOVE captures.
+
+    See :class:`MoveTailer` for the arguments.
+    """
+    return MoveTailer(
+        paths, layouts, source, pattern, from_start, poll_interval, max_queue, executor
+    )
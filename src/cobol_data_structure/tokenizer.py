@@ -0,0 +1,366 @@
+"""Tokenizer for COBOL DATA DIVISION entries."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import TypedDict
+
+from cobol_data_structure.models import ParserWarning, WarningSeverity
+
+
+class TokenInfo(TypedDict, total=False):
+    """Type definition for parsed tokens."""
+
+    level: int
+    name: str
+    picture: str | None
+    usage: str | None
+    occurs: int | None
+    occurs_min: int | None
+    occurs_max: int | None
+    occurs_depending_on: str | None
+    redefines: str | None
+    sign_separate: bool
+    sign_leading: bool
+    synchronized: bool
+    justified_right: bool
+    value: str | None
+
+
+# Quoted literals are removed before clause matching so that text such as
+# VALUE 'OCCURS 5' cannot be mistaken for a clause.
+_LITERAL_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"")
+
+# COBOL words may contain hyphens, so keywords are delimited by lookarounds
+# rather than ``\b`` (which would match "SYNC" inside "WS-SYNC").
+_BEFORE = r"(?<![\w-])"
+_AFTER = r"(?![\w-])"
+
+_ENTRY_PATTERN = re.compile(r"^\s*(\d{1,2})(?:\s+([A-Za-z0-9][\w-]*))?(?=\s|\.|$)")
+_PIC_PATTERN = re.compile(_BEFORE + r"PIC(?:TURE)?\s+(?:IS\s+)?(\S+)", re.IGNORECASE)
+_USAGE_PATTERN = re.compile(
+    _BEFORE + r"(COMP(?:UTATIONAL)?(?:-[1-5])?|BINARY|PACKED-DECIMAL|DISPLAY)" + _AFTER,
+    re.IGNORECASE,
+)
+_OCCURS_PATTERN = re.compile(_BEFORE + r"OCCURS\s+(\d+)", re.IGNORECASE)
+_ODO_PATTERN = re.compile(
+    _BEFORE + r"OCCURS\s+(\d+)\s+TO\s+(\d+)(?:\s+TIMES)?\s+DEPENDING\s+(?:ON\s+)?([\w-]+)",
+    re.IGNORECASE,
+)
+_REDEFINES_PATTERN = re.compile(_BEFORE + r"REDEFINES\s+([\w-]+)", re.IGNORECASE)
+_SIGN_PATTERN = re.compile(
+    _BEFORE + r"(LEADING|TRAILING)" + _AFTER + r"(\s+SEPARATE" + _AFTER + r")?", re.IGNORECASE
+)
+_SYNC_PATTERN = re.compile(_BEFORE + r"SYNC(?:HRONIZED)?" + _AFTER, re.IGNORECASE)
+_JUSTIFIED_PATTERN = re.compile(_BEFORE + r"JUST(?:IFIED)?" + _AFTER, re.IGNORECASE)
+_VALUE_PATTERN = re.compile(
+    _BEFORE + r"VALUES?\s+(?:IS\s+|ARE\s+)?(.+?)\s*\.?\s*$", re.IGNORECASE | re.DOTALL
+)
+
+# Words that may follow a level number directly when the item is unnamed.
+_CLAUSE_KEYWORDS = frozenset(
+    {
+        "PIC",
+        "PICTURE",
+        "USAGE",
+        "OCCURS",
+        "REDEFINES",
+        "VALUE",
+        "VALUES",
+        "COMP",
+        "COMP-1",
+        "COMP-2",
+        "COMP-3",
+        "COMP-4",
+        "COMP-5",
+        "COMPUTATIONAL",
+        "COMPUTATIONAL-1",
+        "COMPUTATIONAL-2",
+        "COMPUTATIONAL-3",
+        "COMPUTATIONAL-4",
+        "COMPUTATIONAL-5",
+        "BINARY",
+        "PACKED-DECIMAL",
+        "DISPLAY",
+        "SIGN",
+        "SYNC",
+        "SYNCHRONIZED",
+    }
+)
+
+# Pattern of the single-pass scanner (:meth:`LineTokenizer.scan`). It runs
+# over the DATA DIVISION as one string of stripped lines joined by newlines
+# and matches one whole entry, up to a period that ends a line (as in
+# ``_join_entries``), or one sentence that is not an entry. Each clause kind
+# has its own groups; words it does not know are skipped.
+_LITERAL_ATOM = r"'[^'\n]*'|\"[^\"\n]*\""
+_TERMINATOR = r"\.(?=\n|\Z)"
+# A word, which may contain periods that do not end its line (``9(3).99``)
+_SCAN_WORD = r"[^\s.'\"]+(?:\.(?!\n|\Z)[^\s.'\"]*)*|\.(?!\n|\Z)"
+_SCAN_KEYWORD = "|".join(sorted(_CLAUSE_KEYWORDS, key=len, reverse=True))
+_SCAN_PATTERN = re.compile(
+    rf"""\s*(?:
+        (?P<level>\d{{1,2}})(?=\s|\.|\Z)
+        (?:\s+(?!(?:{_SCAN_KEYWORD})(?=\s|\.|\Z))(?P<name>[A-Za-z0-9][\w-]*)(?=\s|\.|\Z))?
+        (?:\s*(?:
+            PIC(?:TURE)?(?:\s+IS)?\s+(?P<picture>{_SCAN_WORD})
+          | (?:USAGE\s+(?:IS\s+)?)?
+            (?P<usage>COMP(?:UTATIONAL)?(?:-[1-5])?|BINARY|PACKED-DECIMAL|DISPLAY)(?![\w-])
+          | OCCURS\s+(?P<occurs_min>\d+)\s+TO\s+(?P<occurs_max>\d+)(?:\s+TIMES)?
+            \s+DEPENDING\s+(?:ON\s+)?(?P<depending_on>[\w-]+)
+          | OCCURS\s+(?P<occurs>\d+)
+          | REDEFINES\s+(?P<redefines>[\w-]+)
+          | (?:SIGN\s+(?:IS\s+)?)?(?P<sign>LEADING|TRAILING)(?![\w-])
+            (?P<separate>\s+SEPARATE(?![\w-]))?
+          | (?P<sync>SYNC(?:HRONIZED)?)(?![\w-])
+          | (?P<just>JUST(?:IFIED)?)(?![\w-])
+          | VALUES?\s+(?:(?:IS|ARE)\s+)?
+            (?P<value>(?:[^'".\n]+|{_LITERAL_ATOM}|.)+?)(?=\s*(?:{_TERMINATOR}|\Z))
+          | {_LITERAL_ATOM}|{_SCAN_WORD}|(?!{_TERMINATOR})\S
+        ))*
+        \s*(?:{_TERMINATOR}|\Z)
+      | (?:[^'".]+|{_LITERAL_ATOM}|.)*?(?:{_TERMINATOR}|\Z)
+    )""",
+    re.IGNORECASE | re.DOTALL | re.VERBOSE,
+)
+
+# Indicator-area characters recognised in fixed-format source.
+_INDICATORS = frozenset(" *-/dD")
+
+
+class LineTokenizer:
+    """Tokenize COBOL DATA DIVISION entries.
+
+    An *entry* is one data description, which may have been written over
+    several source lines; :meth:`CobolParser._join_entries
+    <cobol_data_structure.parser.CobolParser._join_entries>` assembles them.
+    """
+
+    def __init__(self) -> None:
+        self.warnings: list[ParserWarning] = []
+
+    def tokenize(self, line: str, line_number: int = 0) -> TokenInfo | None:
+        """Tokenize a single COBOL data description entry.
+
+        Args:
+            line: COBOL source entry (comments already removed)
+            line_number: Line number for error reporting
+
+        Returns:
+            TokenInfo dict with parsed components, or None if not a data item
+
+        Handles:
+            - Level 01-49 (data items)
+            - Level 66 (RENAMES) - returns None with warning
+            - Level 77 (independent items)
+            - Level 88 (condition names) - returns None (skip)
+        """
+        if not line.strip():
+            return None
+
+        entry_match = _ENTRY_PATTERN.match(line)
+        if not entry_match:
+            return None
+
+        level = int(entry_match.group(1))
+
+        if level == 88:
+            # Condition name - no storage
+            return None
+
+        if level == 66 or not (1 <= level <= 49 or level == 77):
+            self._level_warning(level, line_number, entry_match.group(2))
+            return None
+
+        token: TokenInfo = {"level": level}
+
+        name = entry_match.group(2)
+        clauses = line[entry_match.end() :]
+        if name is None or name.upper() in _CLAUSE_KEYWORDS:
+            # Unnamed item: the "name" is really the first clause
+            token["name"] = "FILLER"
+            clauses = line[entry_match.end(1) :]
+        else:
+            token["name"] = name.upper()
+
+        value_match = _VALUE_PATTERN.search(clauses)
+        if value_match:
+            token["value"] = value_match.group(1).strip()
+            clauses = clauses[: value_match.start()]
+        clauses = _LITERAL_PATTERN.sub(" ", clauses).rstrip().rstrip(".")
+
+        pic_match = _PIC_PATTERN.search(clauses)
+        if pic_match:
+            token["picture"] = pic_match.group(1).upper().rstrip(".")
+            # The picture string itself must not be matched as a clause
+            clauses = clauses[: pic_match.start()] + clauses[pic_match.end() :]
+
+        usage_match = _USAGE_PATTERN.search(clauses)
+        if usage_match:
+            token["usage"] = usage_match.group(1).upper()
+
+        odo_match = _ODO_PATTERN.search(clauses)
+        if odo_match:
+            token["occurs_min"] = int(odo_match.group(1))
+            token["occurs_max"] = int(odo_match.group(2))
+            token["occurs_depending_on"] = odo_match.group(3).upper()
+            token["occurs"] = None  # Don't use simple occurs with ODO
+        else:
+            occurs_match = _OCCURS_PATTERN.search(clauses)
+            if occurs_match:
+                token["occurs"] = int(occurs_match.group(1))
+
+        redefines_match = _REDEFINES_PATTERN.search(clauses)
+        if redefines_match:
+            token["redefines"] = redefines_match.group(1).upper()
+
+        sign_match = _SIGN_PATTERN.search(clauses)
+        token["sign_leading"] = bool(sign_match and sign_match.group(1).upper() == "LEADING")
+        token["sign_separate"] = bool(sign_match and sign_match.group(2))
+
+        token["synchronized"] = bool(_SYNC_PATTERN.search(clauses))
+        token["justified_right"] = bool(_JUSTIFIED_PATTERN.search(clauses))
+
+        return token
+
+    def scan(self, lines: list[tuple[int, str]]) -> list[tuple[int, TokenInfo]]:
+        """Tokenize every entry of a DATA DIVISION in one pass.
+
+        Equivalent to joining the lines into entries and calling
+        :meth:`tokenize` on each, but the text is scanned once, left to
+        right, with one compiled pattern that matches a whole entry; the
+        per-entry path runs a dozen searches over every entry. An entry
+        repeating a clause, which COBOL does not allow, keeps the last one
+        here rather than the first.
+
+        Args:
+            lines: (line number, code text) pairs, comments already removed
+
+        Returns:
+            (line number, token) pairs of the data items, in source order
+        """
+        numbers: list[int] = []
+        starts: list[int] = []
+        parts: list[str] = []
+        offset = 0
+        for number, line in lines:
+            line = line.strip()
+            if line:
+                numbers.append(number)
+                starts.append(offset)
+                parts.append(line)
+                offset += len(line) + 1
+
+        tokens: list[tuple[int, TokenInfo]] = []
+        for match in _SCAN_PATTERN.finditer("\n".join(parts)):
+            (
+                level_text,
+                name,
+                picture,
+                usage,
+                occurs_min,
+                occurs_max,
+                depending_on,
+                occurs,
+                redefines,
+                sign,
+                separate,
+                sync,
+                just,
+                value,
+            ) = match.groups()
+            if level_text is None:
+                continue  # A section header, or the end of the text
+            level = int(level_text)
+            line_number = numbers[bisect_right(starts, match.start(1)) - 1]
+            if level == 88:
+                continue
+            if level == 66 or not (1 <= level <= 49 or level == 77):
+                self._level_warning(level, line_number, name)
+                continue
+
+            token: TokenInfo = {
+                "level": level,
+                "name": name.upper() if name else "FILLER",
+                "sign_leading": sign is not None and sign.upper() == "LEADING",
+                "sign_separate": separate is not None,
+                "synchronized": sync is not None,
+                "justified_right": just is not None,
+            }
+            if value is not None:
+                token["value"] = value.replace("\n", " ").strip()
+            if picture is not None:
+                token["picture"] = picture.upper().rstrip(".")
+            if usage is not None:
+                token["usage"] = usage.upper()
+            if depending_on is not None:
+                token["occurs_min"] = int(occurs_min)
+                token["occurs_max"] = int(occurs_max)
+                token["occurs_depending_on"] = depending_on.upper()
+                token["occurs"] = None
+            elif occurs is not None:
+                token["occurs"] = int(occurs)
+            if redefines is not None:
+                token["redefines"] = redefines.upper()
+            tokens.append((line_number, token))
+        return tokens
+
+    def _level_warning(self, level: int, line_number: int, name: str | None) -> None:
+        """Record the warning for an unsupported level number."""
+        if level == 66:
+            message = "Level 66 RENAMES not supported"
+        else:
+            message = f"Invalid level number {level:02d}"
+            name = None
+        self.warnings.append(
+            ParserWarning(
+                severity=WarningSeverity.WARNING,
+                message=message,
+                line_number=line_number,
+                field_name=name,
+            )
+        )
+
+    @staticmethod
+    def entry_level(line: str) -> int | None:
+        """Level number of an entry, or None if it does not start with one.
+
+        Examples:
+            >>> LineTokenizer.entry_level("01 REC.")
+            1
+        """
+        entry_match = _ENTRY_PATTERN.match(line)
+        return int(entry_match.group(1)) if entry_match else None
+
+    @staticmethod
+    def remove_comments(line: str) -> str:
+        """Remove comments and non-code areas from a COBOL source line.
+
+        In fixed format:
+        - Columns 1-6: Sequence number area
+        - Column 7: Indicator area (* or / = comment, - = continuation)
+        - Columns 8-72: Code area
+        - Columns 73-80: Identification area (treated as comment)
+
+        Lines that do not look like fixed format are treated as free format,
+        where ``*>`` starts an inline comment.
+
+        Examples:
+            >>> LineTokenizer.remove_comments("000100 01 REC.")
+            '01 REC.'
+        """
+        line = line.rstrip("\r\n")
+        if len(line) > 6 and line[6] in _INDICATORS and _is_sequence_area(line[:6]):
+            if line[6] in "*/":
+                return ""
+            line = line[7:72]
+        comment_start = line.find("*>")
+        if comment_start >= 0:
+            line = line[:comment_start]
+        return line
+
+
+def _is_sequence_area(area: str) -> bool:
+    """Check if the first six columns look like a fixed-format sequence area."""
+    return area.isdigit() or not area.strip()
@@ -0,0 +1,152 @@
+"""Lazy, memoryview-backed access to the fields of one record.
+
+:class:`RecordView` wraps the raw bytes of a record and its compiled
+:class:`~cobol_data_structure.layout.LayoutPlan` and decodes a field only
+when it is read, so reading a handful of fields from a wide record costs a
+handful of decodes. Values are cached per view.
+
+Fields can be reached by item, dotted path or attribute access; in
+attribute names, underscores stand for hyphens:
+
+    >>> view = RecordView(plan, data)
+    >>> view["TYPE.CODE"] == view["TYPE"]["CODE"] == view.TYPE.CODE
+    True
+    >>> view["MONTH-DATA(3).SALES"] == view.MONTH_DATA[2].SALES
+    True
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+from cobol_data_structure.binary_parser import ParsedValue
+from cobol_data_structure.layout import LayoutPlan, as_plan
+from cobol_data_structure.models import CobolRecord
+
+
+class RecordView:
+    """Read-only view of one record, or of one group within it.
+
+    Groups are returned as views sharing the record's bytes and value cache;
+    OCCURS tables as lists with one view (or value) per occurrence.
+
+    Compile the layout once and pass the plan when creating many views;
+    passing a :class:`CobolRecord` compiles it for every view. Variable
+    (OCCURS DEPENDING ON) plans are resolved for the record's counts, so
+    tables list only the occurrences that exist.
+    """
+
+    __slots__ = ("_plan", "_buf", "_prefix", "_cache")
+
+    def __init__(
+        self,
+        layout: CobolRecord | LayoutPlan,
+        data: Any,
+        prefix: str = "",
+        cache: dict[int, ParsedValue] | None = None,
+    ) -> None:
+        """Wrap record bytes without copying them.
+
+        Args:
+            layout: Record or compiled plan
+            data: Record bytes; anything supporting the buffer protocol
+            prefix: Dotted path of the group this view exposes, ending in
+                ``.``; empty for the whole record
+            cache: Value cache shared with an enclosing view
+
+        Raises:
+            ValueError: If data is shorter than the record length, or an
+                OCCURS DEPENDING ON counter is invalid
+        """
+        plan = as_plan(layout)
+        buf = data if isinstance(data, memoryview) else memoryview(data)
+        if buf.ndim != 1 or buf.itemsize != 1:
+            buf = buf.cast("B")
+        plan = plan.resolve(buf)
+        if len(buf) < plan.record_length:
+            raise ValueError(f"Data length {len(buf)} is less than expected {plan.record_length}")
+        self._plan = plan
+        self._buf = buf
+        self._prefix = prefix
+        self._cache: dict[int, ParsedValue] = {} if cache is None else cache
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a field by name or dotted path relative to this view.
+
+        Raises:
+            KeyError: If no field or group has that path
+        """
+        path = self._prefix + key
+        plan = self._plan
+        index = plan.index.get(path)
+        if index is not None:
+            return self._value(index)
+        count = plan.groups.get(path)
+        if count is None:
+            raise KeyError(key)
+        if count == 0:
+            return RecordView(plan, self._buf, f"{path}.", self._cache)
+        return [self[f"{key}({i})"] for i in range(1, count + 1)]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        for key in (name.replace("_", "-"), name):
+            try:
+                return self[key]
+            except KeyError:
+                pass
+        raise AttributeError(name)
+
+    def __contains__(self, key: object) -> bool:
+        path = self._prefix + str(key)
+        return path in self._plan.index or path in self._plan.groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __repr__(self) -> str:
+        name = self._prefix[:-1] or self._plan.record_name
+        return f"RecordView({name!r}, fields={self.keys()!r})"
+
+    def _value(self, index: int) -> ParsedValue:
+        """Decode leaf ``index``, once per view."""
+        cache = self._cache
+        if index in cache:
+            return cache[index]
+        value = cache[index] = self._plan.decode_leaf(self._buf, index)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field by path, or ``default`` if there is none."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> list[str]:
+        """Names of the fields directly in this view, in record order.
+
+        Tables appear once, without a subscript.
+        """
+        prefix = self._prefix
+        names: dict[str, None] = {}
+        for path in self._plan.paths:
+            if path.startswith(prefix):
+                name = path[len(prefix) :].split(".", 1)[0].split("(", 1)[0]
+                names[name] = None
+        return list(names)
+
+    def to_dict(self) -> dict[str, ParsedValue]:
+        """Decode every field of the view into a flat ``{path: value}`` dict.
+
+        Paths are relative to the view, as in
+        :meth:`~cobol_data_structure.layout.LayoutPlan.decode`.
+        """
+        prefix = self._prefix
+        return {
+            path[len(prefix) :]: self._value(i)
+            for i, path in enumerate(self._plan.paths)
+            if path.startswith(prefix)
+        }
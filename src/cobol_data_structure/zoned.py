@@ -0,0 +1,368 @@
+"""Zoned-decimal (DISPLAY numeric) codec with overpunched signs.
+
+A signed DISPLAY numeric without SIGN SEPARATE stores its sign in the zone of
+the last digit (or the first one with SIGN LEADING), the *overpunch*:
+
+- EBCDIC: digits are 0xF0-0xF9; the sign digit has zone 0xC, 0xA or 0xE
+  (positive), 0xD or 0xB (negative) or 0xF (unsigned), e.g. ``0xF1 0xF2 0xD3``
+  is -123.
+- ASCII: digits are ``0``-``9``; the sign digit is ``{`` or ``A``-``I``
+  (positive, 0-9), ``}`` or ``J``-``R`` (negative, 0-9), ``p``-``y``
+  (negative, Micro Focus style) or a plain digit (positive).
+
+EBCDIC fields with SIGN SEPARATE keep plain 0xF0-0xF9 digits and store the
+sign in a byte of its own, ``+`` (0x4E) or ``-`` (0x60), e.g. ``0xF1 0xF2
+0xF3 0x60`` is -123. They use the ``"ebcdic-separate"`` table, whose sign
+bytes carry no digit; ASCII SIGN SEPARATE fields are plain text.
+
+Decoding is driven by 256-entry tables, one :class:`OverpunchTable` per
+convention. Digit bytes are mapped to ASCII digits with a single
+``bytes.translate`` call and passed to ``int()`` as bytes, so no ``str`` is
+created per value; invalid bytes translate to ``x`` and make ``int()`` fail.
+:func:`decode_zoned_array` does the same over an (N, n) NumPy matrix with
+table lookups and an int64 dot product with powers of ten.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import cache
+from typing import TYPE_CHECKING, Any, Union
+
+from cobol_data_structure import decoders
+from cobol_data_structure.models import CobolField, PictureCategory, UsageType
+from cobol_data_structure.packed import _numpy, _scaled_int, digits_to_int
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+    from numpy.ma import MaskedArray
+
+Number = Union[int, float]
+
+_INVALID = ord("x")
+
+
+@dataclass(frozen=True)
+class OverpunchTable:
+    """Byte tables of one zoned-decimal convention.
+
+    Attributes:
+        name: Convention name (``"ebcdic"``, ``"ascii"`` or
+            ``"ebcdic-separate"``)
+        digits: Translate table mapping digit bytes to ASCII digits and every
+            other byte to ``x``
+        punch_digits: Translate table mapping sign-position bytes to ASCII
+            digits and every other byte to ``x``
+        signs: Sign of each sign-position byte: 1, -1, or 0 if invalid
+        encode_digits: Translate table from ASCII digits to digit bytes
+        positive: Sign-position byte for each digit 0-9 of a positive value
+        negative: Sign-position byte for each digit 0-9 of a negative value
+        unsigned: Sign-position byte for each digit 0-9 of an unsigned field
+        separate: The sign is a byte of its own rather than a digit's zone
+    """
+
+    name: str
+    digits: bytes
+    punch_digits: bytes
+    signs: tuple[int, ...]
+    encode_digits: bytes
+    positive: bytes
+    negative: bytes
+    unsigned: bytes
+    separate: bool = False
+
+
+def _build_table(
+    name: str, digit_bytes: bytes, positive: list[bytes], negative: list[bytes]
+) -> OverpunchTable:
+    """Build the decode and encode tables of a convention.
+
+    Args:
+        name: Convention name
+        digit_bytes: The bytes of digits 0-9 in non-sign positions
+        positive: Groups of ten sign-position bytes (digits 0-9) meaning +
+        negative: Groups of ten sign-position bytes (digits 0-9) meaning -
+    """
+    digits = bytearray([_INVALID] * 256)
+    punch_digits = bytearray([_INVALID] * 256)
+    signs = [0] * 256
+    for sign, groups in ((1, positive), (-1, negative)):
+        for group in groups:
+            for digit, byte in enumerate(group):
+                punch_digits[byte] = 0x30 + digit
+                signs[byte] = sign
+    for digit, byte in enumerate(digit_bytes):
+        digits[byte] = 0x30 + digit
+    return OverpunchTable(
+        name=name,
+        digits=bytes(digits),
+        punch_digits=bytes(punch_digits),
+        signs=tuple(signs),
+        encode_digits=bytes.maketrans(b"0123456789", digit_bytes),
+        positive=positive[0],
+        negative=negative[0],
+        unsigned=digit_bytes,
+    )
+
+
+def _zone(zone: int) -> bytes:
+    """EBCDIC bytes of digits 0-9 with the given zone nibble."""
+    return bytes((zone << 4) | digit for digit in range(10))
+
+
+def _separate_table(name: str, base: OverpunchTable, plus: int, minus: int) -> OverpunchTable:
+    """Table of a convention whose sign is a separate ``+``/``-`` byte."""
+    signs = [0] * 256
+    signs[plus], signs[minus] = 1, -1
+    return OverpunchTable(
+        name=name,
+        digits=base.digits,
+        punch_digits=bytes([_INVALID] * 256),
+        signs=tuple(signs),
+        encode_digits=base.encode_digits,
+        positive=bytes([plus]) * 10,
+        negative=bytes([minus]) * 10,
+        unsigned=base.unsigned,
+        separate=True,
+    )
+
+
+EBCDIC = _build_table(
+    "ebcdic",
+    _zone(0xF),
+    positive=[_zone(0xC), _zone(0xF), _zone(0xA), _zone(0xE)],
+    negative=[_zone(0xD), _zone(0xB)],
+)
+
+ASCII = _build_table(
+    "ascii",
+    b"0123456789",
+    positive=[b"{ABCDEFGHI", b"0123456789"],
+    negative=[b"}JKLMNOPQR", b"pqrstuvwxy"],
+)
+
+EBCDIC_SEPARATE = _separate_table("ebcdic-separate", EBCDIC, plus=0x4E, minus=0x60)
+
+#: Tables by convention name, as stored in layout plan parameters.
+OVERPUNCH_TABLES: dict[str, OverpunchTable] = {
+    "ebcdic": EBCDIC,
+    "ascii": ASCII,
+    "ebcdic-separate": EBCDIC_SEPARATE,
+}
+
+
+@cache
+def is_ebcdic(encoding: str) -> bool:
+    """Whether an encoding is an EBCDIC code page (digits at 0xF0-0xF9)."""
+    try:
+        return "0123456789".encode(encoding) == EBCDIC.unsigned
+    except (LookupError, UnicodeEncodeError):
+        return False
+
+
+def overpunch_convention(field: CobolField) -> str | None:
+    """Name of the overpunch convention of a DISPLAY numeric field.
+
+    Returns:
+        ``"ebcdic"`` for fields in an EBCDIC encoding (``"ebcdic-separate"``
+        with SIGN SEPARATE), ``"ascii"`` for signed fields without SIGN
+        SEPARATE in other encodings, and None for fields decoded as plain
+        text (see :func:`decoders.decode_zoned`)
+    """
+    if field.picture_category != PictureCategory.NUMERIC or field.usage != UsageType.DISPLAY:
+        return None
+    if is_ebcdic(field.encoding):
+        return "ebcdic-separate" if field.sign_separate else "ebcdic"
+    if field.sign_separate:
+        return None
+    if field.is_signed:
+        return "ascii"
+    return None
+
+
+def unpack_zoned(data: bytes, table: OverpunchTable = EBCDIC, sign_leading: bool = False) -> int:
+    """Decode the unscaled integer held in a zoned-decimal field.
+
+    Args:
+        data: Field bytes (``bytes``, ``bytearray`` or ``memoryview``)
+        table: Overpunch convention
+        sign_leading: The sign is overpunched on the first digit (or, for
+            separate signs, is the first byte)
+
+    Raises:
+        ValueError: If a byte is not a digit or the sign byte is invalid
+    """
+    if type(data) is not bytes:
+        data = bytes(data)
+    if not data:
+        return 0
+    if sign_leading:
+        punch, body = data[0], data[1:]
+    else:
+        punch, body = data[-1], data[:-1]
+    sign = table.signs[punch]
+    if not sign:
+        raise ValueError(f"Invalid zoned sign byte: {hex(punch)}")
+    value = int(body.translate(table.digits)) if body else 0
+    if table.separate:
+        return sign * value
+    digit = table.punch_digits[punch] - 0x30
+    if sign_leading:
+        value += digit * 10 ** len(body)
+    else:
+        value = value * 10 + digit
+    return sign * value
+
+
+def decode_overpunch(
+    data: bytes, convention: str, is_signed: bool, decimal_places: int, sign_leading: bool
+) -> Number:
+    """Decode a zoned-decimal field with an overpunched sign.
+
+    ASCII fields that are not valid overpunch (leading spaces, an explicit
+    ``+``/``-``) are decoded as text by :func:`decoders.decode_zoned`.
+
+    Raises:
+        ValueError: If the field is not a number, or negative but unsigned
+    """
+    try:
+        value = unpack_zoned(data, OVERPUNCH_TABLES[convention], sign_leading)
+    except ValueError:
+        if convention != "ascii":
+            raise
+        return decoders.decode_zoned(data, is_signed, decimal_places)
+    if value < 0 and not is_signed:
+        raise ValueError(f"Negative value {value} in unsigned field")
+    return decoders.apply_scale(value, decimal_places)
+
+
+def decode_zoned_column(
+    values: Iterable[bytes],
+    table: OverpunchTable = EBCDIC,
+    is_signed: bool = True,
+    decimal_places: int = 0,
+    sign_leading: bool = False,
+) -> list[Number | None]:
+    """Decode a column of zoned values; invalid values become None.
+
+    Args:
+        values: Field byte strings, one per value
+        table: Overpunch convention
+        is_signed: Whether negative values are allowed
+        decimal_places: Implied decimal places
+        sign_leading: The sign is overpunched on the first digit
+
+    Returns:
+        Decoded values in input order
+    """
+    divisor = 10**decimal_places if decimal_places > 0 else 0
+    result: list[Number | None] = []
+    append = result.append
+    for data in values:
+        try:
+            value = unpack_zoned(data, table, sign_leading)
+        except ValueError:
+            append(None)
+            continue
+        if value < 0 and not is_signed:
+            append(None)
+            continue
+        append(value / divisor if divisor else value)
+    return result
+
+
+def encode_zoned(
+    value: int | float | Decimal,
+    length: int,
+    decimal_places: int = 0,
+    signed: bool = True,
+    table: OverpunchTable = EBCDIC,
+    sign_leading: bool = False,
+) -> bytes:
+    """Encode one value as a zoned-decimal field with an overpunched sign.
+
+    Args:
+        value: Number to encode; floats are rounded to ``decimal_places``
+        length: Field length in bytes: the digits, plus the sign byte for
+            separate-sign conventions
+        decimal_places: Implied decimal places
+        signed: Overpunch a sign; unsigned fields use plain digits
+        table: Overpunch convention
+        sign_leading: Overpunch the first digit instead of the last
+
+    Raises:
+        ValueError: If the value does not fit, or is negative for an
+            unsigned field
+    """
+    scaled = _scaled_int(value, decimal_places)
+    if scaled < 0 and not signed:
+        raise ValueError(f"Negative value {value} for unsigned zoned field")
+    text = str(abs(scaled))
+    digits = length - 1 if table.separate else length
+    if len(text) > digits:
+        raise ValueError(f"Value {value} does not fit in {digits} zoned digits")
+    data = bytearray(text.rjust(digits, "0").encode("ascii").translate(table.encode_digits))
+    if table.separate:
+        sign = (table.negative if scaled < 0 else table.positive)[:1]
+        return sign + bytes(data) if sign_leading else bytes(data) + sign
+    punches = table.negative if scaled < 0 else table.positive if signed else table.unsigned
+    position = 0 if sign_leading else -1
+    data[position] = punches[table.unsigned.index(data[position])]
+    return bytes(data)
+
+
+@cache
+def _array_tables(name: str) -> tuple[Any, Any, Any]:
+    """Digit, sign-digit and sign lookup arrays of a convention (-1 invalid)."""
+    np = _numpy()
+    table = OVERPUNCH_TABLES[name]
+    digits = np.frombuffer(table.digits, dtype=np.uint8).astype(np.int8) - 0x30
+    punch_digits = np.frombuffer(table.punch_digits, dtype=np.uint8).astype(np.int8) - 0x30
+    invalid = ord("x") - 0x30
+    digits[digits == invalid] = -1
+    punch_digits[punch_digits == invalid] = -1
+    return digits, punch_digits, np.asarray(table.signs, dtype=np.int8)
+
+
+def decode_zoned_array(
+    matrix: np.ndarray,
+    table: OverpunchTable = EBCDIC,
+    is_signed: bool = True,
+    decimal_places: int = 0,
+    sign_leading: bool = False,
+) -> np.ma.MaskedArray:
+    """Decode an (N, n) ``uint8`` matrix holding one zoned value per row.
+
+    Args:
+        matrix: Field bytes, one row per value
+        table: Overpunch convention
+        is_signed: Whether negative values are allowed
+        decimal_places: Implied decimal places
+        sign_leading: The sign is overpunched on the first digit
+
+    Returns:
+        Masked array of values; rows with an invalid byte are masked, as are
+        negative values of unsigned fields
+    """
+    np = _numpy()
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    digit_table, punch_table, sign_table = _array_tables(table.name)
+    position = 0 if sign_leading else -1
+    punch = matrix[:, position]
+    if table.separate:
+        digits = digit_table[matrix[:, 1:] if sign_leading else matrix[:, :-1]]
+    else:
+        digits = digit_table[matrix]
+        digits[:, position] = punch_table[punch]
+    sign = sign_table[punch]
+    valid = (digits >= 0).all(axis=1) & (sign != 0)
+    if not is_signed:
+        valid &= sign > 0
+    values = digits_to_int(np.where(digits >= 0, digits, 0))
+    values = np.where(sign < 0, -values, values)
+    if decimal_places > 0:
+        values = values / (10**decimal_places)
+    decoded: MaskedArray = np.ma.masked_array(values, mask=~valid)
+    return decoded
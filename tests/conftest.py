@@ -2,8 +2,51 @@
 
 import pytest
 
+from cobol_data_structure import CobolParser, CobolRecord
+
+LAST_DATA_SOURCE = """
+       01 LAST-DATA.
+           03 NAME PIC X(10).
+           03 TYPE.
+               05 CODE PIC 9(5) COMP-3.
+               05 DESC PIC X(10).
+           03 MONTH-DATA OCCURS 3 TIMES.
+               05 SALES PIC S9(3)V99 COMP-3.
+               05 FILLER PIC X.
+           03 COUNTER PIC 9(4) COMP.
+"""
+
+# NAME, TYPE.CODE, TYPE.DESC, MONTH-DATA (3 x SALES + FILLER), COUNTER
+LAST_DATA_BYTES = (
+    b"JOHN DOE  "
+    + b"\x12\x34\x5c"
+    + b"GOLD      "
+    + b"\x00\x12\x3c "
+    + b"\x04\x56\x7c "
+    + b"\x00\x01\x0d "
+    + b"\x00\x0a"
+)
+
 
 @pytest.fixture
 def sample_fixture():
     """Example fixture for testing."""
     return {"key": "value"}
+
+
+@pytest.fixture
+def last_data_source() -> str:
+    """COBOL source of the LAST-DATA record."""
+    return LAST_DATA_SOURCE
+
+
+@pytest.fixture
+def last_data_record() -> CobolRecord:
+    """The LAST-DATA record used throughout the design documents."""
+    return CobolParser().parse(LAST_DATA_SOURCE)[0]
+
+
+@pytest.fixture
+def last_data_bytes() -> bytes:
+    """Raw bytes of one LAST-DATA record."""
+    return LAST_DATA_BYTES
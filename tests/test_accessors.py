@@ -0,0 +1,72 @@
+"""Tests for precompiled field accessors."""
+
+import pytest
+
+from cobol_data_structure import AmbiguousReferenceError, CobolParser, compile_layout
+from cobol_data_structure.accessors import split_subscripts
+
+RATES_SOURCE = """
+       01 RATES.
+           03 MONTH OCCURS 2 TIMES.
+               05 DAY OCCURS 3 TIMES.
+                   07 RATE PIC 9(2).
+"""
+
+
+def test_matches_plan(last_data_record, last_data_bytes):
+    """Accessors decode the same values as the compiled plan."""
+    decoded = compile_layout(last_data_record).decode(last_data_bytes)
+    for path in ("NAME", "TYPE.CODE", "TYPE.DESC", "MONTH-DATA(3).SALES", "COUNTER"):
+        assert last_data_record.accessor(path)(last_data_bytes) == decoded[path]
+
+
+def test_reference_forms(last_data_record, last_data_bytes):
+    """Qualified names, trailing subscripts and open subscripts reach the same field."""
+    sales = last_data_record.accessor("MONTH-DATA(2).SALES")(last_data_bytes)
+    assert last_data_record.accessor("SALES OF MONTH-DATA (2)")(last_data_bytes) == sales
+    assert last_data_record.accessor("SALES")(last_data_bytes, 2) == sales
+    assert last_data_record.accessor("CODE OF TYPE")(last_data_bytes) == 12345
+
+
+def test_cached_per_record(last_data_record):
+    """Each reference is resolved once per record."""
+    accessor = last_data_record.accessor("TYPE.CODE")
+    assert last_data_record.accessor("TYPE.CODE") is accessor
+    assert (accessor.offset, accessor.length) == (10, 3)
+
+
+def test_nested_tables():
+    """Offsets follow the strides of every enclosing table."""
+    record = CobolParser().parse(RATES_SOURCE)[0]
+    data = b"".join(b"%02d" % (10 * month + day) for month in (1, 2) for day in (1, 2, 3))
+    rate = record.accessor("RATE")
+    assert rate.strides == (6, 2)
+    assert rate(data, 2, 3) == 23
+    assert record.accessor("MONTH(2).DAY.RATE")(data, 1) == 21
+    assert record.accessor("RATE OF DAY OF MONTH (1, 2)")(data) == 12
+    assert record.accessor("MONTH(2)")(data) == "212223"
+
+
+def test_errors(last_data_record, last_data_bytes):
+    """Bad references fail when the accessor is built, bad subscripts when it is called."""
+    with pytest.raises(KeyError):
+        last_data_record.accessor("TYPE.NOPE")
+    with pytest.raises(IndexError):
+        last_data_record.accessor("MONTH-DATA(4).SALES")
+    with pytest.raises(IndexError):
+        last_data_record.accessor("TYPE(1).CODE")
+    sales = last_data_record.accessor("MONTH-DATA.SALES")
+    with pytest.raises(IndexError):
+        sales(last_data_bytes)
+    with pytest.raises(IndexError):
+        sales(last_data_bytes, 0)
+    record = CobolParser().parse("01 R.\n 03 A.\n  05 CODE PIC X.\n 03 B.\n  05 CODE PIC X.\n")[0]
+    with pytest.raises(AmbiguousReferenceError):
+        record.accessor("CODE")
+
+
+def test_split_subscripts():
+    """Subscripts are collected in order, outermost first."""
+    assert split_subscripts("A(1).B(2, 3).C") == ("A.B.C", (1, 2, 3))
+    with pytest.raises(ValueError):
+        split_subscripts("A(I)")
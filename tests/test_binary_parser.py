@@ -0,0 +1,71 @@
+"""Integration tests for the binary data parser."""
+
+import struct
+
+from cobol_data_structure import BinaryDataParser, CobolParser
+
+
+def _parse(cobol, data):
+    records = CobolParser().parse(cobol)
+    return BinaryDataParser().parse(records[0], data)
+
+
+def test_binary_parsing_last_data(last_data_record, last_data_bytes):
+    """The LAST-DATA example from the design documents."""
+    result = BinaryDataParser().parse(last_data_record, last_data_bytes)
+    assert result["NAME"] == "JOHN DOE"
+    assert result["TYPE"] == {"CODE": 12345, "DESC": "GOLD"}
+    assert [m["SALES"] for m in result["MONTH-DATA"]] == [1.23, 45.67, -0.1]
+    assert result["COUNTER"] == 10
+
+
+def test_binary_parsing_comp3():
+    """COMP-3 packed decimal, positive and negative."""
+    assert _parse("01 R.\n 03 CODE PIC 9(5) COMP-3.", b"\x12\x34\x5c")["CODE"] == 12345
+    assert _parse("01 R.\n 03 BAL PIC S9(5) COMP-3.", b"\x12\x34\x5d")["BAL"] == -12345
+
+
+def test_binary_parsing_occurs():
+    """Elementary OCCURS returns a list."""
+    assert _parse("01 R.\n 03 MONTHS OCCURS 3 PIC 9(2).", b"010212")["MONTHS"] == [1, 2, 12]
+
+
+def test_binary_parsing_binary_and_float():
+    """COMP and COMP-2 values."""
+    cobol = "01 R.\n 03 N PIC S9(4) COMP.\n 03 F COMP-2."
+    data = (-2).to_bytes(2, "big", signed=True) + struct.pack(">d", 1.5)
+    assert _parse(cobol, data) == {"N": -2, "F": 1.5}
+
+
+def test_binary_parsing_invalid_value_warns():
+    """Undecodable fields become None with a warning."""
+    records = CobolParser().parse("01 R.\n 03 N PIC 9(3).")
+    parser = BinaryDataParser()
+    assert parser.parse(records[0], b"A1B") == {"N": None}
+    assert parser.warnings[0].field_name == "N"
+
+
+def test_binary_parsing_selected_fields(last_data_record, last_data_bytes):
+    """Only the selected fields, and the groups holding them, are parsed."""
+    result = BinaryDataParser().parse(
+        last_data_record, last_data_bytes, fields=["CODE OF TYPE", "MONTH-DATA.SALES"]
+    )
+    assert result == {
+        "TYPE": {"CODE": 12345},
+        "MONTH-DATA": [{"SALES": 1.23}, {"SALES": 45.67}, {"SALES": -0.1}],
+    }
+
+
+def test_binary_parsing_selected_fields_after_odo_table():
+    """Selected fields are placed by the OCCURS DEPENDING ON counts of each record."""
+    record = CobolParser().parse(
+        "01 R.\n 03 N PIC 9.\n 03 T OCCURS 1 TO 3 DEPENDING ON N.\n  05 V PIC X(2).\n"
+        " 03 AFTER PIC X(3)."
+    )[0]
+    parser = BinaryDataParser()
+    assert parser.parse(record, b"1AAXYZ", fields=["AFTER"]) == {"AFTER": "XYZ"}
+    assert parser.parse(record, b"2AABBXYZ", fields=["V", "AFTER"]) == {
+        "T": [{"V": "AA"}, {"V": "BB"}],
+        "AFTER": "XYZ",
+    }
+    assert parser.warnings == []
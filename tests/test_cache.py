@@ -0,0 +1,91 @@
+"""Tests for the on-disk parse cache."""
+
+import os
+import time
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout
+from cobol_data_structure.cache import ParseCache
+
+
+@pytest.fixture
+def no_parse(monkeypatch):
+    """Make any further parse fail, to prove results come from the cache."""
+
+    def fail(self, source):
+        raise AssertionError("source was parsed again")
+
+    return lambda: monkeypatch.setattr(CobolParser, "parse", fail)
+
+
+def test_hit_returns_parsed_records_and_plans(
+    tmp_path, no_parse, last_data_record, last_data_source
+):
+    """A second process-like load skips parsing and returns equal results."""
+    first = ParseCache(tmp_path).entry(last_data_source)
+    assert first.records == [last_data_record]
+    no_parse()
+    cache = ParseCache(tmp_path)
+    entry = cache.entry(last_data_source)
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert entry.records == first.records
+    assert entry.plans == [compile_layout(last_data_record)]
+    assert entry.plans[0].fingerprint == first.plans[0].fingerprint
+    code = entry.records[0].get_field_by_path("TYPE.CODE")
+    assert code.parent is entry.records[0].get_field("TYPE")
+
+
+def test_key_covers_source_and_options(tmp_path, last_data_source):
+    """Edited sources and different parser options are separate entries."""
+    cache = ParseCache(tmp_path)
+    cache.parse(last_data_source)
+    cache.parse(last_data_source.replace("X(10)", "X(12)"))
+    cache.parse(last_data_source, CobolParser(encoding="cp037"))
+    cache.parse(last_data_source)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(list(tmp_path.glob("*.cdsc"))) == 3
+
+
+def test_warnings_replayed_with_source_file(tmp_path):
+    """Cached warnings reach the parser as on a real parse."""
+    source = tmp_path / "BAD.cpy"
+    source.write_text("       05 ORPHAN PIC X.\n       01 R.\n           05 A PIC X.\n")
+    cache = ParseCache(tmp_path / "cache")
+    parsed, cached = CobolParser(), CobolParser()
+    cache.parse_file(source, parsed)
+    cache.parse_file(source, cached)
+    assert cache.hits == 1
+    assert [str(w) for w in cached.warnings] == [str(w) for w in parsed.warnings]
+    assert cached.warnings[0].source_file == source
+
+
+@pytest.mark.parametrize(
+    "damage", [lambda data: data[:-10], lambda data: data[:20] + b"x" + data[21:], lambda _: b""]
+)
+def test_damaged_entries_are_reparsed(tmp_path, damage, last_data_source):
+    """Truncated or corrupted files are deleted and replaced."""
+    cache = ParseCache(tmp_path)
+    cache.parse(last_data_source)
+    (path,) = tmp_path.glob("*.cdsc")
+    path.write_bytes(damage(path.read_bytes()))
+    assert cache.parse(last_data_source)[0].name == "LAST-DATA"
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.load(path.stem) is not None
+
+
+def test_eviction_by_age_and_size(tmp_path, last_data_source):
+    """Expired and least recently used entries are evicted."""
+    cache = ParseCache(tmp_path, max_age=3600)
+    sources = [last_data_source.replace("LAST-DATA", f"REC-{i}") for i in range(3)]
+    keys = [cache.entry(source).key for source in sources]
+    size = (tmp_path / f"{keys[0]}.cdsc").stat().st_size
+    old = time.time() - 7200
+    os.utime(tmp_path / f"{keys[0]}.cdsc", (old, old))
+    assert cache.load(keys[0]) is None
+    os.utime(tmp_path / f"{keys[1]}.cdsc", (old + 3700, old + 3700))
+    cache.max_bytes = size + size // 2
+    assert cache.evict() == 1
+    assert [path.stem for path in tmp_path.glob("*.cdsc")] == [keys[2]]
+    cache.clear()
+    assert not list(tmp_path.glob("*.cdsc"))
@@ -0,0 +1,94 @@
+"""Tests for generated layout-specific decoders."""
+
+import struct
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout
+from cobol_data_structure.codegen import compile_decoder, generate_decoder_source
+
+MIXED_SOURCE = """
+    01 MIXED.
+        03 TXT PIC X(4).
+        03 ZON PIC S9(3)V9.
+        03 UZN PIC 9(3).
+        03 PKD PIC S9(5)V99 COMP-3.
+        03 BIN PIC S9(9) COMP.
+        03 UBN PIC 9(4) BINARY.
+        03 FLT COMP-2.
+        03 NAT PIC N(2).
+        03 ALT REDEFINES NAT PIC X(4).
+"""
+
+MIXED_BYTES = (
+    b"AB  "
+    + b"-123"
+    + b"042"
+    + b"\x00\x12\x34\x5d"
+    + (-7).to_bytes(4, "big", signed=True)
+    + (65535).to_bytes(2, "big")
+    + struct.pack(">d", 2.25)
+    + "hi".encode("utf-16-be")
+)
+
+
+@pytest.fixture
+def mixed_record():
+    """Record with one field of every supported codec."""
+    return CobolParser().parse(MIXED_SOURCE)[0]
+
+
+def test_generated_decoder_matches_plan(mixed_record, last_data_record, last_data_bytes):
+    """Generated decoders return exactly what the plan returns."""
+    for record, data in ((mixed_record, MIXED_BYTES), (last_data_record, last_data_bytes)):
+        plan = compile_layout(record)
+        decoder = compile_decoder(plan)
+        assert decoder(data) == plan.decode(data)
+        assert decoder(memoryview(data)) == plan.decode(data)
+
+
+def test_generated_source_inlines_constants(last_data_record):
+    """Offsets and scales appear as literals in the source."""
+    source = generate_decoder_source(compile_layout(last_data_record))
+    assert "buf[23:26].hex()" in source
+    assert "/ 100" in source
+    assert "MONTH-DATA(3).SALES" in source
+
+
+def test_generated_decoder_falls_back_on_invalid_field(mixed_record):
+    """A record with an undecodable field takes the plan's tolerant path."""
+    data = bytearray(MIXED_BYTES)
+    data[8:11] = b"ABC"  # UZN is not numeric
+    result = compile_decoder(mixed_record)(bytes(data))
+    assert result["UZN"] is None
+    assert result["TXT"] == "AB"
+
+
+def test_generated_decoder_short_data(last_data_record):
+    """Short buffers are rejected like in the plan."""
+    with pytest.raises(ValueError, match="less than expected"):
+        compile_decoder(last_data_record)(b"x")
+
+
+def test_decoder_disk_cache(tmp_path, last_data_record, last_data_bytes, monkeypatch):
+    """Sources are written once and reused by fingerprint."""
+    first = compile_decoder(last_data_record, cache_dir=tmp_path)
+    assert first.path.parent == tmp_path
+    assert first.path.read_text(encoding="utf-8") == first.source
+
+    def fail(plan):
+        raise AssertionError("source should come from the cache")
+
+    monkeypatch.setattr("cobol_data_structure.codegen.generate_decoder_source", fail)
+    second = compile_decoder(last_data_record, cache_dir=tmp_path)
+    assert second.fingerprint == first.fingerprint
+    assert second(last_data_bytes) == first(last_data_bytes)
+
+
+def test_fingerprint_tracks_layout():
+    """Different layouts have different fingerprints."""
+    one = compile_layout(CobolParser().parse("01 R.\n 03 A PIC X(3).")[0])
+    same = compile_layout(CobolParser().parse("01 Q.\n 03 A PIC X(3).")[0])
+    other = compile_layout(CobolParser().parse("01 R.\n 03 A PIC X(4).")[0])
+    assert one.fingerprint == same.fingerprint
+    assert one.fingerprint != other.fingerprint
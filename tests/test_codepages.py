@@ -0,0 +1,131 @@
+"""Tests for bulk EBCDIC translation."""
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout
+from cobol_data_structure.codepages import (
+    EBCDIC_CODE_PAGES,
+    SUBSTITUTE,
+    RecordTranslator,
+    translation_table,
+)
+
+SOURCE = """
+    01 CUSTOMER.
+       03 NAME      PIC X(6).
+       03 BALANCE   PIC S9(5)V99 COMP-3.
+       03 CITY      PIC X(4).
+       03 VISITS    PIC 9(4) COMP.
+       03 RATING    PIC S9(2).
+"""
+
+
+@pytest.fixture
+def ebcdic_record():
+    """Record parsed for cp037 data."""
+    return CobolParser(encoding="cp037").parse(SOURCE)[0]
+
+
+def make_record(name, balance, city, visits, rating):
+    """Build one cp037 CUSTOMER record."""
+    return (
+        name.ljust(6).encode("cp037")
+        + balance
+        + city.ljust(4).encode("cp037")
+        + visits.to_bytes(2, "big")
+        + rating
+    )
+
+
+ROWS = [
+    make_record("ALICE", bytes.fromhex("0012345c"), "ROME", 0x4040, bytes.fromhex("f1d2")),
+    make_record("BOB", bytes.fromhex("4040404c"), "OSLO", 7, bytes.fromhex("f0c5")),
+]
+
+
+@pytest.mark.parametrize("encoding", EBCDIC_CODE_PAGES)
+def test_translation_table_matches_codec(encoding):
+    """Every character representable in Latin-1 round-trips through the table."""
+    table = translation_table(encoding)
+    source = bytes(range(256))
+    expected = source.decode(encoding)
+    translated = source.translate(table).decode("latin-1")
+    for got, want in zip(translated, expected):
+        assert got == want or (ord(got) == SUBSTITUTE and ord(want) > 0xFF)
+
+
+def test_translation_table_substitutes_unmappable():
+    """The cp1140 euro sign has no Latin-1 byte, but does in cp1252."""
+    assert translation_table("cp1140")[0x9F] == SUBSTITUTE
+    assert bytes([0x9F]).translate(translation_table("cp1140", "cp1252")) == "€".encode("cp1252")
+
+
+def test_translation_table_rejects_multibyte():
+    """Only single-byte source encodings can be tabulated."""
+    with pytest.raises(ValueError, match="single-byte"):
+        translation_table("utf-8")
+
+
+def test_non_text_bytes_are_untouched(ebcdic_record):
+    """Packed, binary and zoned bytes keep their original values."""
+    translator = RecordTranslator(ebcdic_record)
+    assert translator.encoding == "cp037"
+    assert translator.keep_spans == ((6, 10), (14, 18))
+    out = translator.translate(ROWS[0])
+    assert out[:6] == b"ALICE " and out[10:14] == b"ROME"
+    assert out[6:10] == ROWS[0][6:10] and out[14:] == ROWS[0][14:]
+
+
+@pytest.mark.parametrize("copies", [1, 50])
+def test_translated_plan_matches_original(ebcdic_record, copies):
+    """Decoding translated records gives the same values, in both copy modes."""
+    translator = RecordTranslator(ebcdic_record)
+    data = b"".join(ROWS) * copies
+    out = translator.translate(data)
+    plan = compile_layout(ebcdic_record)
+    assert translator.plan.params[0] == ("latin-1",)
+    length = translator.record_length
+    for i in range(0, len(data), length):
+        assert translator.plan.decode(out[i : i + length]) == plan.decode(data[i : i + length])
+
+
+def test_translated_plan_tables():
+    """Stride tables of text leaves decode the translated bytes with the target."""
+    source = "01 R.\n 03 ITEM OCCURS 2.\n  05 CODE PIC X(2).\n  05 QTY PIC S9(2) COMP-3."
+    record = CobolParser(encoding="cp037").parse(source)[0]
+    translator = RecordTranslator(record)
+    data = "AB".encode("cp037") + b"\x01\x2c" + "CD".encode("cp037") + b"\x03\x4d"
+    out = translator.translate(data)
+    codes = translator.plan.tables["ITEM.CODE"]
+    assert codes.params == ("latin-1",) and codes.decode(out) == ["AB", "CD"]
+    assert translator.plan.tables["ITEM.QTY"].decode(out) == [12, -34]
+    assert translator.plan.decode(out)["ITEM(2).CODE"] == "CD"
+
+
+def test_redefined_text_over_binary_not_translated():
+    """Text leaves overlapping non-text bytes are decoded from original bytes."""
+    source = "01 R.\n 03 N PIC 9(4) COMP.\n 03 T REDEFINES N PIC X(2).\n 03 U PIC X(2)."
+    record = CobolParser(encoding="cp500").parse(source)[0]
+    translator = RecordTranslator(record)
+    assert translator.keep_spans == ((0, 2),)
+    assert translator.plan.params == (compile_layout(record).params[0], ("cp500",), ("latin-1",))
+    data = "ABCD".encode("cp500")
+    assert translator.plan.decode(translator.translate(data)) == compile_layout(record).decode(data)
+
+
+def test_translate_file(ebcdic_record, tmp_path):
+    """Files are translated in chunks of whole records."""
+    source = tmp_path / "in.dat"
+    source.write_bytes(b"".join(ROWS) * 5)
+    translator = RecordTranslator(ebcdic_record)
+    written = translator.translate_file(source, tmp_path / "out.dat", chunk_records=3)
+    assert written == source.stat().st_size
+    assert (tmp_path / "out.dat").read_bytes() == translator.translate(source.read_bytes())
+
+
+def test_no_text_fields():
+    """A record without text needs an explicit encoding."""
+    record = CobolParser().parse("01 R.\n 03 N PIC 9(4) COMP.")[0]
+    with pytest.raises(ValueError, match="no text fields"):
+        RecordTranslator(record)
+    assert RecordTranslator(record, encoding="cp037").translate(b"\x00\x01") == b"\x00\x01"
@@ -0,0 +1,119 @@
+"""Tests for the COPY statement resolver."""
+
+import os
+
+import pytest
+
+from cobol_data_structure import CobolParser
+from cobol_data_structure.copybooks import CopybookResolver, apply_replacing
+
+PROGRAM = """\
+000100 IDENTIFICATION DIVISION.
+000200 PROGRAM-ID. BILLING.
+000300 DATA DIVISION.
+000400 WORKING-STORAGE SECTION.
+000500 01 WS-CUSTOMER.
+000600     COPY CUSTFLDS REPLACING ==:PFX:== BY ==WS==
+000700                             LEADING ==OLD== BY ==NEW==.
+000800 01 IN-CUSTOMER.
+000900     COPY CUSTFLDS REPLACING ==:PFX:== BY ==IN==
+001000                             LEADING ==OLD== BY ==NEW==.
+001100     COPY "TRAILER" OF COMMON.
+001200 PROCEDURE DIVISION.
+001300     DISPLAY 'COPY NOTHING'.
+"""
+
+CUSTFLDS = """\
+      * Customer fields
+           05 :PFX:-ID       PIC 9(6).
+           05 :PFX:-NAME     PIC X(20).
+           05 OLD-STATUS     PIC X.          *> LEADING replaced
+           05 FILLER         PIC X(3) VALUE ':PFX:'.
+"""
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Copybook directory with a library sub-directory."""
+    (tmp_path / "copy" / "common").mkdir(parents=True)
+    (tmp_path / "copy" / "CUSTFLDS.cpy").write_text(CUSTFLDS)
+    (tmp_path / "copy" / "common" / "trailer.cpy").write_text("       05 TRAILER PIC X(2).\n")
+    program = tmp_path / "BILLING.cbl"
+    program.write_text(PROGRAM)
+    return tmp_path
+
+
+def test_expand_with_replacing(library):
+    """Members are inlined with REPLACING applied outside literals."""
+    resolver = CopybookResolver([library / "copy"])
+    expanded = resolver.expand_file(library / "BILLING.cbl")
+    records = CobolParser().parse(expanded)
+    assert [r.name for r in records] == ["WS-CUSTOMER", "IN-CUSTOMER"]
+    assert [f.name for f in records[0].fields] == ["WS-ID", "WS-NAME", "NEW-STATUS", "FILLER"]
+    assert [f.name for f in records[1].fields][:2] == ["IN-ID", "IN-NAME"]
+    assert records[1].fields[-1].name == "TRAILER"
+    assert "VALUE ':PFX:'" in expanded
+    assert "DISPLAY 'COPY NOTHING'" in expanded
+    assert resolver.warnings == []
+
+
+def test_memoized_by_member_and_replacing(library):
+    """Each (copybook, REPLACING) pair is expanded once."""
+    resolver = CopybookResolver([library / "copy"])
+    resolver.expand_file(library / "BILLING.cbl")
+    assert (resolver.hits, resolver.misses) == (0, 3)
+    resolver.expand_file(library / "BILLING.cbl")
+    assert (resolver.hits, resolver.misses) == (3, 3)
+    trailer = library / "copy" / "common" / "trailer.cpy"
+    trailer.write_text("       05 TRAILER PIC X(4).\n")
+    os.utime(trailer, ns=(0, 1))
+    assert "X(4)" in resolver.expand_file(library / "BILLING.cbl")
+    assert (resolver.hits, resolver.misses) == (5, 4)
+
+
+def test_dependency_graph_and_invalidation(library):
+    """Invalidating a copybook reports exactly its dependents."""
+    (library / "copy" / "OUTER.cpy").write_text("       01 OUTER.\n           COPY CUSTFLDS.\n")
+    (library / "OTHER.cbl").write_text("       01 OTHER-REC PIC X.\n")
+    (library / "USER.cbl").write_text("       COPY OUTER.\n")
+    resolver = CopybookResolver([library / "copy"])
+    for name in ("BILLING.cbl", "OTHER.cbl", "USER.cbl"):
+        resolver.expand_file(library / name)
+    outer = str((library / "copy" / "OUTER.cpy").resolve())
+    billing = str((library / "BILLING.cbl").resolve())
+    user = str((library / "USER.cbl").resolve())
+    assert resolver.dependents(library / "copy" / "CUSTFLDS.cpy") == {billing, outer, user}
+    custflds = str((library / "copy" / "CUSTFLDS.cpy").resolve())
+    assert resolver.dependencies(user) == {outer, custflds}
+    misses = resolver.misses
+    assert resolver.invalidate(library / "copy" / "OUTER.cpy") == {user}
+    resolver.expand_file(library / "USER.cbl")
+    assert resolver.misses == misses + 1  # Only OUTER is expanded again
+
+    (library / "USER.cbl").write_text("       01 USER-REC PIC X.\n")
+    resolver.expand_file(library / "USER.cbl")
+    assert user not in resolver.dependents(library / "copy" / "OUTER.cpy")
+
+
+def test_missing_and_recursive_copybooks(tmp_path):
+    """Unresolvable and recursive COPY statements become warnings."""
+    (tmp_path / "LOOP.cpy").write_text("       05 A PIC X.\n       COPY LOOP.\n")
+    resolver = CopybookResolver([tmp_path])
+    expanded = resolver.expand("       01 R.\n       COPY LOOP.\n       COPY NOPE.\n")
+    assert [f.name for f in CobolParser().parse(expanded)[0].fields] == ["A"]
+    messages = [w.message for w in resolver.warnings]
+    assert any("Recursive" in m for m in messages)
+    assert any("NOPE not found" in m for m in messages)
+    resolver.expand("       COPY LOOP")
+    assert "Unterminated" in resolver.warnings[-1].message
+
+
+def test_apply_replacing_forms():
+    """Word, pseudo-text, literal, LEADING and TRAILING operands."""
+    text = "05 A-AMT PIC 9. 05 AMT PIC 9 VALUE 'AMT'. 05 X-AMT-TOT\n PIC 9(4)."
+    assert apply_replacing(text, [("", "AMT", "QTY")]) == text.replace("05 AMT PIC", "05 QTY PIC")
+    assert apply_replacing(text, [("", "'AMT'", "'QTY'")]).count("'QTY'") == 1
+    assert apply_replacing(text, [("TRAILING", "-TOT", "-SUM")]).endswith("X-AMT-SUM\n PIC 9(4).")
+    assert apply_replacing(text, [("", "X-AMT-TOT PIC", "Y PIC")]).endswith("05 Y PIC 9(4).")
+    swapped = apply_replacing("05 A. 05 B.", [("", "A", "B"), ("", "B", "A")])
+    assert swapped == "05 B. 05 A."
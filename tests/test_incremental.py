@@ -0,0 +1,120 @@
+"""Tests for incremental reparsing."""
+
+import pytest
+
+from cobol_data_structure import CobolParser
+from cobol_data_structure.incremental import IncrementalParser
+
+PROGRAM = """\
+       IDENTIFICATION DIVISION.
+       PROGRAM-ID. DEMO.
+       DATA DIVISION.
+       WORKING-STORAGE SECTION.
+       01 REC-A.
+           05 A-NAME PIC X(10).
+           05 A-CODE PIC 9(5) COMP-3.
+       77 COUNTER PIC 9(4) COMP.
+       01 REC-B.
+           05 B-BAD PIC Q(3).
+           05 B-ITEM PIC 9(3) OCCURS 4 TIMES.
+       PROCEDURE DIVISION.
+           STOP RUN.
+"""
+
+
+def test_first_parse_matches_parser():
+    """Without history every record is parsed, as by CobolParser."""
+    incremental = IncrementalParser()
+    result = incremental.parse(PROGRAM)
+    assert result.records == CobolParser().parse(PROGRAM)
+    assert result.parsed == ["REC-A", "COUNTER", "REC-B"]
+    assert result.reused == 0
+
+
+def test_only_changed_records_are_reparsed():
+    """Unchanged records and their layouts are reused as the same objects."""
+    incremental = IncrementalParser()
+    first = incremental.parse(PROGRAM)
+    plans = incremental.plans()
+    edited = PROGRAM.replace("A-CODE PIC 9(5)", "A-CODE PIC 9(7)")
+    second = incremental.parse(edited)
+    assert second.parsed == ["REC-A"]
+    assert second.reused == 2
+    assert second.records == CobolParser().parse(edited)
+    assert second.records[1:] == first.records[1:]
+    assert all(a is b for a, b in zip(second.records[1:], first.records[1:]))
+    new_plans = incremental.plans()
+    assert new_plans[0] is not plans[0] and new_plans[1:] == plans[1:]
+    assert all(a is b for a, b in zip(new_plans[1:], plans[1:]))
+
+
+def test_reparse_uses_the_parser_tokenizer():
+    """Changed ranges are tokenized as a full parse tokenizes them."""
+    incremental = IncrementalParser()
+    incremental.parse(PROGRAM)
+    # A repeated clause, which COBOL does not allow: the scanner keeps the last one
+    edited = PROGRAM.replace("A-NAME PIC X(10).", "A-NAME PIC X(10) PIC X(12).")
+    result = incremental.parse(edited)
+    assert result.parsed == ["REC-A"]
+    assert result.records == CobolParser().parse(edited)
+    assert result.records[0].total_length == 15
+
+
+def test_comments_and_moved_lines_do_not_reparse():
+    """Comment edits and inserted lines keep records; warning lines follow."""
+    incremental = IncrementalParser()
+    first = incremental.parse(PROGRAM)
+    line = first.records[2].warnings[0].line_number
+    edited = PROGRAM.replace(
+        "       WORKING-STORAGE SECTION.\n",
+        "       WORKING-STORAGE SECTION.\n      * New comment\n\n",
+    ).replace("05 A-NAME PIC X(10).", "05 A-NAME PIC X(10).           *> note")
+    result = incremental.parse(edited)
+    assert result.parsed == []
+    assert result.reused == 3
+    assert result.records[2].warnings[0].line_number == line + 2
+    assert first.records[2].warnings[0].line_number == line  # Returned warnings are not changed
+    assert first.records[2] is not result.records[2] and first.records[:2] == result.records[:2]
+    parser = CobolParser()
+    parser.parse(edited)
+    expected = [str(w) for w in parser.warnings]
+    assert [str(w) for w in incremental.parser.warnings[-len(expected) :]] == expected
+
+
+def test_record_boundaries_and_duplicates():
+    """Split, merged and duplicated records are handled per range."""
+    incremental = IncrementalParser()
+    incremental.parse(PROGRAM)
+    duplicated = PROGRAM.replace(
+        "       PROCEDURE",
+        "       01 REC-A.\n           05 A-NAME PIC X(10).\n"
+        "           05 A-CODE PIC 9(5) COMP-3.\n       PROCEDURE",
+    )
+    result = incremental.parse(duplicated)
+    assert result.parsed == ["REC-A"]
+    assert [r.name for r in result.records] == ["REC-A", "COUNTER", "REC-B", "REC-A"]
+    merged = PROGRAM.replace("       77 COUNTER PIC 9(4) COMP.\n", "")
+    assert incremental.parse(merged).parsed == []
+    assert incremental.parse(merged.replace("01 REC-B", "05 REC-B")).parsed == ["REC-A"]
+
+
+def test_options_and_documents_are_separate(tmp_path):
+    """Documents are tracked separately and state can be dropped."""
+    path = tmp_path / "DEMO.cbl"
+    path.write_text(PROGRAM)
+    incremental = IncrementalParser()
+    incremental.parse_file(path)
+    assert incremental.parse(PROGRAM).reused == 0
+    result = incremental.parse_file(path)
+    assert result.reused == 3
+    incremental.forget(str(path))
+    assert incremental.parse_file(path).reused == 0
+    assert incremental.parser.warnings[-1].source_file == path
+    other = IncrementalParser(CobolParser(encoding="cp037"))
+    assert other.parse(PROGRAM).records[0].fields[0].encoding == "cp037"
+
+
+@pytest.mark.parametrize("source", ["", "       05 ORPHAN PIC X.\n"])
+def test_sources_without_records(source):
+    """Sources without records parse to nothing."""
+    assert IncrementalParser().parse(source).records == []
@@ -0,0 +1,131 @@
+"""Tests for compiled layout plans."""
+
+import pytest
+
+from cobol_data_structure import BinaryDataParser, CobolParser, compile_layout
+from cobol_data_structure.layout import CODEC_ALPHANUMERIC, CODEC_PACKED
+
+
+def test_compile_layout_flattens_leaves(last_data_record):
+    """Every named leaf is expanded, OCCURS included, FILLER excluded."""
+    plan = compile_layout(last_data_record)
+    assert plan.paths == (
+        "NAME",
+        "TYPE.CODE",
+        "TYPE.DESC",
+        "MONTH-DATA(1).SALES",
+        "MONTH-DATA(2).SALES",
+        "MONTH-DATA(3).SALES",
+        "COUNTER",
+    )
+    assert plan.offsets == (0, 10, 13, 23, 27, 31, 35)
+    assert plan.lengths == (10, 3, 10, 3, 3, 3, 2)
+    assert plan.codecs[:2] == (CODEC_ALPHANUMERIC, CODEC_PACKED)
+    assert plan.record_length == 37
+
+
+def test_plan_decode(last_data_record, last_data_bytes):
+    """Decoding with the plan matches the tree-walking parser."""
+    plan = compile_layout(last_data_record)
+    flat = plan.decode(last_data_bytes)
+    nested = BinaryDataParser().parse(last_data_record, last_data_bytes)
+    assert flat["TYPE.CODE"] == nested["TYPE"]["CODE"]
+    assert [flat[f"MONTH-DATA({i}).SALES"] for i in (1, 2, 3)] == [
+        m["SALES"] for m in nested["MONTH-DATA"]
+    ]
+    assert plan.decode_values(memoryview(last_data_bytes)) == list(flat.values())
+
+
+def test_plan_nested_occurs():
+    """Nested OCCURS strides are precomputed into leaf offsets."""
+    record = CobolParser().parse("""
+    01 R.
+        03 QUARTER OCCURS 2.
+            05 MONTH OCCURS 3.
+                07 SALES PIC 9(2).
+    """)[0]
+    plan = compile_layout(record)
+    assert plan.paths[4] == "QUARTER(2).MONTH(2).SALES"
+    assert plan.offsets == (0, 2, 4, 6, 8, 10)
+    assert plan.decode(b"010203040506")["QUARTER(2).MONTH(3).SALES"] == 6
+
+
+def test_plan_stride_tables():
+    """Leaves in tables get closed-form offsets matching the expanded plan."""
+    record = CobolParser().parse("""
+    01 R.
+        03 MONTH OCCURS 3.
+            05 TOTAL PIC 9(2).
+            05 DAY OCCURS 4.
+                07 HOUR OCCURS 2.
+                    09 RATE PIC 9(2).
+                    09 FLAG PIC X.
+    """)[0]
+    plan = compile_layout(record)
+    rate = plan.tables["MONTH.DAY.HOUR.RATE"]
+    assert (rate.offset, rate.strides, rate.counts) == (2, (26, 6, 3), (3, 4, 2))
+    assert "TOTAL" not in plan.tables and len(rate) == 24
+    assert rate.offset_of(3, 2, 1) == plan.offsets[plan.index["MONTH(3).DAY(2).HOUR(1).RATE"]]
+    rates = [i for i, path in enumerate(plan.paths) if path.endswith("RATE")]
+    assert rate.offsets() == [plan.offsets[i] for i in rates]
+
+    data = bytes(range(48, 48 + record.total_length))
+    decoded = plan.decode(data)
+    assert rate.decode_at(data, 2, 4, 2) == decoded["MONTH(2).DAY(4).HOUR(2).RATE"]
+    assert plan.tables["MONTH.DAY.HOUR.FLAG"].decode(data) == [
+        value for path, value in decoded.items() if path.endswith("FLAG")
+    ]
+    with pytest.raises(IndexError):
+        rate.offset_of(1, 5, 1)
+
+
+def test_plan_select(last_data_record, last_data_bytes):
+    """Selected plans keep only the leaves below the references."""
+    plan = compile_layout(last_data_record)
+    selected = plan.select(["TYPE", "MONTH-DATA.SALES", "COUNTER"])
+    assert selected.paths == plan.paths[1:]
+    assert set(selected.tables) == {"MONTH-DATA.SALES"}
+    assert selected.decode(last_data_bytes) == {
+        path: value for path, value in plan.decode(last_data_bytes).items() if path != "NAME"
+    }
+    assert selected.fingerprint != plan.fingerprint
+
+    partial = compile_layout(last_data_record, fields=["MONTH-DATA(2)", "type.desc"])
+    assert partial.paths == ("TYPE.DESC", "MONTH-DATA(2).SALES")
+    assert partial.tables == {}
+    with pytest.raises(KeyError):
+        plan.select(["MONTH-DATA(4)"])
+
+
+def test_plan_redefines_and_invalid_data():
+    """Both views of a REDEFINES are decoded; invalid bytes give None."""
+    record = CobolParser().parse("01 R.\n 03 TXT PIC X(3).\n 03 NUM REDEFINES TXT PIC 9(3).")[0]
+    plan = compile_layout(record)
+    assert plan.decode(b"123") == {"TXT": "123", "NUM": 123}
+    assert plan.decode(b"ABC") == {"TXT": "ABC", "NUM": None}
+
+
+def test_plan_short_data_raises(last_data_record):
+    """Data shorter than the record is rejected."""
+    with pytest.raises(ValueError, match="less than expected"):
+        compile_layout(last_data_record).decode_values(b"short")
+
+
+def test_plan_is_immutable(last_data_record):
+    """Plans are frozen."""
+    plan = compile_layout(last_data_record)
+    with pytest.raises(AttributeError):
+        plan.offsets = ()  # type: ignore[misc]
+
+
+def test_plan_index_and_groups(last_data_record):
+    """Leaf positions, group paths and table sizes are derived from the paths."""
+    plan = compile_layout(last_data_record)
+    assert plan.index["TYPE.DESC"] == 2
+    assert plan.groups == {
+        "TYPE": 0,
+        "MONTH-DATA": 3,
+        "MONTH-DATA(1)": 0,
+        "MONTH-DATA(2)": 0,
+        "MONTH-DATA(3)": 0,
+    }
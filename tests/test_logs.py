@@ -0,0 +1,73 @@
+"""Tests for MOVE capture extraction from logs."""
+
+import re
+
+import pytest
+
+from cobol_data_structure import RecordView, compile_layout
+from cobol_data_structure.logs import MoveCapture, MoveLogExtractor, extract_moves
+
+
+@pytest.fixture
+def log_file(tmp_path, last_data_bytes):
+    """Log mixing captures with unrelated lines."""
+    lines = [
+        b"2024-05-01 10:15:01.000 INFO starting batch",
+        b"2024-05-01 10:15:02.123 DEBUG PGM01 MOVE QU01-DATA TO LAST-DATA HEX="
+        + last_data_bytes.hex().upper().encode(),
+        b"2024-05-01 10:15:02.500 DEBUG PGM01 MOVE WS-A TO WS-B VALUE='AB 'C'",
+        b"2024-05-01T10:15:03,9 DEBUG MOVE QU01-DATA TO LAST-DATA HEX=ABC",
+        b"2024-05-01 10:15:04.000 INFO MOVE without operands",
+        b'2024-05-01 10:15:05.000 DEBUG move qu01-data to last-data data="x"\r',
+    ]
+    path = tmp_path / "app.log"
+    path.write_bytes(b"\n".join(lines))
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_extract_moves(log_file, last_data_bytes, use_mmap):
+    """Hex and raw payloads are extracted; other lines are skipped."""
+    extractor = MoveLogExtractor()
+    captures = list(extractor.extract(log_file, use_mmap=use_mmap))
+    assert captures == [
+        MoveCapture("2024-05-01 10:15:02.123", "QU01-DATA", "LAST-DATA", last_data_bytes),
+        MoveCapture("2024-05-01 10:15:02.500", "WS-A", "WS-B", b"AB 'C"),
+    ]
+    assert len(extractor.warnings) == 1
+    assert "Invalid hex payload" in extractor.warnings[0].message
+
+
+def test_filter_by_operands(log_file):
+    """Captures can be restricted to a source or target variable."""
+    assert [c.source for c in extract_moves(log_file, target="last-data")] == ["QU01-DATA"]
+    assert [c.target for c in extract_moves(log_file, source="WS-A", use_mmap=False)] == ["WS-B"]
+
+
+def test_captures_feed_decoder(log_file, last_data_record):
+    """Payloads decode with the target layout."""
+    plan = compile_layout(last_data_record)
+    (capture,) = extract_moves(log_file, target="LAST-DATA")
+    assert RecordView(plan, capture.payload).to_dict() == plan.decode(capture.payload)
+
+
+def test_custom_pattern():
+    """Other formats are matched with a pattern using the same groups."""
+    pattern = re.compile(
+        rb"\[(?P<timestamp>[^\]]+)\] (?P<source>\S+) -> (?P<target>\S+) "
+        rb"(?:0x(?P<hex>[0-9a-f]+)|(?P<raw>.*))$",
+        re.IGNORECASE,
+    )
+    extractor = MoveLogExtractor(pattern, keyword=b"->")
+    lines = [b"[t1] A -> B 0x0102\n", b"[t2] C -> D plain\n", b"no arrow\n"]
+    assert list(extractor.iter_lines(lines)) == [
+        MoveCapture("t1", "A", "B", b"\x01\x02"),
+        MoveCapture("t2", "C", "D", b"plain"),
+    ]
+
+
+def test_empty_log(tmp_path):
+    """An empty file yields nothing."""
+    path = tmp_path / "empty.log"
+    path.write_bytes(b"")
+    assert list(extract_moves(path)) == []
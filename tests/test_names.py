@@ -0,0 +1,92 @@
+"""Tests for qualified data-name resolution."""
+
+import pickle
+
+import pytest
+
+from cobol_data_structure import AmbiguousReferenceError, CobolParser
+from cobol_data_structure.names import parse_reference
+
+DUPLICATES_SOURCE = """
+01 ORDER-REC.
+    05 CUSTOMER.
+        10 CODE PIC X(4).
+        10 ADDRESS.
+            15 DATE PIC 9(8).
+    05 PRODUCT.
+        10 CODE PIC X(6).
+        10 DATE PIC 9(8).
+    05 FILLER.
+        10 NOTE PIC X(5).
+    05 FILLER PIC X(2).
+"""
+
+
+@pytest.fixture
+def order():
+    return CobolParser().parse(DUPLICATES_SOURCE)[0]
+
+
+def test_parse_reference():
+    """OF/IN chains and dotted paths give the same names, outermost first."""
+    assert parse_reference("code of Customer IN order-rec") == ("ORDER-REC", "CUSTOMER", "CODE")
+    assert parse_reference("ORDER-REC.CUSTOMER.CODE") == ("ORDER-REC", "CUSTOMER", "CODE")
+    assert parse_reference("DATE OF ADDRESS.CUSTOMER") == ("ADDRESS", "CUSTOMER", "DATE")
+
+
+def test_qualified_lookup(order):
+    """Qualification tells reused names apart."""
+    customer_code = order.get_field("CODE OF CUSTOMER")
+    assert customer_code.byte_length == 4
+    assert order.get_field("CUSTOMER.CODE") is customer_code
+    assert order.get_field("CODE IN CUSTOMER OF ORDER-REC") is customer_code
+    assert order.get_field_by_path("ORDER-REC.PRODUCT.CODE").byte_length == 6
+
+
+def test_qualifiers_may_skip_levels(order):
+    """Qualifiers need only be ancestors, in order."""
+    assert order.get_field("DATE OF CUSTOMER").parent.name == "ADDRESS"
+    assert order.get_field("DATE OF PRODUCT OF ORDER-REC").byte_offset == 18
+
+
+def test_ambiguous_reference(order):
+    """A name matching several fields is an error, not the last one declared."""
+    with pytest.raises(AmbiguousReferenceError) as excinfo:
+        order.get_field("CODE")
+    assert [field.get_field_path() for field in excinfo.value.candidates] == [
+        "CUSTOMER.CODE",
+        "PRODUCT.CODE",
+    ]
+    with pytest.raises(AmbiguousReferenceError):
+        order.get_field("DATE OF ORDER-REC")
+    assert set(order.field_index.duplicates()) == {"CODE", "DATE"}
+
+
+def test_missing_and_filler(order):
+    """Unknown names and FILLER items are not found; FILLER is no qualifier."""
+    assert order.get_field("NOPE") is None
+    assert order.get_field("CODE OF NOPE") is None
+    assert order.get_field("FILLER") is None
+    assert order.get_field("NOTE OF ORDER-REC").byte_length == 5
+    assert order.get_field("NOTE OF FILLER") is None
+
+
+def test_unique_reference(order):
+    """The shortest consecutive qualification is suggested."""
+    index = order.field_index
+    assert index.unique_reference(order.get_field("NOTE")) == "NOTE"
+    assert index.unique_reference(order.get_field("DATE OF PRODUCT")) == "DATE OF PRODUCT"
+    assert index.unique_reference(order.fields[-1]) is None
+
+
+def test_elementary_record_is_its_own_field():
+    """The name of an elementary 01 item finds the item itself."""
+    record = CobolParser().parse("01 FLAG PIC X.")[0]
+    assert record.get_field("FLAG") is record.fields[0]
+
+
+def test_index_survives_pickling(order):
+    """A record pickled after lookups still resolves names."""
+    order.get_field("CODE OF PRODUCT")
+    copy = pickle.loads(pickle.dumps(order))
+    assert copy.get_field("CODE OF PRODUCT") is copy.fields[1].children[0]
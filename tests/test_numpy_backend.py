@@ -0,0 +1,125 @@
+"""Tests for the optional NumPy backend."""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_data_structure import CobolParser, compile_layout  # noqa: E402
+from cobol_data_structure.decoders import decode_zoned  # noqa: E402
+from cobol_data_structure.numpy_backend import (  # noqa: E402
+    decode_columns,
+    map_records,
+    packed_column,
+    record_dtype,
+    view_records,
+    zoned_column,
+)
+
+
+def test_record_dtype(last_data_record):
+    """One sub-field per leaf at its byte offset."""
+    dtype = record_dtype(last_data_record)
+    assert dtype.itemsize == 37
+    assert dtype.fields["TYPE.DESC"][1] == 13
+    assert dtype.fields["NAME"][0] == np.dtype("S10")
+    assert dtype.fields["COUNTER"][0] == np.dtype(">u2")
+
+
+def test_decode_columns_matches_plan(last_data_record, last_data_bytes):
+    """Column-wise decoding agrees with the per-record plan."""
+    data = last_data_bytes * 4
+    records = view_records(last_data_record, data)
+    assert len(records) == 4
+    columns = decode_columns(last_data_record, records)
+    expected = compile_layout(last_data_record).decode(last_data_bytes)
+    for path, value in expected.items():
+        assert columns[path].tolist() == [value] * 4
+
+
+def test_decode_columns_selected_fields(last_data_record, last_data_bytes):
+    """Only the requested columns are decoded."""
+    records = view_records(last_data_record, last_data_bytes)
+    assert list(decode_columns(last_data_record, records, fields=["COUNTER"])) == ["COUNTER"]
+
+
+def test_binary_and_float_columns():
+    """COMP and COMP-2 map straight to dtypes."""
+    record = CobolParser().parse("01 R.\n 03 N PIC S9(4)V9 COMP.\n 03 F COMP-2.")[0]
+    data = (-25).to_bytes(4, "big", signed=True) + struct.pack(">d", 0.5)
+    columns = decode_columns(record, view_records(record, data))
+    assert columns["N"].tolist() == [-2.5]
+    assert columns["F"].tolist() == [0.5]
+
+
+def test_packed_column_masks_invalid():
+    """Invalid digit and sign nibbles are masked."""
+    column = np.frombuffer(b"\x12\x34\x5c\x12\x34\x5d\x1a\x34\x5c\x12\x34\x55", np.uint8)
+    result = packed_column(column.reshape(4, 3), decimal_places=2)
+    assert result.tolist() == [123.45, -123.45, None, None]
+
+
+def test_packed_column_wide_values():
+    """More than 18 digits falls back to Python integers."""
+    column = np.frombuffer(bytes.fromhex("1234567890123456789012345c"), np.uint8)
+    assert packed_column(column.reshape(1, -1), 0).tolist() == [1234567890123456789012345]
+
+
+@pytest.mark.parametrize(
+    "raw, signed, expected",
+    [
+        (b"  42", False, 42),
+        (b"-042", True, -42),
+        (b"042-", True, -42),
+        (b"-042", False, None),
+        (b"4 2 ", True, None),
+        (b"    ", True, None),
+        (b"04A2", True, None),
+    ],
+)
+def test_zoned_column(raw, signed, expected):
+    """Vectorised DISPLAY numerics follow decode_zoned."""
+    column = np.frombuffer(raw, np.uint8).reshape(1, -1)
+    assert zoned_column(column, signed, 0).tolist() == [expected]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"42\r ", b"\t-42", b"4 + ", b"4\t- ", b"+ 42", b"4 2+", b"+42-", b"4_2 ", b"4__2", b"4\x1c+"],
+)
+def test_zoned_column_matches_decode_zoned(raw):
+    """Both backends accept the same whitespace, signs and separators."""
+    try:
+        expected = decode_zoned(raw, True, 1)
+    except ValueError:
+        expected = None
+    column = np.frombuffer(raw, np.uint8).reshape(1, -1)
+    assert zoned_column(column, True, 1).tolist() == [expected]
+
+
+def test_map_records(tmp_path, last_data_record, last_data_bytes):
+    """Data files are memory-mapped without reading them."""
+    path = tmp_path / "extract.dat"
+    path.write_bytes(last_data_bytes * 3)
+    records = map_records(last_data_record, path)
+    assert len(records) == 3
+    assert decode_columns(last_data_record, records, ["TYPE.CODE"])["TYPE.CODE"].sum() == 37035
+
+
+def test_text_column_fallback_for_unmapped_bytes():
+    """Rows with bytes the encoding cannot decode alone fall back per value."""
+    record = CobolParser(encoding="utf-8").parse("01 R.\n 03 T PIC X(4).")[0]
+    data = b"\xc3\xa9\t " + b"ab\t "  # "é\t " in UTF-8
+    columns = decode_columns(record, view_records(record, data))
+    assert columns["T"].tolist() == ["é", "ab"]
+
+
+def test_overpunch_columns_match_plan():
+    """Overpunch columns, including ASCII text fallbacks, agree with the plan."""
+    record = CobolParser().parse("01 R.\n 03 A PIC S9(3)V9.\n 03 B PIC S9(3) SIGN LEADING.")[0]
+    rows = [b"123}" + b"J23", b"-123" + b" 42", b"12 3" + b"123"]
+    columns = decode_columns(record, view_records(record, b"".join(rows)))
+    plan = compile_layout(record)
+    for path in ("A", "B"):
+        assert columns[path].tolist() == [plan.decode(row)[path] for row in rows]
@@ -0,0 +1,171 @@
+"""Tests for OCCURS DEPENDING ON layouts."""
+
+import pytest
+
+from cobol_data_structure import CobolParser, RecordView, compile_layout
+
+CUSTOMER_SOURCE = """
+       01 CUSTOMER.
+           03 ORDER-COUNT PIC 9.
+           03 LINE-COUNT PIC 9.
+           03 NOTE-COUNT PIC 9.
+           03 ORDERS OCCURS 0 TO 3 DEPENDING ON ORDER-COUNT.
+               05 ORDER-ID PIC X(2).
+               05 LINES OCCURS 1 TO 4 DEPENDING ON LINE-COUNT.
+                   07 QTY PIC 9(2).
+               05 ORDER-FLAG PIC X.
+           03 NOTES OCCURS 1 TO 5 DEPENDING ON NOTE-COUNT
+                   PIC X(3).
+           03 TRAILER PIC X(2).
+"""
+
+# 2 orders of 2 lines each, 1 note
+CUSTOMER_BYTES = b"221" + b"AA0102X" + b"BB0304Y" + b"NT1" + b"ZZ"
+
+
+@pytest.fixture
+def customer():
+    """The CUSTOMER record with nested and successive ODO tables."""
+    return CobolParser().parse(CUSTOMER_SOURCE)[0]
+
+
+def test_compiles_dependency_chain(customer):
+    """Counters, tables and the length range are compiled once."""
+    plan = compile_layout(customer)
+    assert plan.warnings == ()
+    assert [(d.table, d.counter, d.minimum, d.maximum) for d in plan.variable.dependencies] == [
+        ("ORDERS.LINES", "LINE-COUNT", 1, 4),
+        ("ORDERS", "ORDER-COUNT", 0, 3),
+        ("NOTES", "NOTE-COUNT", 1, 5),
+    ]
+    assert (plan.record_length, plan.min_length) == (53, 8)
+
+
+def test_decode_nested_and_successive(customer):
+    """Only existing occurrences are decoded, at their shifted offsets."""
+    plan = compile_layout(customer)
+    assert plan.decode(CUSTOMER_BYTES) == {
+        "ORDER-COUNT": 2,
+        "LINE-COUNT": 2,
+        "NOTE-COUNT": 1,
+        "ORDERS(1).ORDER-ID": "AA",
+        "ORDERS(1).LINES(1).QTY": 1,
+        "ORDERS(1).LINES(2).QTY": 2,
+        "ORDERS(1).ORDER-FLAG": "X",
+        "ORDERS(2).ORDER-ID": "BB",
+        "ORDERS(2).LINES(1).QTY": 3,
+        "ORDERS(2).LINES(2).QTY": 4,
+        "ORDERS(2).ORDER-FLAG": "Y",
+        "NOTES(1)": "NT1",
+        "TRAILER": "ZZ",
+    }
+    values = plan.decode_values(CUSTOMER_BYTES)
+    assert len(values) == len(plan)
+    assert values[plan.index["ORDERS(1).LINES(3).QTY"]] is None
+
+
+def test_resolve_is_memoized(customer):
+    """Records with the same counts share one resolved plan."""
+    plan = compile_layout(customer)
+    resolved = plan.resolve(CUSTOMER_BYTES)
+    assert plan.resolve(bytearray(CUSTOMER_BYTES)) is resolved
+    assert resolved.variable is None and resolved.record_length == len(CUSTOMER_BYTES)
+    assert plan.resolve_counts((2, 2, 1)) is resolved
+    qty = resolved.tables["ORDERS.LINES.QTY"]
+    assert (qty.offset, qty.strides, qty.counts) == (5, (7, 2), (2, 2))
+    assert qty.decode(CUSTOMER_BYTES) == [1, 2, 3, 4]
+
+
+def test_empty_table(customer):
+    """A count of zero removes the table and shifts what follows."""
+    data = b"011" + b"NT1" + b"ZZ"
+    assert compile_layout(customer).decode(data) == {
+        "ORDER-COUNT": 0,
+        "LINE-COUNT": 1,
+        "NOTE-COUNT": 1,
+        "NOTES(1)": "NT1",
+        "TRAILER": "ZZ",
+    }
+
+
+def test_invalid_counts(customer):
+    """Counters out of range or needing more bytes than given are errors."""
+    plan = compile_layout(customer)
+    with pytest.raises(ValueError, match="ORDER-COUNT is 4"):
+        plan.decode(b"421" + bytes(50))
+    with pytest.raises(ValueError, match="less than expected 22"):
+        plan.decode(CUSTOMER_BYTES[:-1])
+    with pytest.raises(ValueError, match="less than expected 8"):
+        plan.resolve(b"22")
+
+
+def test_select_keeps_counters(customer):
+    """Selected variable plans keep the counters that place their leaves."""
+    plan = compile_layout(customer).select(["TRAILER", "ORDERS.LINES"])
+    assert plan.paths[:3] == ("ORDER-COUNT", "LINE-COUNT", "NOTE-COUNT")
+    assert plan.decode(CUSTOMER_BYTES) == {
+        "ORDER-COUNT": 2,
+        "LINE-COUNT": 2,
+        "NOTE-COUNT": 1,
+        "ORDERS(1).LINES(1).QTY": 1,
+        "ORDERS(1).LINES(2).QTY": 2,
+        "ORDERS(2).LINES(1).QTY": 3,
+        "ORDERS(2).LINES(2).QTY": 4,
+        "TRAILER": "ZZ",
+    }
+    qty = plan.resolve(CUSTOMER_BYTES).tables["ORDERS.LINES.QTY"]
+    assert qty.decode(CUSTOMER_BYTES) == [1, 2, 3, 4]
+
+
+def test_accessors_and_views(customer):
+    """Accessors and views follow the record's counts."""
+    assert customer.accessor("TRAILER")(CUSTOMER_BYTES) == "ZZ"
+    assert customer.accessor("ORDERS(2).LINES(2).QTY")(CUSTOMER_BYTES) == 4
+    qty = customer.accessor("QTY")
+    assert [qty(CUSTOMER_BYTES, 2, i) for i in (1, 2)] == [3, 4]
+    with pytest.raises(IndexError):
+        qty(CUSTOMER_BYTES, 3, 1)
+    assert customer.accessor("ORDER-COUNT")._plan is None
+    with pytest.raises(ValueError, match="holds OCCURS DEPENDING ON"):
+        customer.accessor("ORDERS")
+
+    view = RecordView(compile_layout(customer), CUSTOMER_BYTES)
+    assert [order.ORDER_FLAG for order in view.ORDERS] == ["X", "Y"]
+    assert view.TRAILER == "ZZ"
+
+
+def test_fixed_table_around_odo_and_redefines():
+    """Fixed tables holding ODO tables resize; REDEFINES are not shifted."""
+    record = CobolParser().parse("""
+       01 R.
+           03 N PIC 9.
+           03 AREA-A.
+               05 PAIR OCCURS 2 TIMES.
+                   07 ITEM OCCURS 1 TO 3 DEPENDING ON N PIC X.
+                   07 SEP PIC X.
+           03 AREA-B REDEFINES AREA-A PIC X(8).
+           03 LAST-BYTE PIC X.
+    """)[0]
+    plan = compile_layout(record)
+    assert plan.decode(b"2ab;cd;!") == {
+        "N": 2,
+        "AREA-A.PAIR(1).ITEM(1)": "a",
+        "AREA-A.PAIR(1).ITEM(2)": "b",
+        "AREA-A.PAIR(1).SEP": ";",
+        "AREA-A.PAIR(2).ITEM(1)": "c",
+        "AREA-A.PAIR(2).ITEM(2)": "d",
+        "AREA-A.PAIR(2).SEP": ";",
+        "AREA-B": "ab;cd;!",
+        "LAST-BYTE": "!",
+    }
+
+
+def test_unusable_counter_keeps_maximum():
+    """Tables whose counter cannot be read compile at their maximum, with a warning."""
+    record = CobolParser().parse(
+        "01 R.\n 03 T OCCURS 1 TO 2 TIMES DEPENDING ON NOPE PIC X.\n 03 Z PIC X."
+    )[0]
+    plan = compile_layout(record)
+    assert plan.variable is None
+    assert "NOPE of T is not defined" in plan.warnings[0].message
+    assert plan.decode(b"abc") == {"T(1)": "a", "T(2)": "b", "Z": "c"}
@@ -0,0 +1,92 @@
+"""Tests for byte length and offset calculation."""
+
+import pytest
+
+from cobol_data_structure import (
+    CobolField,
+    OffsetCalculator,
+    PictureCategory,
+    PictureInfo,
+    UsageType,
+)
+
+
+def test_offset_simple_fields():
+    """Simple sequential fields."""
+    fields = [
+        CobolField(level=3, name="A", byte_length=10),
+        CobolField(level=3, name="B", byte_length=5),
+    ]
+    OffsetCalculator().calculate_offsets(fields, base_offset=0)
+    assert fields[0].byte_offset == 0
+    assert fields[1].byte_offset == 10
+
+
+def test_offset_redefines():
+    """REDEFINES should use same offset."""
+    fields = [
+        CobolField(level=3, name="FIELD-A", byte_length=10),
+        CobolField(level=3, name="FIELD-B", byte_length=10, redefines="FIELD-A"),
+        CobolField(level=3, name="FIELD-C", byte_length=5),
+    ]
+    OffsetCalculator().calculate_offsets(fields, base_offset=0)
+    assert fields[1].byte_offset == 0
+    assert fields[2].byte_offset == 10
+
+
+def test_offset_group_occurs():
+    """A group's OCCURS multiplies the length derived from its children."""
+    group = CobolField(
+        level=3,
+        name="MONTH",
+        occurs=12,
+        children=[
+            CobolField(level=5, name="SALES", byte_length=5),
+            CobolField(level=5, name="RETURNS", byte_length=5),
+        ],
+    )
+    OffsetCalculator().calculate_offsets([group])
+    assert group.byte_length == 120
+    assert group.children[1].byte_offset == 5
+
+
+def test_offset_sync_alignment():
+    """SYNC aligns a binary item to its natural boundary."""
+    fields = [
+        CobolField(level=5, name="A", byte_length=3),
+        CobolField(level=5, name="B", usage=UsageType.COMP, byte_length=4, synchronized=True),
+    ]
+    OffsetCalculator().calculate_offsets(fields)
+    assert fields[1].byte_offset == 4
+
+
+@pytest.mark.parametrize(
+    "usage, digits, signed, separate, expected",
+    [
+        (UsageType.COMP3, 5, False, False, 3),
+        (UsageType.COMP3, 4, True, False, 3),
+        (UsageType.COMP, 4, False, False, 2),
+        (UsageType.COMP, 9, False, False, 4),
+        (UsageType.BINARY, 10, False, False, 8),
+        (UsageType.DISPLAY, 5, True, True, 6),
+        (UsageType.DISPLAY, 5, True, False, 5),
+    ],
+)
+def test_byte_length(usage, digits, signed, separate, expected):
+    """Storage size per usage."""
+    info = PictureInfo(PictureCategory.NUMERIC, display_length=digits, is_signed=signed)
+    field = CobolField(level=5, name="X", usage=usage, sign_separate=separate)
+    assert OffsetCalculator().calculate_byte_length(field, info) == expected
+
+
+def test_offset_for_nested_occurrence():
+    """Offsets of elements inside nested tables."""
+    sales = CobolField(level=7, name="SALES", byte_offset=0, byte_length=5)
+    month = CobolField(level=5, name="MONTH", occurs=3, children=[sales])
+    quarter = CobolField(level=3, name="QUARTER", occurs=4, children=[month])
+    sales.parent, month.parent = month, quarter
+    calc = OffsetCalculator()
+    calc.calculate_offsets([quarter])
+    assert calc.get_offset_for_occurrence(sales, [2, 3]) == 15 + 10
+    with pytest.raises(IndexError):
+        calc.get_offset_for_occurrence(sales, [5, 1])
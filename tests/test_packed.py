@@ -0,0 +1,99 @@
+"""Tests for the packed-decimal codec."""
+
+from decimal import Decimal
+
+import pytest
+
+from cobol_data_structure.packed import (
+    PACKED_SIGN,
+    decode_packed_column,
+    encode_packed,
+    encode_packed_column,
+    packed_length,
+    unpack,
+)
+
+COLUMN = [
+    bytes.fromhex("12345c"),
+    bytes.fromhex("12345d"),
+    bytes.fromhex("1a345c"),  # digit nibble above 9
+    bytes.fromhex("123455"),  # invalid sign nibble
+    bytes.fromhex("00001f"),
+    bytes.fromhex("00001b"),
+]
+
+
+def test_sign_table():
+    """The last-byte table only looks at the low nibble."""
+    assert PACKED_SIGN[0x5C] == PACKED_SIGN[0x0F] == PACKED_SIGN[0xFA] == 1
+    assert PACKED_SIGN[0x1D] == PACKED_SIGN[0x9B] == -1
+    assert PACKED_SIGN[0x55] == 0
+    assert sum(1 for sign in PACKED_SIGN if sign) == 6 * 16
+
+
+def test_unpack():
+    """Unscaled integers, with invalid nibbles rejected."""
+    assert unpack(bytes.fromhex("12345d")) == -12345
+    assert unpack(memoryview(bytes.fromhex("0f"))) == 0
+    with pytest.raises(ValueError, match="sign"):
+        unpack(bytes.fromhex("123455"))
+    with pytest.raises(ValueError, match="digit"):
+        unpack(bytes.fromhex("1a345c"))
+
+
+def test_decode_packed_column():
+    """Invalid entries become None instead of raising."""
+    assert decode_packed_column(COLUMN, 2) == [123.45, -123.45, None, None, 0.01, -0.01]
+    assert decode_packed_column(COLUMN[:2]) == [12345, -12345]
+
+
+@pytest.mark.parametrize(
+    "value, length, decimal_places, signed, expected",
+    [
+        (12345, 3, 0, True, "12345c"),
+        (-123.45, 3, 2, True, "12345d"),
+        (Decimal("1.005"), 2, 2, True, "100c"),
+        (7, 1, 0, False, "7f"),
+        (0, 2, 0, True, "000c"),
+    ],
+)
+def test_encode_packed(value, length, decimal_places, signed, expected):
+    """Values are scaled, padded and given a sign nibble."""
+    assert encode_packed(value, length, decimal_places, signed).hex() == expected
+
+
+def test_encode_packed_rejects():
+    """Overflow and negative unsigned values are errors."""
+    with pytest.raises(ValueError, match="does not fit"):
+        encode_packed(1000, 2)
+    with pytest.raises(ValueError, match="unsigned"):
+        encode_packed(-1, 2, signed=False)
+
+
+def test_column_round_trip():
+    """Encoding a column then decoding it returns the values."""
+    values = [0, 1, -1, 99999, -99999, 42]
+    data = encode_packed_column(values, packed_length(5))
+    assert len(data) == 18
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert decode_packed_column(chunks) == values
+
+
+def test_array_paths_match_python():
+    """The NumPy decoder and encoder agree with the pure-Python path."""
+    np = pytest.importorskip("numpy")
+    from cobol_data_structure.packed import decode_packed_array, encode_packed_array
+
+    matrix = np.frombuffer(b"".join(COLUMN), np.uint8).reshape(len(COLUMN), 3)
+    assert decode_packed_array(matrix, 2).tolist() == decode_packed_column(COLUMN, 2)
+
+    values = [0, 1, -1, 99999, -99999, 42]
+    encoded = encode_packed_array(values, 3)
+    assert encoded.tobytes() == encode_packed_column(values, 3)
+    assert encode_packed_array(np.array([1.25, -0.5]), 2, 1).tobytes() == encode_packed_column(
+        [1.25, -0.5], 2, 1
+    )
+    with pytest.raises(ValueError, match="does not fit"):
+        encode_packed_array([100000], 3)
+    with pytest.raises(ValueError, match="unsigned"):
+        encode_packed_array([-1], 3, signed=False)
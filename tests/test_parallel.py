@@ -0,0 +1,101 @@
+"""Tests for multiprocess file decoding."""
+
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout, parallel
+from cobol_data_structure.parallel import decode_file_parallel
+
+
+def numbered(last_data_bytes, count):
+    """LAST-DATA records whose NAME holds their number."""
+    return [f"REC{i}".ljust(10).encode() + last_data_bytes[10:] for i in range(count)]
+
+
+@pytest.fixture
+def plan(last_data_record):
+    """Compiled LAST-DATA plan."""
+    return compile_layout(last_data_record)
+
+
+def test_plan_is_picklable(plan, last_data_bytes):
+    """Plans travel to workers by pickle."""
+    clone = pickle.loads(pickle.dumps(plan))
+    assert clone == plan and clone.decode(last_data_bytes) == plan.decode(last_data_bytes)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_fixed_file(tmp_path, plan, last_data_bytes, ordered):
+    """All records come back, in order or tagged with their position."""
+    path = tmp_path / "data.dat"
+    path.write_bytes(b"".join(numbered(last_data_bytes, 25)) + b"\x00")
+    chunks = list(decode_file_parallel(plan, path, workers=2, chunk_records=4, ordered=ordered))
+    assert len(chunks) == 7
+    if ordered:
+        assert [c.index for c in chunks] == list(range(7))
+    names = {}
+    for chunk in chunks:
+        for i, record in enumerate(chunk.records):
+            names[chunk.first_record + i] = record["NAME"]
+    assert names == {i: f"REC{i}" for i in range(25)}
+
+
+def test_unordered_keeps_no_finished_chunks(tmp_path, plan, last_data_bytes, monkeypatch):
+    """Unordered runs do not hold on to the results they have yielded."""
+    monkeypatch.setattr(parallel, "ProcessPoolExecutor", ThreadPoolExecutor)
+    collect = parallel._collect
+    sizes = []
+
+    def tracking_collect(pending, running, ordered):
+        sizes.append(len(pending))
+        return collect(pending, running, ordered)
+
+    monkeypatch.setattr(parallel, "_collect", tracking_collect)
+    path = tmp_path / "data.dat"
+    path.write_bytes(b"".join(numbered(last_data_bytes, 40)))
+    chunks = list(decode_file_parallel(plan, path, workers=2, chunk_records=2, ordered=False))
+    assert len(chunks) == 20
+    assert sizes and max(sizes) <= 2 * 2
+
+
+def test_invalid_counter_decodes_to_none(tmp_path):
+    """A fixed-length record with an out-of-range ODO counter is None, not an error."""
+    record = CobolParser().parse("01 R.\n 03 N PIC 9.\n 03 T OCCURS 1 TO 3 DEPENDING ON N PIC X.")
+    path = tmp_path / "odo.dat"
+    path.write_bytes(b"2ABC9ABC1ABC")
+    chunks = list(decode_file_parallel(record[0], path, workers=1, chunk_records=2))
+    decoded = [record for chunk in chunks for record in chunk.records]
+    assert decoded == [{"N": 2, "T(1)": "A", "T(2)": "B"}, None, {"N": 1, "T(1)": "A"}]
+
+
+def test_variable_file(tmp_path, plan, last_data_bytes):
+    """Indexed RDW files are split on record boundaries; short records are None."""
+    records = numbered(last_data_bytes, 9) + [b"SHORT"]
+    path = tmp_path / "data.vb"
+    path.write_bytes(b"".join((len(r) + 4).to_bytes(2, "big") + b"\0\0" + r for r in records))
+    chunks = list(decode_file_parallel(plan, path, workers=2, chunk_records=3, blocked=False))
+    decoded = [record for chunk in chunks for record in chunk.records]
+    assert [r["NAME"] for r in decoded[:9]] == [f"REC{i}" for i in range(9)]
+    assert decoded[9] is None
+
+
+def test_per_chunk_outputs(tmp_path, plan, last_data_bytes):
+    """Chunks can be written to JSON Lines files instead of returned."""
+    path = tmp_path / "data.dat"
+    path.write_bytes(b"".join(numbered(last_data_bytes, 5)))
+    results = decode_file_parallel(plan, path, 2, chunk_records=2, output_dir=tmp_path / "out")
+    chunks = list(results)
+    assert [c.output.name for c in chunks] == [f"chunk-00000{i}.jsonl" for i in range(3)]
+    assert all(c.records is None for c in chunks)
+    lines = chunks[2].output.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == plan.decode(numbered(last_data_bytes, 5)[4])
+
+
+def test_empty_file(tmp_path, plan):
+    """An empty file yields no chunks."""
+    path = tmp_path / "empty.dat"
+    path.write_bytes(b"")
+    assert list(decode_file_parallel(plan, path, workers=1)) == []
@@ -0,0 +1,185 @@
+"""Integration tests for the COBOL source parser."""
+
+import time
+
+import pytest
+
+from cobol_data_structure import CobolParser, UsageType
+
+
+def test_simple_flat_structure():
+    """Simple flat structure."""
+    records = CobolParser().parse("""
+    01 CUSTOMER.
+        03 CUST-ID PIC 9(5).
+        03 CUST-NAME PIC X(30).
+    """)
+    assert len(records) == 1
+    assert records[0].name == "CUSTOMER"
+    assert [f.byte_offset for f in records[0].fields] == [0, 5]
+    assert records[0].total_length == 35
+
+
+def test_nested_structure(last_data_record):
+    """Nested structure with proper hierarchy."""
+    type_field = last_data_record.get_field("TYPE")
+    assert [c.name for c in type_field.children] == ["CODE", "DESC"]
+    assert type_field.children[0].usage == UsageType.COMP3
+    assert type_field.children[0].byte_length == 3
+    assert last_data_record.get_field_by_path("TYPE.DESC").byte_offset == 13
+    assert last_data_record.get_field("DESC").get_field_path() == "TYPE.DESC"
+
+
+def test_occurs(last_data_record):
+    """OCCURS clause multiplies the group length."""
+    month = last_data_record.get_field("MONTH-DATA")
+    assert month.occurs == 3
+    assert month.byte_length == 12
+    assert last_data_record.total_length == 37
+
+
+def test_redefines_offset():
+    """REDEFINES uses same offset as original field."""
+    records = CobolParser().parse("""
+    01 DATA-RECORD.
+        03 FIELD-A PIC X(10).
+        03 FIELD-B REDEFINES FIELD-A PIC 9(10).
+        03 FIELD-C PIC X(5).
+    """)
+    fields = records[0].fields
+    assert [f.byte_offset for f in fields] == [0, 0, 10]
+    assert fields[1].redefines_field is fields[0]
+
+
+def test_redefines_unknown_target_warns():
+    """A REDEFINES of no preceding sibling warns at its line and is laid out next."""
+    records = CobolParser().parse("""
+    01 DATA-RECORD.
+        03 GROUP-A OCCURS 2.
+            05 FIELD-A PIC X(3).
+        03 FIELD-B REDEFINES FIELD-A PIC X(2).
+    """)
+    group, field_b = records[0].fields
+    assert group.byte_length == 6
+    assert field_b.byte_offset == 6
+    assert field_b.redefines_field is None
+    assert records[0].warnings[0].line_number == 5
+    assert "FIELD-A not found" in records[0].warnings[0].message
+
+
+def test_deep_nesting():
+    """Deep nesting (5 levels)."""
+    records = CobolParser().parse("""
+    01 ROOT.
+        03 LEVEL-3.
+            05 LEVEL-5.
+                07 LEVEL-7.
+                    09 LEVEL-9 PIC X(10).
+    """)
+    assert records[0].fields[0].children[0].children[0].level == 7
+    assert records[0].total_length == 10
+
+
+def test_nesting_limit():
+    """Nesting beyond max_depth raises ValueError."""
+    lines = ["01 ROOT."] + [f"{level:02d} L{level}." for level in range(2, 12)]
+    lines[-1] = lines[-1][:-1] + " PIC X."
+    with pytest.raises(ValueError, match="Nesting too deep"):
+        CobolParser(max_depth=5).parse("\n".join(lines))
+
+
+def test_nesting_has_no_default_limit():
+    """Every level from 01 to 49 may nest under the previous one."""
+    lines = [f"{level:02d} L{level}." for level in range(1, 50)]
+    lines[-1] = lines[-1][:-1] + " PIC X(2)."
+    record = CobolParser().parse("\n".join(lines))[0]
+    field = record.fields[0]
+    while field.children:
+        field = field.children[0]
+    assert field.name == "L49"
+    assert record.total_length == 2
+
+
+def test_large_file_parsing():
+    """A copybook with 10,000 fields parses in well under the design's 5 seconds."""
+    lines = ["01 LARGE-RECORD."]
+    for i in range(10000):
+        lines.append(f"    03 FIELD-{i:05d} PIC X(10).")
+
+    start = time.perf_counter()
+    records = CobolParser().parse("\n".join(lines))
+    elapsed = time.perf_counter() - start
+
+    assert len(records[0].fields) == 10000
+    assert records[0].total_length == 100000
+    assert elapsed < 5.0
+
+
+def test_level_77_and_88():
+    """Level 77 items are records; level 88 items have no storage."""
+    records = CobolParser().parse("""
+    77  WS-COUNTER PIC 9(5) COMP.
+    01  WS-FLAGS.
+        05 CUSTOMER-TYPE PIC X.
+           88 VIP-CUSTOMER VALUE 'V'.
+        05 OTHER PIC X.
+    """)
+    assert [r.name for r in records] == ["WS-COUNTER", "WS-FLAGS"]
+    assert records[0].total_length == 4
+    assert records[1].total_length == 2
+
+
+def test_program_with_fixed_format_and_multiline_entries():
+    """Only the DATA DIVISION of a program is read; entries may span lines."""
+    source = "\n".join(
+        [
+            "000100 IDENTIFICATION DIVISION.",
+            "000200 PROGRAM-ID. SAMPLE.",
+            "000300 DATA DIVISION.",
+            "000400 WORKING-STORAGE SECTION.",
+            "000500*A COMMENT",
+            "000600 01  ORDER-REC.",
+            "000700     05  ITEM-COUNT PIC 9(3).",
+            "000800     05  ITEMS OCCURS 1 TO 10 TIMES",
+            "000900             DEPENDING ON ITEM-COUNT",
+            "001000             PIC X(4).",
+            "001100 PROCEDURE DIVISION.",
+            "001200     MOVE 1 TO ITEM-COUNT.",
+        ]
+    )
+    records = CobolParser().parse(source)
+    items = records[0].get_field("ITEMS")
+    assert items.occurs_depending_on == "ITEM-COUNT"
+    assert items.byte_length == 40
+    assert records[0].total_length == 43
+
+
+def test_unsupported_picture_warns():
+    """Unsupported pictures are reported, not fatal."""
+    parser = CobolParser()
+    records = parser.parse("01 R.\n    05 A PIC Q(3).\n    05 B PIC X.")
+    assert records[0].get_field("A").picture_category is None
+    assert any("Unsupported PICTURE" in w.message for w in records[0].warnings)
+
+
+def test_parse_file(tmp_path):
+    """Parse a copybook from disk."""
+    path = tmp_path / "cust.cpy"
+    path.write_text("01 CUST.\n    05 ID PIC 9(4).\n", encoding="utf-8")
+    records = CobolParser().parse_file(path)
+    assert records[0].total_length == 4
+
+
+def test_sync_aligns_elementary_items_only():
+    """SYNC aligns binary elementary items; a group is never aligned, even with a PICTURE."""
+    source = """
+       01 R.
+           03 A PIC X.
+           03 G PIC S9(4) COMP SYNC.
+               05 B PIC X(2).
+           03 C PIC S9(4) COMP SYNC.
+    """
+    record = CobolParser().parse(source)[0]
+    group, binary = record.fields[1], record.fields[2]
+    assert (group.byte_offset, group.children[0].byte_offset) == (1, 1)
+    assert binary.byte_offset == 4 and record.total_length == 6
@@ -0,0 +1,66 @@
+"""Tests for the PICTURE clause parser."""
+
+import pytest
+
+from cobol_data_structure import PictureCategory, PictureClauseParser
+
+
+@pytest.fixture
+def parser():
+    """Picture clause parser."""
+    return PictureClauseParser()
+
+
+def test_picture_simple_alphanumeric(parser):
+    """PIC X(10)."""
+    info = parser.parse("X(10)")
+    assert info.category == PictureCategory.ALPHANUMERIC
+    assert info.display_length == 10
+    assert not info.is_signed
+
+
+def test_picture_numeric_with_decimal(parser):
+    """PIC 9(5)V99."""
+    info = parser.parse("9(5)V99")
+    assert info.category == PictureCategory.NUMERIC
+    assert info.display_length == 7
+    assert info.decimal_places == 2
+
+
+def test_picture_signed_numeric(parser):
+    """PIC S9(7)V99."""
+    info = parser.parse("S9(7)V99")
+    assert info.is_signed
+    assert info.display_length == 9
+    assert info.decimal_places == 2
+
+
+@pytest.mark.parametrize(
+    "picture, category, length",
+    [
+        ("999V99", PictureCategory.NUMERIC, 5),
+        ("A(4)", PictureCategory.ALPHABETIC, 4),
+        ("X(5)9(3)", PictureCategory.ALPHANUMERIC, 8),
+        ("N(3)", PictureCategory.NATIONAL, 3),
+        ("ZZ,ZZ9.99", PictureCategory.NUMERIC_EDITED, 9),
+        ("9(5)CR", PictureCategory.NUMERIC_EDITED, 7),
+    ],
+)
+def test_picture_categories(parser, picture, category, length):
+    """Category and display length of assorted pictures."""
+    info = parser.parse(picture)
+    assert info.category == category
+    assert info.display_length == length
+
+
+def test_picture_scaling(parser):
+    """P positions are counted but take no storage."""
+    info = parser.parse("9(3)PP")
+    assert info.display_length == 3
+    assert info.scaling_positions == 2
+
+
+@pytest.mark.parametrize("picture", ["", "Q(3)", "X(5"])
+def test_picture_invalid(parser, picture):
+    """Unknown symbols yield None."""
+    assert parser.parse(picture) is None
@@ -0,0 +1,133 @@
+"""Tests for record file readers."""
+
+import pytest
+
+from cobol_data_structure import RecordView, compile_layout
+from cobol_data_structure.readers import FixedRecordReader, RecordSequence, VariableRecordReader
+
+
+@pytest.fixture
+def data_file(tmp_path, last_data_bytes):
+    """File with five LAST-DATA records whose names are numbered."""
+    records = [f"REC{i}".ljust(10).encode() + last_data_bytes[10:] for i in range(5)]
+    path = tmp_path / "last_data.dat"
+    path.write_bytes(b"".join(records) + b"\x00\x00")
+    return path
+
+
+def test_fixed_reader_indexing(data_file, last_data_record):
+    """len, indexing and negative indexes work on the mapping."""
+    with FixedRecordReader(data_file, last_data_record) as reader:
+        assert len(reader) == 5
+        assert reader.trailing_bytes == 2
+        assert isinstance(reader[0], memoryview)
+        assert bytes(reader[1][:4]) == b"REC1"
+        assert bytes(reader[-1][:4]) == b"REC4"
+        with pytest.raises(IndexError):
+            reader[5]
+
+
+def test_fixed_reader_slicing(data_file, last_data_record):
+    """Slices are record sequences over the same mapping."""
+    with FixedRecordReader(data_file, last_data_record.total_length) as reader:
+        part = reader[1:5:2]
+        assert isinstance(part, RecordSequence)
+        assert [bytes(r[:4]) for r in part] == [b"REC1", b"REC3"]
+        assert [bytes(r[:4]) for r in reader[::-2]] == [b"REC4", b"REC2", b"REC0"]
+        assert bytes(part[-1][:4]) == b"REC3"
+        del part
+
+
+def test_fixed_reader_decodes(data_file, last_data_record, last_data_bytes):
+    """Records feed straight into plans and views."""
+    plan = compile_layout(last_data_record)
+    with FixedRecordReader(data_file, plan) as reader:
+        names = [values["NAME"] for values in reader.decode(plan.decode)]
+        assert names == [f"REC{i}" for i in range(5)]
+        assert RecordView(plan, reader[2]).TYPE.CODE == plan.decode(last_data_bytes)["TYPE.CODE"]
+
+
+def test_fixed_reader_empty_file(tmp_path):
+    """An empty file has no records."""
+    path = tmp_path / "empty.dat"
+    path.write_bytes(b"")
+    with FixedRecordReader(path, 10) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+
+
+def test_record_sequence_over_bytes():
+    """Any buffer can be split into records."""
+    records = RecordSequence(b"aabbccd", 2)
+    assert [bytes(r) for r in records] == [b"aa", b"bb", b"cc"]
+    with pytest.raises(ValueError, match="record length"):
+        RecordSequence(b"", 0)
+
+
+def rdw(data):
+    """Prefix record data with its record descriptor word."""
+    return (len(data) + 4).to_bytes(2, "big") + b"\x00\x00" + data
+
+
+def block(*records, extended=False):
+    """Build a block of RDW records with its block descriptor word."""
+    body = b"".join(rdw(r) for r in records)
+    if extended:
+        return (0x80000000 | (len(body) + 4)).to_bytes(4, "big") + body
+    return (len(body) + 4).to_bytes(2, "big") + b"\x00\x00" + body
+
+
+RECORDS = [b"ONE", b"TWO-2", b"", b"FOUR"]
+
+
+def write(tmp_path, data):
+    """Write a data file and return its path."""
+    path = tmp_path / "vb.dat"
+    path.write_bytes(data)
+    return path
+
+
+def test_variable_reader_blocked(tmp_path):
+    """BDWs (plain and extended) and RDWs are stripped from the records."""
+    path = write(tmp_path, block(*RECORDS[:2]) + block(*RECORDS[2:], extended=True))
+    with VariableRecordReader(path) as reader:
+        kinds = {type(r) for r in reader}
+        assert kinds == {memoryview}
+        assert [bytes(r) for r in reader] == RECORDS
+        assert not reader.indexed
+
+
+def test_variable_reader_index(tmp_path):
+    """The first full pass builds an index for len() and random access."""
+    path = write(tmp_path, b"".join(rdw(r) for r in RECORDS))
+    with VariableRecordReader(path, blocked=False, build_index=True) as reader:
+        assert [bytes(r) for r in reader] == RECORDS
+        assert reader.indexed
+        assert len(reader) == 4
+        assert bytes(reader[1]) == b"TWO-2" and bytes(reader[-1]) == b"FOUR"
+        assert [bytes(r) for r in reader] == RECORDS
+
+
+def test_variable_reader_lazy_index(tmp_path):
+    """Random access on an unindexed reader scans the file once."""
+    path = write(tmp_path, block(*RECORDS))
+    with VariableRecordReader(path) as reader:
+        assert bytes(reader[0]) == b"ONE"
+        assert reader.indexed and len(reader) == 4
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (b"\x00\x09\x00\x00" + rdw(b"AB"), "Invalid record length"),
+        (b"\x00\x0a\x00\x00" + rdw(b"AB")[:2] + b"\x80\x00AB", "Spanned"),
+        (b"\x00\x02\x00\x00", "Invalid block length"),
+        (b"\x00\x0a\x01\x00" + rdw(b"AB"), "Invalid block descriptor"),
+        (block(b"A") + b"\x00", "Truncated block"),
+    ],
+)
+def test_variable_reader_errors(tmp_path, data, message):
+    """Corrupt descriptors are reported with their offset."""
+    with VariableRecordReader(write(tmp_path, data)) as reader:
+        with pytest.raises(ValueError, match=message):
+            list(reader)
@@ -0,0 +1,148 @@
+"""Tests for the thread-safe layout registry."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout
+from cobol_data_structure.cache import ParseCache
+from cobol_data_structure.copybooks import CopybookResolver
+from cobol_data_structure.registry import LayoutRegistry
+
+SOURCE = """
+       01 REC-A.
+           05 A-NAME PIC X(10).
+           05 A-AMOUNT PIC S9(5)V99 COMP-3.
+       01 REC-B.
+           05 B-ITEM PIC 9(3) OCCURS 10 TIMES.
+"""
+
+
+@pytest.fixture
+def copybook(tmp_path):
+    """Copybook file holding two records."""
+    path = tmp_path / "RECS.cpy"
+    path.write_text(SOURCE)
+    return path
+
+
+def test_get_parses_once(copybook):
+    """Repeated lookups hit; keys include record name and encoding."""
+    registry = LayoutRegistry()
+    plan = registry.get(copybook)
+    assert plan.record_name == "REC-A"
+    assert registry.get(str(copybook), "rec-a") is not plan  # Separate key
+    assert registry.get(copybook) is plan
+    assert registry.get(copybook, "REC-B").paths[0] == "B-ITEM(1)"
+    ebcdic = registry.get(copybook, encoding="cp037")
+    assert ebcdic.params[0] == ("cp037",)
+    assert registry.record(copybook).name == "REC-A"
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 4, 4)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+    counters = {entry.key[1:]: entry.hits for entry in registry.entry_stats()}
+    assert counters[("", "cp1252")] == 2
+    assert counters[("", "cp037")] == 0
+
+
+def test_missing_record_and_file(copybook):
+    """Unknown records and files raise."""
+    registry = LayoutRegistry()
+    with pytest.raises(KeyError):
+        registry.get(copybook, "REC-C")
+    with pytest.raises(FileNotFoundError):
+        registry.get(copybook.with_name("NONE.cpy"))
+    assert len(registry) == 0
+
+
+def test_registered_sources():
+    """In-memory sources are looked up by name; re-adding replaces them."""
+    registry = LayoutRegistry()
+    registry.add_source("lastdata", "01 LAST-DATA.\n 03 NAME PIC X(10).")
+    assert registry.get("LASTDATA").record_length == 10
+    registry.add_source("LASTDATA", SOURCE)
+    assert registry.get("lastdata").record_name == "REC-A"
+
+
+def test_changed_file_is_reloaded(copybook):
+    """A modified file is parsed again, unless file checks are disabled."""
+    registry = LayoutRegistry()
+    unchecked = LayoutRegistry(check_files=False)
+    first, stale = registry.get(copybook), unchecked.get(copybook)
+    copybook.write_text(SOURCE.replace("X(10)", "X(12)"))
+    os.utime(copybook, ns=(0, 1))
+    assert registry.get(copybook).record_length == first.record_length + 2
+    assert unchecked.get(copybook) is stale
+    assert registry.entry_stats()[0].loads == 2
+
+
+def test_lru_eviction_by_count_and_size(copybook):
+    """Least recently used layouts are evicted first."""
+    registry = LayoutRegistry(max_entries=2)
+    registry.get(copybook, "REC-A")
+    registry.get(copybook, "REC-B")
+    registry.get(copybook, "REC-A")
+    registry.get(copybook)
+    assert [entry.key[1] for entry in registry.entry_stats()] == ["REC-A", ""]
+    assert registry.stats().evictions == 1
+
+    sized = LayoutRegistry(max_size=11)
+    sized.get(copybook, "REC-A")
+    sized.get(copybook, "REC-B")
+    assert [entry.key[1] for entry in sized.entry_stats()] == ["REC-B"]
+    assert sized.stats().size == 10
+    sized.clear()
+    assert len(sized) == 0 and sized.stats().size == 0
+
+
+def test_concurrent_misses_parse_once(copybook, monkeypatch):
+    """Threads asking for the same new layout share one parse."""
+    calls = []
+    parse = CobolParser.parse
+    barrier = threading.Barrier(8)
+
+    def counting_parse(self, source):
+        calls.append(source)
+        return parse(self, source)
+
+    def lookup(_):
+        barrier.wait()
+        return registry.get(copybook)
+
+    monkeypatch.setattr(CobolParser, "parse", counting_parse)
+    registry = LayoutRegistry()
+    with ThreadPoolExecutor(8) as executor:
+        plans = list(executor.map(lookup, range(8)))
+    assert len(calls) == 1
+    assert all(plan is plans[0] for plan in plans)
+    assert registry.stats().hits + registry.stats().misses == 8
+
+
+def test_disk_cache(copybook, tmp_path):
+    """A ParseCache supplies plans to a new registry."""
+    cache = ParseCache(tmp_path / "cache")
+    LayoutRegistry(cache=cache).get(copybook, "REC-B")
+    plan = LayoutRegistry(cache=cache).get(copybook, "REC-B")
+    assert cache.hits == 1
+    assert plan == compile_layout(CobolParser().parse(SOURCE)[1])
+
+
+def test_resolver_expands_and_invalidates(tmp_path):
+    """COPY statements are expanded; copybook changes reach their users."""
+    (tmp_path / "FIELDS.cpy").write_text("           05 :P:-ID PIC 9(4).\n")
+    program = tmp_path / "PROG.cbl"
+    program.write_text("       01 REC.\n           COPY FIELDS REPLACING ==:P:== BY ==WS==.\n")
+    resolver = CopybookResolver([tmp_path])
+    registry = LayoutRegistry(resolver=resolver)
+    assert registry.get(program).paths == ("WS-ID",)
+
+    (tmp_path / "FIELDS.cpy").write_text("           05 :P:-ID PIC 9(6).\n")
+    os.utime(tmp_path / "FIELDS.cpy", ns=(0, 1))
+    assert registry.invalidate(tmp_path / "FIELDS.cpy") == 1
+    assert registry.get(program).record_length == 6
+
+    (tmp_path / "FIELDS.cpy").write_text("           05 :P:-ID PIC 9(8).\n")
+    os.utime(tmp_path / "FIELDS.cpy", ns=(0, 2))
+    assert registry.get(program).record_length == 8  # Detected from the copybook's stamp
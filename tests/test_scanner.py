@@ -0,0 +1,114 @@
+"""Tests for the repository scanner and catalog."""
+
+import os
+
+import pytest
+
+from cobol_data_structure import CobolParser, compile_layout
+from cobol_data_structure.scanner import Catalog, scan_repository
+
+COPYBOOK = """
+       01 CUSTOMER-REC.
+           05 CUST-ID PIC 9(8) COMP-3.
+           05 CUST-NAME PIC X(30).
+"""
+
+PROGRAM = """
+       IDENTIFICATION DIVISION.
+       PROGRAM-ID. BILLING.
+       DATA DIVISION.
+       WORKING-STORAGE SECTION.
+       01 INVOICE.
+           05 INV-NO PIC 9(6).
+           05 INV-TOTAL PIC S9(7)V99 COMP-3.
+           05 INV-ODD PIC Q(2).
+       77 WS-COUNT PIC 9(4) COMP.
+       PROCEDURE DIVISION.
+           STOP RUN.
+"""
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small source tree with a copybook, a program and an ignored file."""
+    root = tmp_path / "src"
+    (root / "copy").mkdir(parents=True)
+    (root / "copy" / "CUSTREC.cpy").write_text(COPYBOOK)
+    (root / "BILLING.CBL").write_text(PROGRAM)
+    (root / "README.txt").write_text("not COBOL")
+    return root
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_builds_catalog(tree, workers):
+    """Every record is catalogued with its length, fingerprint and warnings."""
+    catalog = Catalog()
+    stats = catalog.scan(tree, workers=workers)
+    assert sorted(stats.parsed) == ["BILLING.CBL", "copy/CUSTREC.cpy"]
+    assert [(r.source, r.name, r.length) for r in catalog.records()] == [
+        ("BILLING.CBL", "INVOICE", 11),
+        ("BILLING.CBL", "WS-COUNT", 2),
+        ("copy/CUSTREC.cpy", "CUSTOMER-REC", 35),
+    ]
+    (customer,) = catalog.find("customer-rec")
+    record = CobolParser().parse(COPYBOOK)[0]
+    assert customer.fingerprint == compile_layout(record).fingerprint
+    assert catalog.by_fingerprint(customer.fingerprint) == [customer]
+    assert [r.name for r in catalog.with_warnings()] == ["INVOICE"]
+    assert len(catalog) == 3
+
+
+def test_rescan_is_incremental(tree, tmp_path):
+    """Only changed files are parsed; removed files leave the catalog."""
+    path = tmp_path / "catalog.json"
+    scan_repository(tree, path, workers=1)
+    catalog = Catalog.load(path)
+    assert catalog.scan(tree, workers=1).parsed == []
+
+    copybook = tree / "copy" / "CUSTREC.cpy"
+    os.utime(copybook, ns=(0, 0))  # Touched, same content
+    (tree / "BILLING.CBL").write_text(PROGRAM.replace("9(6)", "9(8)"))
+    os.utime(tree / "BILLING.CBL", ns=(1, 1))
+    stats = catalog.scan(tree, workers=1)
+    assert stats.parsed == ["BILLING.CBL"]
+    assert stats.unchanged == ["copy/CUSTREC.cpy"]
+    assert catalog.files["copy/CUSTREC.cpy"].mtime_ns == 0
+    assert catalog.find("INVOICE")[0].length == 13
+
+    copybook.unlink()
+    stats = catalog.scan(tree, workers=1)
+    assert stats.removed == ["copy/CUSTREC.cpy"]
+    assert catalog.find("CUSTOMER-REC") == []
+
+
+def test_rescan_with_other_options_reparses(tree, tmp_path):
+    """Files catalogued with other encodings are parsed again, even if unchanged."""
+    path = tmp_path / "catalog.json"
+    scan_repository(tree, path, workers=1)
+    catalog = scan_repository(tree, path, workers=1, parser_encoding="cp037")
+    (customer,) = catalog.find("CUSTOMER-REC")
+    record = CobolParser(encoding="cp037").parse(COPYBOOK)[0]
+    assert customer.fingerprint == compile_layout(record).fingerprint
+    assert catalog.files["BILLING.CBL"].parser_encoding == "cp037"
+    stats = Catalog.load(path).scan(tree, workers=1, parser_encoding="cp037")
+    assert stats.parsed == [] and len(stats.unchanged) == 2
+
+
+def test_catalog_round_trip_and_errors(tree, tmp_path, monkeypatch):
+    """Saved catalogs load equal; unparsable files are reported."""
+    parse = CobolParser.parse
+
+    def failing_parse(self, source):
+        if "BROKEN" in source:
+            raise ValueError("Nesting too deep")
+        return parse(self, source)
+
+    monkeypatch.setattr(CobolParser, "parse", failing_parse)
+    (tree / "DEEP.cpy").write_text("       01 BROKEN.\n")
+    path = tmp_path / "catalog.json"
+    catalog = scan_repository(tree, path, workers=1)
+    loaded = Catalog.load(path)
+    assert loaded.files == catalog.files
+    assert "DEEP.cpy" in loaded.errors()
+    path.write_text('{"format": 0, "files": []}')
+    assert len(Catalog.load(path).files) == 0
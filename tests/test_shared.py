@@ -0,0 +1,73 @@
+"""Tests for shared-memory decoding."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cobol_data_structure import CobolParser, compile_layout  # noqa: E402
+from cobol_data_structure.shared import (  # noqa: E402
+    SharedColumns,
+    SharedRecords,
+    column_dtype,
+    decode_shared,
+)
+
+
+def numbered(last_data_bytes, count):
+    """LAST-DATA records whose NAME holds their number."""
+    return [f"REC{i}".ljust(10).encode() + last_data_bytes[10:] for i in range(count)]
+
+
+def test_shared_records(tmp_path, last_data_bytes):
+    """Files and buffers are copied into blocks of the exact size."""
+    path = tmp_path / "data.dat"
+    path.write_bytes(last_data_bytes)
+    with SharedRecords.from_file(path) as records:
+        assert bytes(records.buffer) == last_data_bytes
+    with SharedRecords.from_bytes(b"") as records:
+        assert records.size == 0
+
+
+def test_column_dtypes(last_data_record):
+    """Columns get fixed-size dtypes."""
+    plan = compile_layout(last_data_record)
+    dtypes = [column_dtype(*leaf) for leaf in zip(plan.codecs, plan.lengths, plan.params)]
+    assert [d.str for d in dtypes] == ["<U10", "<i8", "<U10", "<f8", "<f8", "<f8", "<i8"]
+
+
+@pytest.mark.parametrize("source", ["path", "bytes", "shared"])
+def test_decode_shared_matches_plan(tmp_path, last_data_record, last_data_bytes, source):
+    """Workers decode into shared columns exactly what the plan decodes."""
+    rows = numbered(last_data_bytes, 11)
+    rows[3] = rows[3][:10] + b"\xff\xff\xff" + rows[3][13:]  # invalid TYPE.CODE
+    data = b"".join(rows)
+    plan = compile_layout(last_data_record)
+    path = tmp_path / "data.dat"
+    path.write_bytes(data)
+    inputs = {"path": path, "bytes": data, "shared": SharedRecords.from_bytes(data)}
+    with decode_shared(plan, inputs[source], workers=2, chunk_records=4) as result:
+        assert result.count == 11
+        for path_name in plan.paths:
+            expected = [plan.decode(row)[path_name] for row in rows]
+            column, valid = result.columns[path_name], result.valid[path_name]
+            assert valid.tolist() == [value is not None for value in expected]
+            assert [v if ok else None for v, ok in zip(column.tolist(), valid)] == expected
+    if source == "shared":
+        inputs["shared"].close()
+
+
+def test_selected_fields_and_text_fallback():
+    """Only requested columns are allocated; undecodable text is invalid."""
+    record = CobolParser().parse("01 R.\n 03 A PIC X(2).\n 03 B PIC 9(2).")[0]
+    with decode_shared(record, b"ok12\xff\xfe34", fields=["A"], workers=1) as result:
+        assert list(result.columns) == ["A"]
+        assert result.columns["A"].tolist()[0] == "ok"
+    record_utf8 = CobolParser(encoding="utf-8").parse("01 R.\n 03 A PIC X(2).")[0]
+    with decode_shared(record_utf8, b"ok\xff\xfe", workers=1) as result:
+        assert result.valid["A"].tolist() == [True, False]
+
+
+def test_shared_columns_empty(last_data_record):
+    """Zero records still allocate a valid block."""
+    with SharedColumns(last_data_record, 0) as columns:
+        assert len(columns.columns["NAME"]) == 0
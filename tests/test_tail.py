@@ -0,0 +1,126 @@
+"""Tests for following logs with tail_moves."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from cobol_data_structure import compile_layout
+from cobol_data_structure.tail import LogFollower, MoveSnapshot, tail_moves
+
+
+def capture_line(payload, target="LAST-DATA", second=0):
+    """A hex MOVE capture log line."""
+    return (
+        f"2024-05-01 10:15:{second:02d}.000 DEBUG MOVE QU01-DATA TO {target} "
+        f"HEX={payload.hex().upper()}\n"
+    ).encode()
+
+
+def test_follower_rotation_and_truncation(tmp_path):
+    """Partial lines wait; rotated files are finished; truncation restarts."""
+    path = tmp_path / "app.log"
+    path.write_bytes(b"old\n")
+    follower = LogFollower(path)
+    assert follower.read_lines() == []
+    with open(path, "ab") as handle:
+        handle.write(b"one\ntw")
+    assert follower.read_lines() == [b"one"]
+    with open(path, "ab") as handle:
+        handle.write(b"o\nunterminated")
+    assert follower.read_lines() == [b"two"]
+    os.rename(path, tmp_path / "app.log.1")
+    assert follower.read_lines() == []
+    path.write_bytes(b"new\n")
+    assert follower.read_lines() == [b"unterminated"]
+    assert follower.read_lines() == [b"new"]
+    with open(path, "r+b") as handle:
+        handle.truncate(0)
+    assert follower.read_lines() == []
+    path.write_bytes(b"again\n")
+    assert follower.read_lines() == [b"again"]
+    follower.close()
+
+
+def test_follower_waits_for_file(tmp_path):
+    """A log created after tailing starts is read from its first line."""
+    path = tmp_path / "late.log"
+    follower = LogFollower(path)
+    assert follower.read_lines() == []
+    path.write_bytes(b"first\n")
+    assert follower.read_lines() == [b"first"]
+    follower.close()
+
+
+def test_tail_moves_decodes_live_captures(tmp_path, last_data_record, last_data_bytes):
+    """Captures appended to a log are decoded with the target's layout."""
+    path = tmp_path / "app.log"
+    path.write_bytes(capture_line(last_data_bytes, second=1))
+    expected = compile_layout(last_data_record).decode(last_data_bytes)
+
+    async def run():
+        snapshots = []
+        async with tail_moves(path, [last_data_record], poll_interval=0.01) as moves:
+            await asyncio.sleep(0.05)
+            with open(path, "ab") as handle:
+                handle.write(capture_line(b"\x01", target="OTHER", second=2))
+                handle.write(capture_line(last_data_bytes[:5], second=3))
+                handle.write(capture_line(last_data_bytes, second=4))
+            async for snapshot in moves:
+                snapshots.append(snapshot)
+                if len(snapshots) == 2:
+                    break
+        return snapshots, moves.warnings
+
+    snapshots, warnings = asyncio.run(asyncio.wait_for(run(), 10))
+    assert [s.capture.timestamp[-6:] for s in snapshots] == ["03.000", "04.000"]
+    assert snapshots[0] == MoveSnapshot(path, snapshots[0].capture, None)
+    assert snapshots[1].values == expected
+    assert "is 5 bytes; record length is 37" in warnings[0].message
+
+
+def test_tail_moves_backpressure_and_executor(tmp_path, last_data_record, last_data_bytes):
+    """A full queue pauses the readers; decoding can use a given executor."""
+    paths = [tmp_path / "a.log", tmp_path / "b.log"]
+    for path in paths:
+        path.write_bytes(b"".join(capture_line(last_data_bytes, second=s) for s in range(10)))
+
+    async def run(executor):
+        moves = tail_moves(
+            paths,
+            {"last-data": last_data_record},
+            from_start=True,
+            poll_interval=0.01,
+            max_queue=2,
+            executor=executor,
+        )
+        first = await moves.__anext__()
+        await asyncio.sleep(0.05)
+        queued = moves._queue.qsize()
+        rest = [await moves.__anext__() for _ in range(19)]
+        await moves.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await moves.__anext__()
+        return [first] + rest, queued
+
+    with ThreadPoolExecutor(1) as executor:
+        snapshots, queued = asyncio.run(asyncio.wait_for(run(executor), 10))
+    assert queued == 2
+    assert sorted(s.path.name for s in snapshots) == ["a.log"] * 10 + ["b.log"] * 10
+    for name in ("a.log", "b.log"):
+        seconds = [s.capture.timestamp for s in snapshots if s.path.name == name]
+        assert seconds == sorted(seconds)
+
+
+def test_tail_moves_reports_errors(tmp_path, last_data_record):
+    """Errors raised while following a file end the iteration."""
+    directory = tmp_path / "not-a-file"
+    directory.mkdir()
+
+    async def run():
+        async for _ in tail_moves(directory, [last_data_record], poll_interval=0.01):
+            pass
+
+    with pytest.raises(IsADirectoryError):
+        asyncio.run(asyncio.wait_for(run(), 10))
@@ -0,0 +1,145 @@
+"""Tests for the DATA DIVISION entry tokenizer."""
+
+from cobol_data_structure import CobolParser, LineTokenizer
+
+
+def test_tokenize_level_88():
+    """Level 88 condition names should return None."""
+    assert LineTokenizer().tokenize("88  STATUS-ACTIVE VALUE 'A'.") is None
+
+
+def test_tokenize_level_66_warns():
+    """Level 66 RENAMES is skipped with a warning."""
+    tokenizer = LineTokenizer()
+    assert tokenizer.tokenize("66  ALIAS RENAMES A THRU B.", line_number=7) is None
+    assert tokenizer.warnings[0].line_number == 7
+
+
+def test_tokenize_level_77():
+    """Level 77 independent items should be parsed."""
+    token = LineTokenizer().tokenize("77  WS-COUNTER PIC 9(5) COMP.")
+    assert token["level"] == 77
+    assert token["name"] == "WS-COUNTER"
+    assert token["picture"] == "9(5)"
+    assert token["usage"] == "COMP"
+
+
+def test_tokenize_value_clause():
+    """VALUE clauses should be extracted."""
+    token = LineTokenizer().tokenize("05  MAX-ITEMS PIC 9(5) VALUE 99999.")
+    assert token["value"] == "99999"
+    assert token["picture"] == "9(5)"
+
+
+def test_tokenize_literal_does_not_leak_clauses():
+    """Keywords inside a VALUE literal are not clauses."""
+    token = LineTokenizer().tokenize("05  MSG PIC X(20) VALUE 'OCCURS 5 COMP-3'.")
+    assert "occurs" not in token
+    assert "usage" not in token
+
+
+def test_tokenize_sign_separate():
+    """SIGN LEADING SEPARATE should be detected."""
+    token = LineTokenizer().tokenize("05  AMOUNT PIC S9(7)V99 SIGN LEADING SEPARATE.")
+    assert token["sign_separate"]
+    assert token["sign_leading"]
+
+
+def test_tokenize_occurs_depending_on():
+    """OCCURS ... DEPENDING ON fills the ODO keys."""
+    token = LineTokenizer().tokenize("05  ITEMS OCCURS 1 TO 100 TIMES DEPENDING ON ITEM-COUNT.")
+    assert token["occurs"] is None
+    assert token["occurs_min"] == 1
+    assert token["occurs_max"] == 100
+    assert token["occurs_depending_on"] == "ITEM-COUNT"
+
+
+def test_tokenize_hyphenated_names_are_not_keywords():
+    """Names containing keywords do not trigger clauses."""
+    token = LineTokenizer().tokenize("05  WS-SYNC REDEFINES COMP-LEADING PIC X.")
+    assert token["redefines"] == "COMP-LEADING"
+    assert not token["synchronized"]
+    assert not token["sign_leading"]
+    assert "usage" not in token
+
+
+def test_tokenize_unnamed_item_is_filler():
+    """An item without a name is a FILLER."""
+    token = LineTokenizer().tokenize("05  PIC X(3).")
+    assert token["name"] == "FILLER"
+    assert token["picture"] == "X(3)"
+
+
+def test_remove_comments_fixed_format():
+    """Sequence, indicator and identification areas are removed."""
+    assert LineTokenizer.remove_comments("000100*COMMENT LINE") == ""
+    line = "000200     05  NAME PIC X(10).".ljust(72) + "IDENT001"
+    assert LineTokenizer.remove_comments(line).strip() == "05  NAME PIC X(10)."
+
+
+def test_remove_comments_free_format():
+    """Free-format inline comments are removed."""
+    assert LineTokenizer.remove_comments("    03 A PIC X. *> note") == "    03 A PIC X. "
+
+
+SCAN_SOURCE = """
+WORKING-STORAGE SECTION.
+01 REC.
+    05 NAME PIC X(10) VALUE 'OCCURS 5. COMP-3'.
+    05 PIC X(3).
+    05 AMOUNT PICTURE IS S9(5)V99 USAGE IS PACKED-DECIMAL.
+    05 EDITED PIC ZZ,ZZ9.99.
+    05 N PIC S9(3) SIGN IS LEADING SEPARATE.
+    05 CNT PIC 99 COMP SYNC.
+    05 ITEMS OCCURS 1 TO 10 TIMES DEPENDING ON CNT.
+        10 ITEM PIC X JUSTIFIED RIGHT.
+    05 ALT REDEFINES AMOUNT PIC X(4).
+    05 GREETING PIC X(20)
+        VALUE "IT'S"
+        .
+    66 ALIAS RENAMES NAME.
+    00 BAD.
+    88 FLAG VALUE 'Y' 'N'
+        'Z'.
+77 COUNTER PIC 9(4) COMP-5.
+"""
+
+
+def test_scan_matches_tokenize():
+    """The single-pass scanner yields the tokens of the per-entry path."""
+    parser = CobolParser()
+    lines = parser.data_lines(SCAN_SOURCE)
+    expected_tokenizer = LineTokenizer()
+    expected = []
+    for line_number, text in parser._join_entries(lines):
+        token = expected_tokenizer.tokenize(text, line_number=line_number)
+        if token:
+            expected.append((line_number, token))
+
+    tokenizer = LineTokenizer()
+    assert tokenizer.scan(lines) == expected
+    assert [(w.line_number, w.message) for w in tokenizer.warnings] == [
+        (w.line_number, w.message) for w in expected_tokenizer.warnings
+    ]
+
+
+def test_scan_clauses():
+    """Clauses spread over lines and literals containing periods are scanned."""
+    lines = list(enumerate(SCAN_SOURCE.splitlines(), start=1))
+    scanned = LineTokenizer().scan(lines)
+    tokens = {token["name"]: token for _, token in scanned}
+    assert tokens["NAME"]["value"] == "'OCCURS 5. COMP-3'"
+    assert "occurs" not in tokens["NAME"]
+    assert tokens["GREETING"]["value"] == '"IT\'S"'
+    assert (13, tokens["GREETING"]) in scanned
+    assert tokens["EDITED"]["picture"] == "ZZ,ZZ9.99"
+    assert tokens["ITEMS"]["occurs_depending_on"] == "CNT"
+    assert tokens["COUNTER"]["usage"] == "COMP-5"
+    assert "FLAG" not in tokens and "ALIAS" not in tokens
+
+
+def test_scan_entry_without_period():
+    """An unterminated last entry is still scanned."""
+    tokens = LineTokenizer().scan([(1, "01 REC."), (2, "05 A PIC X")])
+    assert [token["name"] for _, token in tokens] == ["REC", "A"]
+    assert tokens[1][1]["picture"] == "X"
@@ -0,0 +1,61 @@
+"""Tests for lazy record views."""
+
+import pytest
+
+from cobol_data_structure import BinaryDataParser, RecordView, compile_layout
+
+
+@pytest.fixture
+def view(last_data_record, last_data_bytes):
+    """View of the sample LAST-DATA record."""
+    return RecordView(compile_layout(last_data_record), last_data_bytes)
+
+
+def test_access_styles_agree(view, last_data_record, last_data_bytes):
+    """Item, dotted path and attribute access return the parsed values."""
+    nested = BinaryDataParser().parse(last_data_record, last_data_bytes)
+    assert view["NAME"] == view.NAME == nested["NAME"]
+    assert view["TYPE.CODE"] == view["TYPE"]["CODE"] == view.TYPE.CODE == nested["TYPE"]["CODE"]
+    assert view["MONTH-DATA(3).SALES"] == view.MONTH_DATA[2].SALES
+    assert [m.SALES for m in view["MONTH-DATA"]] == [m["SALES"] for m in nested["MONTH-DATA"]]
+
+
+def test_decodes_lazily_and_caches(view):
+    """Only accessed leaves are decoded, once each, in a cache shared by sub-views."""
+    assert view._cache == {}
+    code = view.TYPE.CODE
+    assert view._cache == {1: code}
+    view._buf = memoryview(bytes(len(view._buf)))
+    assert view["TYPE.CODE"] == code
+
+
+def test_zero_copy(last_data_record, last_data_bytes):
+    """The view reads through to the underlying buffer."""
+    data = bytearray(last_data_bytes)
+    view = RecordView(last_data_record, data)
+    data[0:4] = b"ZED "
+    assert view.NAME.startswith("ZED")
+
+
+def test_missing_fields(view):
+    """Unknown paths raise KeyError / AttributeError."""
+    with pytest.raises(KeyError):
+        view["TYPE.NOPE"]
+    with pytest.raises(AttributeError):
+        _ = view.NOPE
+    assert view.get("NOPE", 0) == 0
+    assert "TYPE.DESC" in view and "MONTH-DATA" in view and "NOPE" not in view
+
+
+def test_keys_and_to_dict(view, last_data_record, last_data_bytes):
+    """Views list their direct fields and can decode everything at once."""
+    assert list(view) == ["NAME", "TYPE", "MONTH-DATA", "COUNTER"]
+    assert view.TYPE.keys() == ["CODE", "DESC"]
+    assert view.to_dict() == compile_layout(last_data_record).decode(last_data_bytes)
+    assert view.MONTH_DATA[0].to_dict() == {"SALES": view["MONTH-DATA(1).SALES"]}
+
+
+def test_short_data(last_data_record):
+    """Views refuse buffers shorter than the record."""
+    with pytest.raises(ValueError, match="less than expected"):
+        RecordView(last_data_record, b"\x00" * 5)
@@ -0,0 +1,151 @@
+"""Tests for the zoned-decimal codec."""
+
+import pytest
+
+from cobol_data_structure import BinaryDataParser, CobolParser, compile_layout
+from cobol_data_structure.codegen import compile_decoder
+from cobol_data_structure.layout import CODEC_OVERPUNCH, CODEC_ZONED
+from cobol_data_structure.zoned import (
+    ASCII,
+    EBCDIC,
+    EBCDIC_SEPARATE,
+    decode_zoned_column,
+    encode_zoned,
+    is_ebcdic,
+    unpack_zoned,
+)
+
+EBCDIC_COLUMN = [
+    bytes.fromhex("f1f2c3"),  # +123
+    bytes.fromhex("f1f2d3"),  # -123
+    bytes.fromhex("f1f2f3"),  # unsigned 123
+    bytes.fromhex("f1c2c3"),  # sign zone on a non-sign digit
+    bytes.fromhex("f1f240"),  # space in the sign position
+]
+
+
+@pytest.mark.parametrize(
+    "data, table, sign_leading, expected",
+    [
+        (bytes.fromhex("f0f4d2"), EBCDIC, False, -42),
+        (bytes.fromhex("b4f2f0"), EBCDIC, True, -420),
+        (bytes.fromhex("a1"), EBCDIC, False, 1),
+        (b"12}", ASCII, False, -120),
+        (b"12C", ASCII, False, 123),
+        (b"J23", ASCII, True, -123),
+        (b"12y", ASCII, False, -129),
+        (b"123", ASCII, False, 123),
+        (bytes.fromhex("f1f2f360"), EBCDIC_SEPARATE, False, -123),
+        (bytes.fromhex("4ef1f2f3"), EBCDIC_SEPARATE, True, 123),
+    ],
+)
+def test_unpack_zoned(data, table, sign_leading, expected):
+    """Overpunched signs in both conventions and positions."""
+    assert unpack_zoned(data, table, sign_leading) == expected
+    assert unpack_zoned(memoryview(data), table, sign_leading) == expected
+
+
+@pytest.mark.parametrize("data", [b"-12", b" 12", b"1_2", b"1 2", b"12-"])
+def test_unpack_zoned_rejects_text_signs(data):
+    """Spaces, underscores and explicit signs are not digits."""
+    with pytest.raises(ValueError):
+        unpack_zoned(data, ASCII)
+
+
+def test_decode_zoned_column():
+    """Invalid rows become None; unsigned columns reject negatives."""
+    assert decode_zoned_column(EBCDIC_COLUMN, EBCDIC, True, 1) == [12.3, -12.3, 12.3, None, None]
+    assert decode_zoned_column(EBCDIC_COLUMN[:3], EBCDIC, is_signed=False) == [123, None, 123]
+
+
+@pytest.mark.parametrize("value", [0, 7, -7, 120, -999])
+@pytest.mark.parametrize("table", [EBCDIC, ASCII, EBCDIC_SEPARATE])
+@pytest.mark.parametrize("sign_leading", [False, True])
+def test_encode_round_trip(value, table, sign_leading):
+    """Encoded values decode back to themselves."""
+    data = encode_zoned(value, 4, table=table, sign_leading=sign_leading)
+    assert len(data) == 4
+    assert unpack_zoned(data, table, sign_leading) == value
+
+
+def test_encode_zoned():
+    """Encoding uses C/D zones for signed and F for unsigned EBCDIC fields."""
+    assert encode_zoned(-1.5, 3, 1).hex() == "f0f1d5"
+    assert encode_zoned(15, 3, signed=False).hex() == "f0f1f5"
+    assert encode_zoned(-120, 3, table=ASCII) == b"12}"
+    with pytest.raises(ValueError, match="does not fit"):
+        encode_zoned(1000, 3)
+
+
+def test_is_ebcdic():
+    """EBCDIC code pages are recognised by where their digits live."""
+    assert is_ebcdic("cp037") and is_ebcdic("cp500") and is_ebcdic("cp1140")
+    assert not is_ebcdic("cp1252") and not is_ebcdic("no-such-codec")
+
+
+def test_layout_selects_overpunch():
+    """Signed ASCII and all EBCDIC DISPLAY numerics use the overpunch codec."""
+    source = """
+        01 R.
+           03 A PIC S9(3).
+           03 B PIC 9(3).
+           03 C PIC S9(3) SIGN LEADING SEPARATE.
+    """
+    ascii_plan = compile_layout(CobolParser().parse(source)[0])
+    assert ascii_plan.codecs == (CODEC_OVERPUNCH, CODEC_ZONED, CODEC_ZONED)
+    assert ascii_plan.params[0] == ("ascii", True, 0, False)
+    ebcdic_plan = compile_layout(CobolParser(encoding="cp037").parse(source)[0])
+    assert ebcdic_plan.codecs == (CODEC_OVERPUNCH,) * 3
+    assert ebcdic_plan.params[2] == ("ebcdic-separate", True, 0, True)
+
+
+def test_ebcdic_record_decoders_agree():
+    """Tree walker, plan and generated decoder decode overpunch identically."""
+    source = """
+        01 R.
+           03 AMOUNT PIC S9(3)V99.
+           03 COUNT PIC 9(3).
+           03 LEAD PIC S9(3) SIGN LEADING.
+    """
+    record = CobolParser(encoding="cp037").parse(source)[0]
+    data = bytes.fromhex("f1f2f3f4d5" "f0f4f2" "d1f2f3")
+    expected = {"AMOUNT": -123.45, "COUNT": 42, "LEAD": -123}
+    plan = compile_layout(record)
+    assert plan.decode(data) == expected
+    assert compile_decoder(plan)(data) == expected
+    assert BinaryDataParser().parse(record, data) == expected
+
+
+def test_ebcdic_sign_separate():
+    """EBCDIC SIGN SEPARATE fields read EBCDIC digits and a + (0x4E) or - (0x60) byte."""
+    source = """
+        01 R.
+           03 TRAIL PIC S9(3) SIGN TRAILING SEPARATE.
+           03 LEAD PIC S9(3)V9 SIGN LEADING SEPARATE.
+    """
+    record = CobolParser(encoding="cp037").parse(source)[0]
+    data = "123-+4567".encode("cp037")
+    expected = {"TRAIL": -123, "LEAD": 456.7}
+    plan = compile_layout(record)
+    assert plan.decode(data) == expected
+    assert compile_decoder(plan)(data) == expected
+    assert BinaryDataParser().parse(record, data) == expected
+    assert plan.decode("123 +4567".encode("cp037"))["TRAIL"] is None
+
+
+def test_array_path_matches_python():
+    """The NumPy decoder agrees with the pure-Python column decoder."""
+    np = pytest.importorskip("numpy")
+    from cobol_data_structure.zoned import decode_zoned_array
+
+    matrix = np.frombuffer(b"".join(EBCDIC_COLUMN), np.uint8).reshape(-1, 3)
+    expected = decode_zoned_column(EBCDIC_COLUMN, EBCDIC, True, 1)
+    assert decode_zoned_array(matrix, EBCDIC, True, 1).tolist() == expected
+    leading = np.frombuffer(b"J23123", np.uint8).reshape(2, 3)
+    assert decode_zoned_array(leading, ASCII, sign_leading=True).tolist() == [-123, 123]
+    unsigned = decode_zoned_array(matrix[:3], EBCDIC, is_signed=False).tolist()
+    assert unsigned == [123, None, 123]
+    separate = np.frombuffer("123-+456123 ".encode("cp037"), np.uint8).reshape(3, 4)
+    assert decode_zoned_array(separate[:2], EBCDIC_SEPARATE).tolist() == [-123, None]
+    assert decode_zoned_array(separate[1:2], EBCDIC_SEPARATE, sign_leading=True).tolist() == [456]
+    assert decode_zoned_array(separate[2:], EBCDIC_SEPARATE).tolist() == [None]